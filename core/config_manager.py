@@ -10,7 +10,7 @@ from pathlib import Path
 
 import yaml
 
-from core.path_utils import convert_paths_in_dict, get_openbench_root, to_absolute_path
+from core.path_utils import convert_paths_in_dict, get_openbench_root, to_absolute_path, write_in_dir
 
 
 class ConfigManager:
@@ -227,7 +227,7 @@ class ConfigManager:
         if openbench_root is None:
             openbench_root = get_openbench_root()
         if not is_remote:
-            ref_data = convert_paths_in_dict(ref_data, openbench_root)
+            ref_data = convert_paths_in_dict(ref_data, openbench_root, inplace=True)
 
         # Update def_nml paths to point to local copies
         if output_dir:
@@ -278,7 +278,7 @@ class ConfigManager:
         if openbench_root is None:
             openbench_root = get_openbench_root()
         if not is_remote:
-            sim_data = convert_paths_in_dict(sim_data, openbench_root)
+            sim_data = convert_paths_in_dict(sim_data, openbench_root, inplace=True)
 
         # Update def_nml paths to point to local copies
         if output_dir:
@@ -831,14 +831,8 @@ class ConfigManager:
             filtered["general"] = general
 
         # Keep only selected evaluation items (with type validation)
-        for item in selected_items:
-            if item in content:
-                item_data = content[item]
-                if isinstance(item_data, dict):
-                    # sub_dir doesn't need path conversion (it's relative to root_dir)
-                    filtered[item] = item_data.copy()
-                elif item_data is not None:
-                    filtered[item] = item_data
+        # sub_dir doesn't need path conversion (it's relative to root_dir)
+        filtered.update(self._filter_selected_items(content, selected_items))
 
         # Write filtered content
         os.makedirs(os.path.dirname(dest_path), exist_ok=True)
@@ -854,6 +848,34 @@ class ConfigManager:
 
         return model_path
 
+    @staticmethod
+    def _filter_selected_items(
+        content: Dict[str, Any],
+        selected_items: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Pick the selected evaluation items out of a loaded YAML mapping.
+
+        Items missing from ``content`` or set to ``None`` are skipped. Dict
+        sections are shallow-copied so that sections sharing a YAML anchor
+        in the source are still written out in full.
+
+        Args:
+            content: Loaded YAML content
+            selected_items: List of selected evaluation items (order preserved)
+
+        Returns:
+            Mapping of item name to item data
+        """
+        wanted = content.keys() & set(selected_items)
+        if not wanted:
+            return {}
+        return {
+            item: data.copy() if isinstance(data, dict) else data
+            for item in selected_items
+            if item in wanted and (data := content[item]) is not None
+        }
+
     def _copy_model_definition(
         self,
         src_path: str,
@@ -884,25 +906,21 @@ class ConfigManager:
             filtered["general"] = content["general"].copy()
 
         # Keep only selected evaluation items (with type validation)
-        for item in selected_items:
-            if item in content:
-                item_data = content[item]
-                if isinstance(item_data, dict):
-                    filtered[item] = item_data.copy()
-                elif item_data is not None:
-                    filtered[item] = item_data
+        filtered.update(self._filter_selected_items(content, selected_items))
 
         # Write filtered content
-        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-        with open(dest_path, 'w', encoding='utf-8') as f:
-            yaml.dump(
-                filtered,
-                f,
-                default_flow_style=False,
-                allow_unicode=True,
-                sort_keys=False,
-                indent=2
-            )
+        def write():
+            with open(dest_path, 'w', encoding='utf-8') as f:
+                yaml.dump(
+                    filtered,
+                    f,
+                    default_flow_style=False,
+                    allow_unicode=True,
+                    sort_keys=False,
+                    indent=2
+                )
+
+        write_in_dir(os.path.dirname(dest_path), write)
 
     def _resolve_model_path(self, model_path: str) -> Optional[str]:
         """
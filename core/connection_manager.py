@@ -23,6 +23,8 @@ from pathlib import Path
 
 import yaml
 
+from core.path_utils import write_in_dir
+
 
 class ConnectionManager:
     """Manages saved SSH connection profiles."""
@@ -55,14 +57,13 @@ class ConnectionManager:
 
     def _save(self):
         """Save connections to file."""
-        # Ensure directory exists
-        dir_path = os.path.dirname(self._config_path)
-        if dir_path:
-            os.makedirs(dir_path, exist_ok=True)
-
         data = {"connections": self._connections}
-        with open(self._config_path, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+
+        def write():
+            with open(self._config_path, 'w', encoding='utf-8') as f:
+                yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+
+        write_in_dir(os.path.dirname(self._config_path), write)
 
     def list_connections(self) -> List[Dict[str, Any]]:
         """Get list of saved connections."""
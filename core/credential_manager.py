@@ -18,6 +18,8 @@ from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import base64
 
+from core.path_utils import write_in_dir
+
 logger = logging.getLogger(__name__)
 
 
@@ -139,9 +141,11 @@ class CredentialManager:
         Args:
             data: Credentials dictionary
         """
-        os.makedirs(self._config_dir, exist_ok=True)
-        with open(self._credentials_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        def write():
+            with open(self._credentials_path, 'w') as f:
+                json.dump(data, f, indent=2)
+
+        write_in_dir(self._config_dir, write)
         # Set file permissions to 600 (user only)
         os.chmod(self._credentials_path, 0o600)
 
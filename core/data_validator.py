@@ -6,12 +6,121 @@ Validates file existence, variable names, time range, and spatial range.
 Supports both local and remote (SSH) validation.
 """
 
+import glob
+import hashlib
 import json
 import os
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+import re
+import shlex
+import threading
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Optional, Dict, Any, Sequence, Set, Tuple
+
+from core.path_utils import to_absolute_path, get_openbench_root, quote_remote_path
+from core.validation_cache import ValidationCache
+
+# Optional scientific stack, imported once at module load so the first
+# validation does not pay for it mid-run
+try:
+    import numpy as np
+    import xarray as xr
+    _HAS_XARRAY = True
+except ImportError:
+    np = xr = None
+    _HAS_XARRAY = False
+
+try:
+    import netCDF4
+    _HAS_NETCDF4 = True
+except ImportError:
+    netCDF4 = None
+    _HAS_NETCDF4 = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import h5py
+    _HAS_H5PY = True
+except ImportError:
+    h5py = None
+    _HAS_H5PY = False
+
+# netCDF-C is not thread-safe and netCDF4-python releases the GIL, so raw
+# netCDF4 handles are only used under this lock
+_NETCDF4_LOCK = threading.RLock()
+
+# First bytes of an HDF5 file, i.e. a NetCDF4 (not classic) file
+HDF5_MAGIC = b"\x89HDF\r\n\x1a\n"
+
+# netCDF-4 markers for HDF5 datasets that are dimensions, not variables
+_H5_PURE_DIM = b"This is a netCDF dimension but not a netCDF variable"
+_H5_NON_COORD_PREFIX = "_nc4_non_coord_"
+
+# CF time units decoded without xarray: "<unit> since <Y-M-D[ h:m[:s]]>[Z]"
+_CF_UNITS_RE = re.compile(
+    r"\s*(\w+)\s+since\s+(\d{1,4})-(\d{1,2})-(\d{1,2})"
+    r"(?:[ T](\d{1,2}):(\d{1,2})(?::(\d{1,2}(?:\.\d*)?))?)?"
+    r"\s*(?:Z|UTC|[+-]00:?00)?\s*"
+)
+_CF_UNIT_SECONDS = {
+    "days": 86400, "day": 86400, "d": 86400,
+    "hours": 3600, "hour": 3600, "hrs": 3600, "hr": 3600, "h": 3600,
+    "minutes": 60, "minute": 60, "mins": 60, "min": 60,
+    "seconds": 1, "second": 1, "secs": 1, "sec": 1, "s": 1,
+}
+# Calendars matching Python's (proleptic Gregorian) datetime; "standard"
+# only from the 1582 Gregorian reform on
+_GREGORIAN_CALENDARS = frozenset(["standard", "gregorian", "proleptic_gregorian"])
+
+
+# Common dimension names, in lookup priority order
+TIME_DIMS = ('time', 'Time', 'TIME', 't', 'date')
+LAT_DIMS = ('lat', 'latitude', 'Lat', 'LAT', 'y')
+LON_DIMS = ('lon', 'longitude', 'Lon', 'LON', 'x')
+
+
+_backends_warmed = False
+_backends_lock = threading.Lock()
+
+
+def warm_up_backends():
+    """Run xarray's backend entry-point discovery in a background thread.
+
+    The first open_dataset() call scans installed packages for backends,
+    which can take seconds; doing it early hides that behind UI setup.
+    Only the first call starts a thread.
+    """
+    global _backends_warmed
+    if not _HAS_XARRAY:
+        return
+    with _backends_lock:
+        if _backends_warmed:
+            return
+        _backends_warmed = True
+
+    def _discover():
+        try:
+            xr.backends.list_engines()
+        except Exception:
+            pass
+
+    threading.Thread(target=_discover, name="xarray-backends", daemon=True).start()
+
 
-from core.path_utils import to_absolute_path, get_openbench_root
+def _require_xarray():
+    """Raise ImportError if xarray is not installed."""
+    if not _HAS_XARRAY:
+        raise ImportError("xarray required: pip install xarray netCDF4")
 
 
 def safe_open(path: str):
@@ -23,14 +132,302 @@ def safe_open(path: str):
     Returns:
         xarray.Dataset
     """
-    import xarray as xr
+    _require_xarray()
     try:
         return xr.open_dataset(path)
     except Exception:
         return xr.open_dataset(path, decode_times=False)
 
 
-# String version of safe_open for embedding in remote scripts
+def open_raw(path: str):
+    """Open an xarray dataset for metadata reads only.
+
+    Skips time decoding, masking, scaling and default index construction,
+    which dominate open time; callers decode the few values they need
+    themselves. The "coordinates" attribute is still honoured, so 2-D
+    lat/lon of curvilinear grids are coordinates, not data variables.
+
+    Args:
+        path: Path to NetCDF file
+
+    Returns:
+        xarray.Dataset
+    """
+    _require_xarray()
+    kwargs = dict(
+        decode_times=False, decode_timedelta=False, mask_and_scale=False,
+        decode_coords=True
+    )
+    try:
+        return xr.open_dataset(path, create_default_indexes=False, **kwargs)
+    except TypeError:
+        # xarray older than 2025.x has no create_default_indexes
+        return xr.open_dataset(path, **kwargs)
+
+
+def _decode_years(values, units: Optional[str], calendar: str) -> Optional[Tuple[int, int]]:
+    """Decode the (min, max) years of raw or already decoded time values.
+
+    Args:
+        values: Time coordinate values
+        units: CF units attribute (e.g. "days since 2000-01-01"), if any
+        calendar: CF calendar attribute
+
+    Returns:
+        Year range, or None if the values are on a non-standard calendar
+        that cannot be decoded
+
+    Raises:
+        ValueError: If the values have no units, or their units cannot be
+            decoded on a standard calendar
+    """
+    bounds = np.asarray(_time_bounds(values))
+    if bounds.dtype.kind != "M":
+        if not units:
+            raise ValueError("time variable has no units attribute")
+        years = _gregorian_years(bounds, units, calendar)
+        if years is not None:
+            return years
+        # Decode just the two bounds through xarray's CF decoder
+        try:
+            ends = xr.Dataset({"t": ("t", bounds, {"units": units, "calendar": calendar})})
+            bounds = xr.decode_cf(ends)["t"].values
+        except Exception:
+            if _is_standard_calendar(calendar):
+                raise
+            return None
+    return _years_of(bounds)
+
+
+def _is_standard_calendar(calendar: Optional[str]) -> bool:
+    """Return True for the Gregorian CF calendars (the default when unset)."""
+    return (calendar or "standard").lower() in _GREGORIAN_CALENDARS
+
+
+def _gregorian_years(bounds, units: str, calendar: str) -> Optional[Tuple[int, int]]:
+    """Decode the years of two raw time values with the standard library.
+
+    Building a Dataset for xr.decode_cf costs milliseconds per file; plain
+    "<unit> since <date>" units on Gregorian calendars need only datetime.
+
+    Returns:
+        Year range, or None if the units or calendar need the CF decoder
+    """
+    calendar = (calendar or "standard").lower()
+    match = _CF_UNITS_RE.fullmatch(units)
+    if calendar not in _GREGORIAN_CALENDARS or match is None:
+        return None
+    factor = _CF_UNIT_SECONDS.get(match.group(1).lower())
+    if factor is None:
+        return None
+    year, month, day, hour, minute = (int(g or 0) for g in match.groups()[1:6])
+    try:
+        ref = datetime(year, month, day, hour, minute) + timedelta(
+            seconds=float(match.group(7) or 0)
+        )
+        first, last = (ref + timedelta(seconds=float(v) * factor) for v in bounds[[0, -1]])
+    except (ValueError, OverflowError):
+        # NaN values, invalid dates or results outside datetime's range
+        return None
+    if calendar != "proleptic_gregorian" and min(ref, first, last) < datetime(1582, 10, 15):
+        return None
+    return first.year, last.year
+
+
+def _years_of(values) -> Optional[Tuple[int, int]]:
+    """Get the years of two decoded time values (datetime64 or cftime).
+
+    Returns:
+        Tuple of years, or None if the values are not dates
+    """
+    if values.dtype.kind == "M":
+        # datetime64 -> years since 1970 without building pandas objects
+        years = values.astype("datetime64[Y]").astype(int) + 1970
+        return int(years[0]), int(years[-1])
+    try:
+        return int(values[0].year), int(values[-1].year)
+    except AttributeError:
+        return None
+
+
+def _parse_json(line: str) -> Any:
+    """Parse one JSON document, with orjson when it is installed.
+
+    Falls back to json for what orjson rejects (e.g. NaN, which Python's
+    json module emits).
+
+    Raises:
+        ValueError: If the line is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except ValueError:
+            pass
+    return json.loads(line)
+
+
+def _is_netcdf4_dataset(ds) -> bool:
+    """Return True if ds is a raw netCDF4.Dataset handle (not xarray)."""
+    return _HAS_NETCDF4 and isinstance(ds, netCDF4.Dataset)
+
+
+def _is_h5py_file(ds) -> bool:
+    """Return True if ds is an h5py.File handle."""
+    return _HAS_H5PY and isinstance(ds, h5py.File)
+
+
+def _path_exists(path: str) -> bool:
+    """Return True if path exists, using a single os.stat call.
+
+    Symlinks are followed: a dangling link cannot be opened, so it counts
+    as missing.
+    """
+    try:
+        os.stat(path)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def _is_hdf5_file(path: str) -> bool:
+    """Return True if the file starts with the HDF5 signature.
+
+    Uses read1() so only the first raw chunk is read, not a full buffer.
+    """
+    try:
+        with open(path, "rb") as fh:
+            return fh.read1(8) == HDF5_MAGIC
+    except OSError:
+        return False
+
+
+def _h5_attr(obj, name: str, default: Optional[str] = None) -> Optional[str]:
+    """Read a string attribute of an h5py object, decoding bytes."""
+    value = obj.attrs.get(name)
+    if value is None:
+        return default
+    if isinstance(value, np.ndarray):
+        value = value.item() if value.size == 1 else value
+    if isinstance(value, bytes):
+        return value.decode("utf-8", "replace")
+    return str(value)
+
+
+def _h5_datasets(f) -> Dict[str, Any]:
+    """Map netCDF variable names to the root-group datasets of an h5py file.
+
+    Datasets that only define a dimension (no values) are skipped.
+    """
+    datasets = {}
+    for name, obj in f.items():
+        if not isinstance(obj, h5py.Dataset):
+            continue
+        label = obj.attrs.get("NAME")
+        if isinstance(label, bytes) and label.startswith(_H5_PURE_DIM):
+            continue
+        datasets[name.removeprefix(_H5_NON_COORD_PREFIX)] = obj
+    return datasets
+
+
+def _loaded(values):
+    """Load a slice of a lazy xarray Variable; other arrays pass through."""
+    return getattr(values, "values", values)
+
+
+def _unpack(values, attrs):
+    """Mask fill values and apply scale_factor/add_offset to raw values.
+
+    h5py and the undecoded xarray fallback return values as stored; this
+    matches what netCDF4 and xarray's default decoding would return, with
+    _FillValue and missing_value as NaN.
+
+    Args:
+        values: Loaded values
+        attrs: The variable's attributes, or None
+
+    Returns:
+        Decoded float values, or values unchanged if there is nothing to apply
+    """
+    if attrs is None:
+        return values
+    fills = [np.ravel(attrs[name]) for name in ("_FillValue", "missing_value") if name in attrs]
+    scale = attrs.get("scale_factor")
+    offset = attrs.get("add_offset")
+    if not fills and scale is None and offset is None:
+        return values
+    raw = np.asarray(values)
+    if raw.dtype.kind not in "iuf":
+        return values
+    decoded = raw.astype(np.float64)
+    for fill in fills:
+        decoded[np.isin(raw, fill)] = np.nan
+    if scale is not None:
+        decoded *= float(np.ravel(scale)[0])
+    if offset is not None:
+        decoded += float(np.ravel(offset)[0])
+    return decoded
+
+
+def _coord_bounds(values) -> Tuple[Any, Any]:
+    """Get (min, max) of a lat/lon coordinate.
+
+    The whole coordinate is read. A 1-D axis that is monotonic over its
+    full length gives its end values; anything else (a wrapped 0..179,
+    -180..-1 longitude, curvilinear grids) uses a min/max that ignores NaN
+    and masked fill.
+
+    Args:
+        values: Coordinate array or lazy variable; packing attributes of
+                h5py and xarray variables are applied
+
+    Returns:
+        Tuple of (min, max)
+    """
+    values = _unpack(_loaded(values[:]), getattr(values, "attrs", None))
+    if values.ndim == 1 and values.shape[0] > 1 and not np.ma.is_masked(values):
+        steps = np.diff(np.ma.getdata(values))
+        if np.all(steps >= 0) or np.all(steps <= 0):
+            first, last = values[0], values[-1]
+            return (first, last) if first <= last else (last, first)
+    return _full_bounds(values)
+
+
+def _full_bounds(values) -> Tuple[Any, Any]:
+    """Get (min, max) of loaded values, ignoring NaN and masked fill."""
+    if values.dtype.kind == "f" and not isinstance(values, np.ma.MaskedArray):
+        # Unmasked fill values (e.g. outside a curvilinear grid) are NaN
+        return np.nanmin(values), np.nanmax(values)
+    return values.min(), values.max()
+
+
+def _time_bounds(values) -> Tuple[Any, Any]:
+    """Get (min, max) of a time coordinate, reading only its ends when monotonic.
+
+    Works on anything with numpy-style ``shape`` and slicing, including lazy
+    netCDF4/h5py variables and lazily indexed xarray Variables, so a long
+    time axis costs four element reads instead of a full read. Time axes
+    are stored in order, so the ends are trusted when both end pairs step
+    the same way; otherwise, or for short axes, the full min/max is used.
+
+    Args:
+        values: 1-D time array or lazy variable; packing attributes of
+                h5py and xarray variables are applied
+
+    Returns:
+        Tuple of (min, max)
+    """
+    attrs = getattr(values, "attrs", None)
+    if len(values.shape) == 1 and values.shape[0] > 4:
+        head = _unpack(_loaded(values[:2]), attrs)
+        tail = _unpack(_loaded(values[-2:]), attrs)
+        if (head[0] <= head[1] and tail[0] <= tail[1]) or (head[0] >= head[1] and tail[0] >= tail[1]):
+            first, last = head[0], tail[-1]
+            return (first, last) if first <= last else (last, first)
+    return _full_bounds(_unpack(_loaded(values[:]), attrs))
+
+
+# String version of safe_open, embedded in RemoteNetCDFValidator.INSPECT_SCRIPT
 SAFE_OPEN_CODE = '''
 def safe_open(path):
     """Open dataset, trying decode_times=False if default fails."""
@@ -41,7 +438,7 @@ def safe_open(path):
 '''
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationCheck:
     """Single validation check result."""
     name: str
@@ -49,7 +446,7 @@ class ValidationCheck:
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceValidationResult:
     """Validation result for a single data source."""
     var_name: str
@@ -67,7 +464,7 @@ class SourceValidationResult:
         return [check for check in self.checks if not check.passed]
 
 
-@dataclass
+@dataclass(slots=True)
 class DataValidationReport:
     """Complete validation report for all sources."""
     results: List[SourceValidationResult] = field(default_factory=list)
@@ -80,12 +477,149 @@ class DataValidationReport:
     @property
     def passed_count(self) -> int:
         """Number of sources that passed all checks."""
-        return sum(1 for r in self.results if r.is_valid)
+        return sum(map(attrgetter("is_valid"), self.results))
 
     @property
     def failed_count(self) -> int:
         """Number of sources with failed checks."""
-        return sum(1 for r in self.results if not r.is_valid)
+        return self.total_count - self.passed_count
+
+
+def _check_variable_from_info(info: Dict[str, Any], varname: str) -> ValidationCheck:
+    """Build the variable check from an inspection result."""
+    if not info.get("success"):
+        return ValidationCheck("variable_exists", False, info.get("error", "Unknown error"))
+
+    variables = info.get("variables", [])
+    if varname in variables:
+        return ValidationCheck("variable_exists", True, f"Variable '{varname}' exists")
+    return ValidationCheck(
+        "variable_exists", False,
+        f"Variable '{varname}' not found, available: {variables}"
+    )
+
+
+def _check_time_from_info(
+    info: Dict[str, Any], syear: int, eyear: int, remote: bool = False
+) -> ValidationCheck:
+    """Build the time range check from an inspection result.
+
+    Remote files without a time dimension or with undecodable time values
+    are skipped rather than failed, as the remote check always has been.
+    """
+    if not info.get("success"):
+        return ValidationCheck("time_range", False, info.get("error", "Unknown error"))
+
+    if "time_skipped" in info or ("time_error" in info and remote):
+        return ValidationCheck("time_range", True, "Time check skipped (non-standard calendar)")
+    if "time_error" in info:
+        return ValidationCheck("time_range", False, f"Time check failed: {info['time_error']}")
+
+    time_range = info.get("time_range")
+    if time_range is None and remote:
+        return ValidationCheck("time_range", True, "Time check skipped (no time dimension)")
+    if time_range is None:
+        return ValidationCheck(
+            "time_range", False,
+            f"Time dimension not found, tried: {list(TIME_DIMS)}"
+        )
+
+    data_syear, data_eyear = time_range
+    if data_syear <= syear and data_eyear >= eyear:
+        return ValidationCheck(
+            "time_range", True,
+            f"Time range OK: data {data_syear}-{data_eyear}, required {syear}-{eyear}"
+        )
+    return ValidationCheck(
+        "time_range", False,
+        f"Time range insufficient: data {data_syear}-{data_eyear}, required {syear}-{eyear}"
+    )
+
+
+def _check_spatial_from_info(
+    info: Dict[str, Any],
+    min_lat: float, max_lat: float,
+    min_lon: float, max_lon: float
+) -> ValidationCheck:
+    """Build the spatial range check from an inspection result."""
+    if not info.get("success"):
+        return ValidationCheck("spatial_range", False, info.get("error", "Unknown error"))
+
+    if "spatial_error" in info:
+        return ValidationCheck("spatial_range", False, f"Spatial check failed: {info['spatial_error']}")
+
+    lat_range = info.get("lat_range")
+    lon_range = info.get("lon_range")
+    if lat_range is None or lon_range is None:
+        return ValidationCheck("spatial_range", False, "Lat/lon dimensions not found")
+    # NaN bounds (all values missing) arrive as null from orjson
+    if None in lat_range or None in lon_range:
+        return ValidationCheck("spatial_range", False, "Spatial check failed: lat/lon range unknown")
+
+    data_min_lat, data_max_lat = lat_range
+    data_min_lon, data_max_lon = lon_range
+
+    lat_ok = data_min_lat <= min_lat and data_max_lat >= max_lat
+    lon_ok = data_min_lon <= min_lon and data_max_lon >= max_lon
+
+    if lat_ok and lon_ok:
+        return ValidationCheck("spatial_range", True, "Spatial range OK")
+
+    msg_parts = []
+    if not lat_ok:
+        msg_parts.append(f"Lat: data {data_min_lat:.1f}~{data_max_lat:.1f}, required {min_lat:.1f}~{max_lat:.1f}")
+    if not lon_ok:
+        msg_parts.append(f"Lon: data {data_min_lon:.1f}~{data_max_lon:.1f}, required {min_lon:.1f}~{max_lon:.1f}")
+
+    return ValidationCheck("spatial_range", False, "Spatial range insufficient: " + "; ".join(msg_parts))
+
+
+@dataclass(slots=True)
+class _SourcePlan:
+    """File-level checks of a source, pending the content checks."""
+    var_name: str
+    source_name: str
+    checks: List[ValidationCheck]
+    first_existing_path: Optional[str] = None
+    varname: str = ""
+    data_type: str = "grid"
+    data_groupby: str = "Year"
+    syear: int = 2000
+    eyear: int = 2020
+
+
+@lru_cache(maxsize=1024)
+def _list_matching(base_dir: str, prefix: str, suffix: str) -> Tuple[str, ...]:
+    """List local files named {prefix}*{suffix}.nc in base_dir, sorted.
+
+    Cached because many sources share a directory and pattern; call
+    FilePathGenerator.clear_cache() to see filesystem changes.
+
+    The directory is read with a single os.scandir pass matching names by
+    prefix/suffix, which needs no per-entry stat. Falls back to glob when
+    the directory cannot be listed or the prefix/suffix contain glob
+    wildcards.
+    """
+    tail = f"{suffix}.nc"
+    if not glob.has_magic(prefix + tail):
+        try:
+            with os.scandir(base_dir) as entries:
+                names = [entry.name for entry in entries if entry.is_file()]
+        except OSError:
+            pass
+        else:
+            head, tail = os.path.normcase(prefix), os.path.normcase(tail)
+            min_len = len(prefix) + len(tail)
+            names = sorted(
+                name for name in names
+                if len(name) >= min_len
+                and os.path.normcase(name).startswith(head)
+                and os.path.normcase(name).endswith(tail)
+                # glob's '*' skips hidden files
+                and (prefix.startswith(".") or not name.startswith("."))
+            )
+            return tuple(os.path.join(base_dir, name) for name in names)
+    return tuple(sorted(glob.glob(os.path.join(base_dir, f"{prefix}*{suffix}.nc"))))
 
 
 class FilePathGenerator:
@@ -115,8 +649,21 @@ class FilePathGenerator:
         self._ssh_manager = ssh_manager
         self._remote_openbench_root = remote_openbench_root
 
+        # Resolved once: local resolution reads the OpenBench root config and
+        # normalizes the path, which is wasted work per sample path
+        self._base_dir = self._resolve_base_dir()
+        if self._is_remote:
+            self._path_prefix = f"{self._base_dir.rstrip('/')}/"
+        else:
+            self._path_prefix = os.path.join(self._base_dir, "")
+        self._glob_pattern = f"{self.prefix}*{self.suffix}.nc"
+
     def _get_base_dir(self) -> str:
         """Get the base directory path (root_dir + sub_dir)."""
+        return self._base_dir
+
+    def _resolve_base_dir(self) -> str:
+        """Resolve root_dir + sub_dir to an absolute directory path."""
         if self._is_remote:
             # Remote mode: use forward slashes and remote root
             root = self.root_dir.replace('\\', '/')
@@ -143,10 +690,7 @@ class FilePathGenerator:
 
     def _build_path(self, filename: str) -> str:
         """Build full path with root_dir and sub_dir."""
-        base_dir = self._get_base_dir()
-        if self._is_remote:
-            return f"{base_dir.rstrip('/')}/{filename}"
-        return os.path.join(base_dir, filename)
+        return self._path_prefix + filename
 
     def get_sample_paths(self) -> List[str]:
         """Get sample file paths for validation.
@@ -154,7 +698,7 @@ class FilePathGenerator:
         Uses glob pattern to find actual files matching prefix and suffix.
         Returns a small set of representative paths to check.
         """
-        base_dir = self._get_base_dir()
+        base_dir = self._base_dir
 
         if self.data_groupby == "Single":
             # Exact match for single file
@@ -163,23 +707,21 @@ class FilePathGenerator:
 
         # For Year/Month/Day, use glob to find matching files
         # Pattern: {prefix}*{suffix}.nc
-        pattern = f"{self.prefix}*{self.suffix}.nc"
+        pattern = self._glob_pattern
 
         if self._is_remote and self._ssh_manager:
             # Remote mode: use SSH to list files
             matching_files = self._remote_glob(base_dir, pattern)
         else:
             # Local mode: use local glob
-            import glob
-            full_pattern = os.path.join(base_dir, pattern)
-            matching_files = sorted(glob.glob(full_pattern))
+            matching_files = _list_matching(base_dir, self.prefix, self.suffix)
 
         if matching_files:
             # Return first, middle, and last file as samples
             if len(matching_files) == 1:
-                return matching_files
+                return list(matching_files)
             elif len(matching_files) == 2:
-                return matching_files
+                return list(matching_files)
             else:
                 mid = len(matching_files) // 2
                 return [matching_files[0], matching_files[mid], matching_files[-1]]
@@ -188,11 +730,19 @@ class FilePathGenerator:
         # The validation will report "no files found"
         return []
 
+    @classmethod
+    def clear_cache(cls):
+        """Forget cached local directory listings."""
+        _list_matching.cache_clear()
+
     def _remote_glob(self, base_dir: str, pattern: str) -> List[str]:
         """Find files matching pattern on remote server via SSH."""
         try:
             # Use find command to match files
-            cmd = f"find '{base_dir}' -maxdepth 1 -name '{pattern}' -type f 2>/dev/null | sort"
+            cmd = (
+                f"find {quote_remote_path(base_dir)} -maxdepth 1 "
+                f"-name {shlex.quote(pattern)} -type f 2>/dev/null | sort"
+            )
             stdout, stderr, exit_code = self._ssh_manager.execute(cmd, timeout=30)
             if exit_code == 0 and stdout.strip():
                 return [line.strip() for line in stdout.strip().split('\n') if line.strip()]
@@ -205,103 +755,238 @@ class LocalNetCDFValidator:
     """Validate NetCDF files locally using xarray."""
 
     # Common dimension names
-    TIME_DIMS = ['time', 'Time', 'TIME', 't', 'date']
-    LAT_DIMS = ['lat', 'latitude', 'Lat', 'LAT', 'y']
-    LON_DIMS = ['lon', 'longitude', 'Lon', 'LON', 'x']
+    TIME_DIMS = TIME_DIMS
+    LAT_DIMS = LAT_DIMS
+    LON_DIMS = LON_DIMS
+
+    # Paths per directory from which check_files_exist lists the directory
+    SCAN_THRESHOLD = 16
+
+    def __init__(self):
+        """Initialize validator and start xarray backend discovery early."""
+        warm_up_backends()
 
     def check_file_exists(self, path: str) -> ValidationCheck:
         """Check if file exists."""
-        exists = os.path.exists(path)
-        if exists:
+        if _path_exists(path):
             return ValidationCheck("file_exists", True, f"File exists: {path}")
         return ValidationCheck("file_exists", False, f"File not found: {path}")
 
-    def _open_dataset(self, path: str):
-        """Open dataset using safe_open."""
-        return safe_open(path)
+    def check_files_exist(self, paths: List[str]) -> List[ValidationCheck]:
+        """Check existence of several files, in order.
 
-    def check_variable(self, path: str, varname: str) -> ValidationCheck:
-        """Check if variable exists in NetCDF file."""
-        try:
-            import xarray as xr
-        except ImportError:
-            return ValidationCheck(
-                "variable_exists", False,
-                "xarray required: pip install xarray netCDF4"
-            )
+        Directories holding at least SCAN_THRESHOLD of the paths are listed
+        once with os.scandir instead of stat-ing each path.
+        """
+        by_dir: Dict[str, List[str]] = {}
+        for path in paths:
+            by_dir.setdefault(os.path.dirname(path), []).append(path)
+
+        present = set()
+        for dir_path, dir_paths in by_dir.items():
+            if len(dir_paths) >= self.SCAN_THRESHOLD:
+                try:
+                    with os.scandir(dir_path or ".") as entries:
+                        names = {entry.name for entry in entries}
+                    present.update(p for p in dir_paths if os.path.basename(p) in names)
+                    continue
+                except OSError:
+                    pass
+            present.update(p for p in dir_paths if _path_exists(p))
+
+        return [
+            ValidationCheck("file_exists", True, f"File exists: {path}")
+            if path in present else
+            ValidationCheck("file_exists", False, f"File not found: {path}")
+            for path in paths
+        ]
 
+    def _open_dataset(self, path: str):
+        """Open dataset for metadata reads.
+
+        NetCDF4 (HDF5) files are opened with h5py when it is installed, which
+        reads metadata without netCDF-C's dimension bookkeeping. Otherwise
+        (NetCDF3/classic files, or no h5py) a raw netCDF4.Dataset handle is
+        used, which skips xarray's backend discovery, CF decoding and index
+        construction. Falls back to an undecoded xarray dataset (open_raw)
+        when netCDF4 is missing or cannot read the file.
+        """
+        if _HAS_H5PY and _is_hdf5_file(path):
+            try:
+                return h5py.File(path, "r", swmr=True)
+            except OSError:
+                pass
+        if not _HAS_NETCDF4:
+            return open_raw(path)
         try:
-            ds = self._open_dataset(path)
-            available_vars = list(ds.data_vars)
-            ds.close()
-
-            if varname in available_vars:
-                return ValidationCheck("variable_exists", True, f"Variable '{varname}' exists")
-            return ValidationCheck(
-                "variable_exists", False,
-                f"Variable '{varname}' not found, available: {available_vars}"
-            )
-        except Exception as e:
-            return ValidationCheck("variable_exists", False, f"Cannot read file: {e}")
+            with _NETCDF4_LOCK:
+                return netCDF4.Dataset(path, 'r')
+        except OSError:
+            return open_raw(path)
+
+    def _variable_names(self, ds) -> List[str]:
+        """List data variables (coordinate variables excluded)."""
+        if _is_h5py_file(ds):
+            return [
+                name for name, obj in _h5_datasets(ds).items()
+                if obj.attrs.get("CLASS") != b"DIMENSION_SCALE"
+            ]
+        if _is_netcdf4_dataset(ds):
+            return [name for name in ds.variables if name not in ds.dimensions]
+        return list(ds.data_vars)
+
+    def _coord_values(self, ds, name: str):
+        """Get a coordinate's values (a lazy variable for netCDF4/h5py handles)."""
+        if _is_h5py_file(ds):
+            return _h5_datasets(ds)[name]
+        if _is_netcdf4_dataset(ds):
+            return ds.variables[name]
+        coord = ds[name]
+        if _HAS_XARRAY and isinstance(coord, xr.DataArray):
+            # The underlying Variable is lazily indexed on an undecoded
+            # dataset, so time reads load only the elements _time_bounds needs
+            return coord.variable
+        return coord.values
+
+    def _time_year_range(self, ds, time_dim: str) -> Optional[Tuple[int, int]]:
+        """Get (first_year, last_year) of a time coordinate.
 
-    def _find_dim(self, ds, candidates: List[str]) -> Optional[str]:
-        """Find a dimension by trying common names."""
-        for name in candidates:
-            if name in ds.dims or name in ds.coords:
-                return name
-        return None
+        Returns:
+            Year range, or None for a non-standard calendar that cannot be
+            decoded
 
-    def check_time_range(
-        self, path: str, syear: int, eyear: int
-    ) -> ValidationCheck:
-        """Check if data time range covers required period."""
-        try:
-            import xarray as xr
-            import pandas as pd
-        except ImportError:
-            return ValidationCheck(
-                "time_range", False,
-                "xarray required: pip install xarray netCDF4"
+        Raises:
+            ValueError: If the time values cannot be read or decoded
+        """
+        if _is_h5py_file(ds):
+            time_var = _h5_datasets(ds)[time_dim]
+            return _decode_years(
+                time_var,
+                _h5_attr(time_var, "units"),
+                _h5_attr(time_var, "calendar", "standard")
             )
 
+        if _is_netcdf4_dataset(ds):
+            time_var = ds.variables[time_dim]
+            units = getattr(time_var, "units", None)
+            if not units:
+                raise ValueError("time variable has no units attribute")
+            calendar = getattr(time_var, "calendar", "standard")
+            try:
+                first, last = netCDF4.num2date(
+                    list(_time_bounds(time_var)), units, calendar
+                )
+            except (TypeError, ValueError):
+                if _is_standard_calendar(calendar):
+                    raise
+                return None
+            return first.year, last.year
+
+        time_var = ds[time_dim]
+        return _decode_years(
+            self._coord_values(ds, time_dim),
+            time_var.attrs.get("units"),
+            time_var.attrs.get("calendar", "standard")
+        )
+
+    def inspect(self, path: str) -> Dict[str, Any]:
+        """Read everything the content checks need with a single open.
+
+        Returns:
+            Dict with "success" and, on success, "variables", "time_range"
+            (or "time_error", or "time_skipped" for a non-standard calendar),
+            "lat_range" and "lon_range" (or "spatial_error"),
+            the same shape as RemoteNetCDFValidator's inspection results.
+            On failure, "error" holds the message.
+        """
         try:
             ds = self._open_dataset(path)
-            time_dim = self._find_dim(ds, self.TIME_DIMS)
+        except ImportError:
+            return {"success": False, "error": "xarray required: pip install xarray netCDF4"}
+        except Exception as e:
+            return {"success": False, "error": f"Cannot read file: {e}"}
 
-            if time_dim is None:
+        # Raw netCDF4 handles must not be used by two threads at once
+        with _NETCDF4_LOCK if _is_netcdf4_dataset(ds) else nullcontext():
+            try:
+                try:
+                    result = {"success": True, "variables": self._variable_names(ds)}
+                except Exception as e:
+                    return {"success": False, "error": f"Cannot read file: {e}"}
+
+                names = None
+                try:
+                    names = self._coord_names(ds)
+                    time_dim = self._find_dim(ds, self.TIME_DIMS, names)
+                    year_range = self._time_year_range(ds, time_dim) if time_dim else None
+                except Exception as e:
+                    result["time_error"] = str(e)
+                else:
+                    if year_range is not None:
+                        result["time_range"] = list(year_range)
+                    elif time_dim is not None:
+                        result["time_skipped"] = "non-standard calendar"
+
+                try:
+                    lat_dim = self._find_dim(ds, self.LAT_DIMS, names)
+                    lon_dim = self._find_dim(ds, self.LON_DIMS, names)
+                    if lat_dim is not None and lon_dim is not None:
+                        result["lat_range"] = [float(v) for v in _coord_bounds(self._coord_values(ds, lat_dim))]
+                        result["lon_range"] = [float(v) for v in _coord_bounds(self._coord_values(ds, lon_dim))]
+                except Exception as e:
+                    result["spatial_error"] = str(e)
+
+                return result
+            finally:
                 ds.close()
-                return ValidationCheck(
-                    "time_range", False,
-                    f"Time dimension not found, tried: {self.TIME_DIMS}"
-                )
 
-            time_vals = ds[time_dim].values
-            ds.close()
+    def check_variable(self, path: str, varname: str) -> ValidationCheck:
+        """Check if variable exists in NetCDF file."""
+        return _check_variable_from_info(self.inspect(path), varname)
 
-            # Convert to years - handle cftime objects
-            try:
-                time_years = pd.to_datetime(time_vals).year
-            except (TypeError, ValueError):
-                # cftime or other non-standard calendar - skip time check
-                return ValidationCheck(
-                    "time_range", True,
-                    "Time check skipped (non-standard calendar)"
-                )
+    def _coord_names(self, ds) -> Set[str]:
+        """Names _find_dim can match: dims and coords of the dataset.
 
-            data_syear = int(time_years.min())
-            data_eyear = int(time_years.max())
+        For netCDF4/h5py handles these are the dimension coordinates plus
+        the auxiliary coordinates named by "coordinates" attributes; data
+        variables (e.g. one called "t") are never taken for an axis.
+        """
+        if _is_h5py_file(ds):
+            variables = _h5_datasets(ds)
+            names = {
+                name for name, obj in variables.items()
+                if obj.attrs.get("CLASS") == b"DIMENSION_SCALE"
+            }
+            aux = (_h5_attr(obj, "coordinates") for obj in variables.values())
+        elif _is_netcdf4_dataset(ds):
+            variables = ds.variables
+            names = set(ds.dimensions) & set(variables)
+            aux = (getattr(var, "coordinates", None) for var in variables.values())
+        else:
+            return set(ds.dims) | set(ds.coords)
+        for value in aux:
+            if isinstance(value, str):
+                names.update(name for name in value.split() if name in variables)
+        return names
 
-            if data_syear <= syear and data_eyear >= eyear:
-                return ValidationCheck(
-                    "time_range", True,
-                    f"Time range OK: data {data_syear}-{data_eyear}, required {syear}-{eyear}"
-                )
-            return ValidationCheck(
-                "time_range", False,
-                f"Time range insufficient: data {data_syear}-{data_eyear}, required {syear}-{eyear}"
-            )
-        except Exception as e:
-            return ValidationCheck("time_range", False, f"Time check failed: {e}")
+    def _find_dim(self, ds, candidates: Sequence[str],
+                  names: Optional[Set[str]] = None) -> Optional[str]:
+        """Find a dimension by trying common names.
+
+        Args:
+            ds: Open dataset
+            candidates: Names in priority order
+            names: Precomputed _coord_names(ds), to share across lookups
+        """
+        if names is None:
+            names = self._coord_names(ds)
+        return next((name for name in candidates if name in names), None)
+
+    def check_time_range(
+        self, path: str, syear: int, eyear: int
+    ) -> ValidationCheck:
+        """Check if data time range covers required period."""
+        return _check_time_from_info(self.inspect(path), syear, eyear)
 
     def check_spatial_range(
         self, path: str,
@@ -309,108 +994,131 @@ class LocalNetCDFValidator:
         min_lon: float, max_lon: float
     ) -> ValidationCheck:
         """Check if data spatial range covers required area."""
-        try:
-            import xarray as xr
-        except ImportError:
-            return ValidationCheck(
-                "spatial_range", False,
-                "xarray required: pip install xarray netCDF4"
-            )
-
-        try:
-            ds = self._open_dataset(path)
-            lat_dim = self._find_dim(ds, self.LAT_DIMS)
-            lon_dim = self._find_dim(ds, self.LON_DIMS)
-
-            if lat_dim is None or lon_dim is None:
-                ds.close()
-                return ValidationCheck(
-                    "spatial_range", False,
-                    "Lat/lon dimensions not found"
-                )
-
-            lat_vals = ds[lat_dim].values
-            lon_vals = ds[lon_dim].values
-            ds.close()
-
-            data_min_lat, data_max_lat = float(lat_vals.min()), float(lat_vals.max())
-            data_min_lon, data_max_lon = float(lon_vals.min()), float(lon_vals.max())
-
-            lat_ok = data_min_lat <= min_lat and data_max_lat >= max_lat
-            lon_ok = data_min_lon <= min_lon and data_max_lon >= max_lon
-
-            if lat_ok and lon_ok:
-                return ValidationCheck(
-                    "spatial_range", True,
-                    "Spatial range OK"
-                )
-
-            msg_parts = []
-            if not lat_ok:
-                msg_parts.append(f"Lat: data {data_min_lat:.1f}~{data_max_lat:.1f}, required {min_lat:.1f}~{max_lat:.1f}")
-            if not lon_ok:
-                msg_parts.append(f"Lon: data {data_min_lon:.1f}~{data_max_lon:.1f}, required {min_lon:.1f}~{max_lon:.1f}")
-
-            return ValidationCheck("spatial_range", False, "Spatial range insufficient: " + "; ".join(msg_parts))
-        except Exception as e:
-            return ValidationCheck("spatial_range", False, f"Spatial check failed: {e}")
+        return _check_spatial_from_info(
+            self.inspect(path), min_lat, max_lat, min_lon, max_lon
+        )
 
 
 class RemoteNetCDFValidator:
     """Validate NetCDF files on remote server via SSH."""
 
-    # Python script template for remote execution
-    INSPECT_SCRIPT = '''
+    # Maximum number of per-path inspection results kept in memory
+    INSPECT_CACHE_SIZE = 256
+    # Maximum number of paths inspected by one remote script run
+    INSPECT_BATCH_SIZE = 50
+
+    # Python script for remote execution. Inspects every path given on the
+    # command line and prints one JSON result per line, in argument order.
+    # Built once at import from the module's dimension names and
+    # SAFE_OPEN_CODE; the body is plain text, so no format() escaping
+    INSPECT_SCRIPT = f"""
 import json
+import os
 import sys
-try:
-    import xarray as xr
-    import pandas as pd
 
-    def safe_open(path):
-        """Open dataset, trying decode_times=False if default fails."""
-        try:
-            return xr.open_dataset(path)
-        except Exception:
-            return xr.open_dataset(path, decode_times=False)
-
-    ds = safe_open("{path}")
-    result = {{"success": True}}
+TIME_DIMS = {list(TIME_DIMS)!r}
+LAT_DIMS = {list(LAT_DIMS)!r}
+LON_DIMS = {list(LON_DIMS)!r}
+
+""" + SAFE_OPEN_CODE + '''
+
+def bounds(var):
+    """(min, max) of a lat/lon coordinate; ends only if monotonic throughout."""
+    values = var.values
+    if values.ndim == 1 and values.shape[0] > 1:
+        steps = np.diff(values)
+        if np.all(steps >= 0) or np.all(steps <= 0):
+            return (values[0], values[-1]) if values[0] <= values[-1] else (values[-1], values[0])
+    if values.dtype.kind == "f":
+        return np.nanmin(values), np.nanmax(values)
+    return values.min(), values.max()
+
+
+def time_bounds(var):
+    """(min, max) of a time coordinate, reading only its ends when monotonic."""
+    if var.ndim == 1 and var.shape[0] > 4:
+        dim = var.dims[0]
+        head = var.isel({dim: [0, 1]}).values
+        tail = var.isel({dim: [-2, -1]}).values
+        if (head[0] <= head[1] and tail[0] <= tail[1]) or (head[0] >= head[1] and tail[0] >= tail[1]):
+            return (head[0], tail[-1]) if head[0] <= tail[-1] else (tail[-1], head[0])
+    values = var.values
+    return values.min(), values.max()
+
+
+def years(ends):
+    """Years of two decoded time values (datetime64 or cftime)."""
+    ends = np.asarray(ends)
+    if ends.dtype.kind == "M":
+        return [int(y) + 1970 for y in ends.astype("datetime64[Y]").astype(int)]
+    return [int(v.year) for v in ends]
+
+
+def inspect(path):
+    # "~/" paths are passed unexpanded so results keep the requested path
+    ds = safe_open(os.path.expanduser(path))
+    result = {"success": True}
     result["variables"] = list(ds.data_vars)
 
     # Find time dimension and extract time range
-    time_dims = ['time', 'Time', 'TIME', 't', 'date']
-    for td in time_dims:
+    for td in TIME_DIMS:
         if td in ds.dims or td in ds.coords:
             try:
-                time_data = ds[td].values
-                time_vals = pd.to_datetime(time_data)
-                result["time_range"] = [int(time_vals.year.min()), int(time_vals.year.max())]
+                result["time_range"] = years(time_bounds(ds[td]))
             except Exception as e:
                 # If time conversion fails, skip time check
                 result["time_error"] = str(e)
             break
 
     # Find lat/lon dimensions
-    lat_dims = ['lat', 'latitude', 'Lat', 'LAT', 'y']
-    lon_dims = ['lon', 'longitude', 'Lon', 'LON', 'x']
-    for ld in lat_dims:
+    for ld in LAT_DIMS:
         if ld in ds.dims or ld in ds.coords:
-            result["lat_range"] = [float(ds[ld].values.min()), float(ds[ld].values.max())]
+            result["lat_range"] = [float(v) for v in bounds(ds[ld])]
             break
-    for ld in lon_dims:
+    for ld in LON_DIMS:
         if ld in ds.dims or ld in ds.coords:
-            result["lon_range"] = [float(ds[ld].values.min()), float(ds[ld].values.max())]
+            result["lon_range"] = [float(v) for v in bounds(ds[ld])]
             break
 
     ds.close()
-    print(json.dumps(result))
-except ImportError as e:
-    print(json.dumps({{"success": False, "error": "xarray not installed"}}))
-except Exception as e:
-    print(json.dumps({{"success": False, "error": str(e)}}))
+    return result
+
+
+try:
+    import numpy as np
+    import xarray as xr
+except ImportError:
+    xr = None
+
+try:
+    import orjson
+
+    def emit(result):
+        sys.stdout.buffer.write(orjson.dumps(result) + b"\\n")
+        sys.stdout.flush()
+except ImportError:
+    def emit(result):
+        print(json.dumps(result), flush=True)
+
+for path in sys.argv[1:]:
+    if xr is None:
+        result = {"success": False, "error": "xarray not installed"}
+    else:
+        try:
+            result = inspect(path)
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
+    result["path"] = path
+    emit(result)
 '''
 
+    # Remote copy of INSPECT_SCRIPT; the content hash in the name keeps
+    # wizard versions with different scripts from sharing a stale copy
+    SCRIPT_PATH = (
+        "~/.openbench_wizard/inspect_"
+        f"{hashlib.sha1(INSPECT_SCRIPT.encode('utf-8')).hexdigest()[:12]}.py"
+    )
+
     def __init__(self, ssh_manager, python_path: str = "", conda_env: str = ""):
         """Initialize with SSH manager.
 
@@ -422,84 +1130,179 @@ except Exception as e:
         self._ssh = ssh_manager
         self._python_path = python_path or "python3"
         self._conda_env = conda_env
+        # path -> inspection result, shared by the check_* methods
+        self._inspect_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._inspect_lock = threading.Lock()
+        # Set once INSPECT_SCRIPT has been saved as SCRIPT_PATH remotely
+        self._script_uploaded = False
+
+    def clear_cache(self) -> None:
+        """Forget cached inspection results (e.g. after remote files change)."""
+        with self._inspect_lock:
+            self._inspect_cache.clear()
 
     def check_file_exists(self, path: str) -> ValidationCheck:
         """Check if file exists on remote server."""
         try:
-            stdout, stderr, exit_code = self._ssh.execute(f"test -f '{path}'", timeout=10)
+            stdout, stderr, exit_code = self._ssh.execute(
+                f"test -f {quote_remote_path(path)}", timeout=10
+            )
             if exit_code == 0:
                 return ValidationCheck("file_exists", True, f"File exists: {path}")
             return ValidationCheck("file_exists", False, f"File not found: {path}")
         except Exception as e:
             return ValidationCheck("file_exists", False, f"Remote check failed: {e}")
 
+    def check_files_exist(self, paths: List[str]) -> List[ValidationCheck]:
+        """Check existence of several remote files with one SSH call."""
+        if not paths:
+            return []
+        # Quoted like check_file_exists, so "~/" still expands; the shell
+        # then sees expanded paths, so it reports present ones by position
+        args = " ".join(quote_remote_path(path) for path in paths)
+        cmd = f'i=0; for p in {args}; do [ -f "$p" ] && printf \'%s\\n\' "$i"; i=$((i+1)); done; true'
+        try:
+            stdout, stderr, exit_code = self._ssh.execute(cmd, timeout=10 + len(paths))
+        except Exception as e:
+            return [
+                ValidationCheck("file_exists", False, f"Remote check failed: {e}")
+                for _ in paths
+            ]
+
+        present = set(stdout.split())
+        return [
+            ValidationCheck("file_exists", True, f"File exists: {path}")
+            if str(index) in present else
+            ValidationCheck("file_exists", False, f"File not found: {path}")
+            for index, path in enumerate(paths)
+        ]
+
     def _run_inspect_script(self, path: str) -> Optional[Dict[str, Any]]:
-        """Run inspection script on remote server."""
-        import base64
-        script = self.INSPECT_SCRIPT.format(path=path)
+        """Run inspection script on remote server.
 
-        # Encode script as base64 to avoid shell quoting issues
-        script_b64 = base64.b64encode(script.encode()).decode()
+        Results are cached per path so the variable, time and spatial checks
+        of one file share a single SSH round trip. Failed runs are not cached.
+        """
+        with self._inspect_lock:
+            if path in self._inspect_cache:
+                self._inspect_cache.move_to_end(path)
+                return self._inspect_cache[path]
+
+        result = self._inspect_remote(path)
+        if result is not None:
+            with self._inspect_lock:
+                self._inspect_cache[path] = result
+                if len(self._inspect_cache) > self.INSPECT_CACHE_SIZE:
+                    self._inspect_cache.popitem(last=False)
+        return result
+
+    def _inspect_remote(self, path: str) -> Optional[Dict[str, Any]]:
+        """Execute the inspection script for one path over SSH."""
+        return self._run_inspect_batch([path]).get(path)
+
+    def inspect_batch(self, paths: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Inspect many remote files with one SSH call per INSPECT_BATCH_SIZE paths.
+
+        Starting the remote interpreter and importing xarray dominates the
+        cost of a single inspection, so batching amortizes it across files.
+        Results are stored in the per-path cache used by the check_* methods.
+
+        Args:
+            paths: Remote file paths to inspect
+
+        Returns:
+            Dict of {path: inspection result} for paths that returned a
+            result; inspect() reports the others as failed
+        """
+        results = {}
+        with self._inspect_lock:
+            pending = []
+            for path in dict.fromkeys(paths):
+                if path in self._inspect_cache:
+                    results[path] = self._inspect_cache[path]
+                else:
+                    pending.append(path)
+
+        for i in range(0, len(pending), self.INSPECT_BATCH_SIZE):
+            batch = self._run_inspect_batch(pending[i:i + self.INSPECT_BATCH_SIZE])
+            with self._inspect_lock:
+                for path, result in batch.items():
+                    self._inspect_cache[path] = result
+                while len(self._inspect_cache) > self.INSPECT_CACHE_SIZE:
+                    self._inspect_cache.popitem(last=False)
+            results.update(batch)
+        return results
+
+    def _run_inspect_batch(self, paths: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Run the inspection script once for a list of paths."""
+        # The paths are passed as arguments, so they never need to be
+        # embedded in the script. The first call saves the script (sent on
+        # stdin) to SCRIPT_PATH in the same command; later calls only name it.
+        args = " ".join(shlex.quote(path) for path in paths)
+        script = quote_remote_path(self.SCRIPT_PATH)
+        run = f"{quote_remote_path(self._python_path)} {script} {args}"
+        upload = not self._script_uploaded
+        if upload:
+            script_dir = quote_remote_path(self.SCRIPT_PATH.rsplit("/", 1)[0])
+            run = (
+                f"mkdir -p {script_dir} && cat > {script}.$$ && "
+                f"mv -f {script}.$$ {script} && {run}"
+            )
 
         # Build command with proper Python environment
         if self._conda_env:
             # Activate conda environment before running
-            cmd = f"source ~/.bashrc 2>/dev/null; conda activate {self._conda_env} 2>/dev/null; echo {script_b64} | base64 -d | {self._python_path}"
+            cmd = f"source ~/.bashrc 2>/dev/null; conda activate {shlex.quote(self._conda_env)} 2>/dev/null; {run}"
         else:
-            cmd = f"echo {script_b64} | base64 -d | {self._python_path}"
+            cmd = run
 
+        results = {}
         try:
-            stdout, stderr, exit_code = self._ssh.execute(cmd, timeout=30)
-            if exit_code == 0 and stdout.strip():
-                return json.loads(stdout.strip())
+            stdout, stderr, exit_code = self._ssh.execute(
+                cmd, timeout=30 + 10 * (len(paths) - 1),
+                stdin_data=self.INSPECT_SCRIPT if upload else None
+            )
         except Exception:
-            pass
-        return None
-
-    def check_variable(self, path: str, varname: str) -> ValidationCheck:
-        """Check if variable exists in remote NetCDF file."""
+            return results
+        if exit_code != 0:
+            if not upload and "can't open file" in stderr:
+                # Saved script was removed (e.g. home cleanup); send it again
+                self._script_uploaded = False
+                return self._run_inspect_batch(paths)
+            return results
+        self._script_uploaded = True
+
+        # One JSON object per path, matched by its "path" field so shell
+        # noise (even lines starting with "{") cannot shift the results
+        wanted = set(paths)
+        for line in stdout.splitlines():
+            if not line.startswith("{"):
+                continue
+            try:
+                result = _parse_json(line)
+            except ValueError:
+                continue
+            path = result.pop("path", None) if isinstance(result, dict) else None
+            if path in wanted and path not in results:
+                results[path] = result
+        return results
+
+    def inspect(self, path: str) -> Dict[str, Any]:
+        """Inspect a remote file, in the same shape as LocalNetCDFValidator.inspect."""
         result = self._run_inspect_script(path)
-
         if result is None:
-            return ValidationCheck("variable_exists", False, "Remote check failed")
-
+            return {"success": False, "error": "Remote check failed"}
         if not result.get("success"):
-            error = result.get("error", "Unknown error")
-            return ValidationCheck("variable_exists", False, f"Remote error: {error}")
+            return {"success": False, "error": f"Remote error: {result.get('error', 'Unknown error')}"}
+        return result
 
-        variables = result.get("variables", [])
-        if varname in variables:
-            return ValidationCheck("variable_exists", True, f"Variable '{varname}' exists")
-        return ValidationCheck(
-            "variable_exists", False,
-            f"Variable '{varname}' not found, available: {variables}"
-        )
+    def check_variable(self, path: str, varname: str) -> ValidationCheck:
+        """Check if variable exists in remote NetCDF file."""
+        return _check_variable_from_info(self.inspect(path), varname)
 
     def check_time_range(self, path: str, syear: int, eyear: int) -> ValidationCheck:
         """Check time range on remote file."""
-        result = self._run_inspect_script(path)
-
-        if result is None or not result.get("success"):
-            return ValidationCheck("time_range", False, "Remote time check failed")
-
-        # Check for time conversion error
-        if "time_error" in result:
-            return ValidationCheck("time_range", True, "Time check skipped (non-standard calendar)")
-
-        time_range = result.get("time_range")
-        if time_range is None:
-            return ValidationCheck("time_range", True, "Time check skipped (no time dimension)")
-
-        data_syear, data_eyear = time_range
-        if data_syear <= syear and data_eyear >= eyear:
-            return ValidationCheck(
-                "time_range", True,
-                f"Time range OK: data {data_syear}-{data_eyear}"
-            )
-        return ValidationCheck(
-            "time_range", False,
-            f"Time range insufficient: data {data_syear}-{data_eyear}, required {syear}-{eyear}"
-        )
+        return _check_time_from_info(self.inspect(path), syear, eyear, remote=True)
 
     def check_spatial_range(
         self, path: str,
@@ -507,29 +1310,8 @@ except Exception as e:
         min_lon: float, max_lon: float
     ) -> ValidationCheck:
         """Check spatial range on remote file."""
-        result = self._run_inspect_script(path)
-
-        if result is None or not result.get("success"):
-            return ValidationCheck("spatial_range", False, "Remote spatial check failed")
-
-        lat_range = result.get("lat_range")
-        lon_range = result.get("lon_range")
-
-        if lat_range is None or lon_range is None:
-            return ValidationCheck("spatial_range", False, "Lat/lon dimensions not found")
-
-        data_min_lat, data_max_lat = lat_range
-        data_min_lon, data_max_lon = lon_range
-
-        lat_ok = data_min_lat <= min_lat and data_max_lat >= max_lat
-        lon_ok = data_min_lon <= min_lon and data_max_lon >= max_lon
-
-        if lat_ok and lon_ok:
-            return ValidationCheck("spatial_range", True, "Spatial range OK")
-
-        return ValidationCheck(
-            "spatial_range", False,
-            "Spatial range insufficient"
+        return _check_spatial_from_info(
+            self.inspect(path), min_lat, max_lat, min_lon, max_lon
         )
 
 
@@ -542,8 +1324,18 @@ class DataValidator:
     local filesystem (xarray) and remote execution (SSH + Python script).
     """
 
+    # Upper bound on sources validated concurrently by validate_all(). Remote
+    # sources share one SSH transport, so more workers only queue on it.
+    MAX_WORKERS = 32
+    REMOTE_MAX_WORKERS = 4
+
+    # Minimum seconds between progress callbacks; callbacks also fire every
+    # 1% of sources
+    PROGRESS_INTERVAL = 0.1
+
     def __init__(self, is_remote: bool = False, ssh_manager=None, remote_openbench_root: str = "",
-                 python_path: str = "", conda_env: str = ""):
+                 python_path: str = "", conda_env: str = "", probe_all: bool = False,
+                 cache_path: str = ""):
         """Initialize validator.
 
         Args:
@@ -553,8 +1345,13 @@ class DataValidator:
             remote_openbench_root: Remote OpenBench root path (for remote mode)
             python_path: Python interpreter path for remote execution
             conda_env: Conda environment name for remote execution
+            probe_all: If True, check every sample file of a source exists;
+                      by default checking stops at the first existing one
+            cache_path: File in which to keep local inspection results across
+                       runs (e.g. ValidationCache.DEFAULT_PATH); empty disables it
         """
         self._is_remote = is_remote
+        self._probe_all = probe_all
         self._ssh_manager = ssh_manager
         self._remote_openbench_root = remote_openbench_root
 
@@ -563,6 +1360,75 @@ class DataValidator:
         else:
             self._validator = LocalNetCDFValidator()
 
+        # Inspection results keyed by absolute path; many sources share a
+        # sample file (several variables of one product), so each file is
+        # opened once per validate_all() run.
+        self._inspect_cache: Dict[str, Dict[str, Any]] = {}
+        # _SourcePlan by source file layout, see _prepare_source
+        self._plan_cache: Dict[Tuple, _SourcePlan] = {}
+        self._memo_locks: Dict[Tuple[int, Any], threading.Lock] = {}
+        self._memo_lock = threading.Lock()
+        # Remote files cannot be stat'ed cheaply, so only local runs persist
+        self._validation_cache = (
+            ValidationCache(cache_path) if cache_path and not self._is_remote else None
+        )
+
+    def clear_cache(self):
+        """Forget memoized inspections, source plans and cached listings."""
+        FilePathGenerator.clear_cache()
+        with self._memo_lock:
+            self._inspect_cache.clear()
+            self._plan_cache.clear()
+            self._memo_locks.clear()
+
+    def _memoized(self, cache: Dict, key, compute):
+        """Get cache[key], computing it once even if threads race for it.
+
+        Args:
+            cache: Memo dict owned by this validator
+            key: Cache key
+            compute: Called without arguments on a miss
+
+        Returns:
+            The cached or newly computed value
+        """
+        # Per-key lock so concurrent sources wait for one computation
+        # instead of repeating it in parallel
+        with self._memo_lock:
+            key_lock = self._memo_locks.setdefault((id(cache), key), threading.Lock())
+        with key_lock:
+            if key not in cache:
+                cache[key] = compute()
+            return cache[key]
+
+    def _inspect(self, path: str) -> Dict[str, Any]:
+        """Inspect a file, reusing the result for other sources of the run.
+
+        Args:
+            path: Path to NetCDF file (local or remote)
+
+        Returns:
+            Inspection info dict (see LocalNetCDFValidator.inspect)
+        """
+        key = path if self._is_remote else os.path.abspath(path)
+        return self._memoized(self._inspect_cache, key, lambda: self._inspect_file(path))
+
+    def _inspect_file(self, path: str) -> Dict[str, Any]:
+        """Inspect a file, or reuse its persisted result if it is unchanged."""
+        cache = self._validation_cache
+        if cache is None:
+            return self._validator.inspect(path)
+
+        # Stamp before opening so a file changed meanwhile is seen as stale
+        stamp = cache.stamp(path)
+        info = cache.get(path, stamp)
+        if info is None:
+            info = self._validator.inspect(path)
+            # Read errors may be transient (e.g. file still being written)
+            if info.get("success"):
+                cache.put(path, stamp, info)
+        return info
+
     def validate_source(
         self,
         var_name: str,
@@ -581,6 +1447,28 @@ class DataValidator:
         Returns:
             SourceValidationResult with all checks
         """
+        return self._finish_source(
+            self._prepare_source(var_name, source_name, source_config, general_config)
+        )
+
+    def _prepare_source(
+        self,
+        var_name: str,
+        source_name: str,
+        source_config: Dict[str, Any],
+        general_config: Dict[str, Any]
+    ) -> _SourcePlan:
+        """Resolve a source's sample files and check that they exist.
+
+        Args:
+            var_name: Variable name
+            source_name: Source name
+            source_config: Source configuration dict
+            general_config: General settings
+
+        Returns:
+            _SourcePlan holding the file checks and what the content checks need
+        """
         checks = []
 
         # Extract config values
@@ -603,7 +1491,29 @@ class DataValidator:
         # For station data without prefix/suffix, skip file path validation
         # Station data files may not follow the standard naming pattern
         if data_type == "stn" and not prefix and not suffix:
-            return SourceValidationResult(var_name, source_name, checks)
+            return _SourcePlan(var_name, source_name, checks)
+
+        # Sources with the same file layout (e.g. several variables read
+        # from one product) share the file lookup and existence checks
+        key = (root_dir, sub_dir, prefix, suffix, varname, data_groupby, syear, eyear, data_type)
+        plan = self._memoized(
+            self._plan_cache, key,
+            lambda: self._probe_source(var_name, source_name, *key)
+        )
+        # Copy the checks: _finish_source appends to them
+        return replace(plan, var_name=var_name, source_name=source_name, checks=list(plan.checks))
+
+    def _probe_source(
+        self, var_name: str, source_name: str,
+        root_dir: str, sub_dir: str, prefix: str, suffix: str, varname: str,
+        data_groupby: str, syear: int, eyear: int, data_type: str
+    ) -> _SourcePlan:
+        """Find a source's sample files and check that they exist.
+
+        Returns:
+            _SourcePlan holding the file checks and what the content checks need
+        """
+        checks = []
 
         # Generate file paths
         path_gen = FilePathGenerator(
@@ -630,32 +1540,66 @@ class DataValidator:
                 "file_exists", False,
                 f"No files found matching pattern '{pattern}' in {base_dir}"
             ))
+        elif self._probe_all or self._is_remote:
+            # Remote existence checks cost one SSH call however many paths
+            for path, check in zip(sample_paths, self._validator.check_files_exist(sample_paths)):
+                checks.append(check)
+                if check.passed and first_existing_path is None:
+                    first_existing_path = path
+                    if not self._probe_all:
+                        break
         else:
             for path in sample_paths:
                 check = self._validator.check_file_exists(path)
                 checks.append(check)
-                if check.passed and first_existing_path is None:
+                if check.passed:
                     first_existing_path = path
+                    break
+
+        return _SourcePlan(
+            var_name, source_name, checks,
+            first_existing_path=first_existing_path,
+            varname=varname,
+            data_type=data_type,
+            data_groupby=data_groupby,
+            syear=syear,
+            eyear=eyear
+        )
+
+    def _finish_source(self, plan: _SourcePlan) -> SourceValidationResult:
+        """Run the content checks of a prepared source.
+
+        Args:
+            plan: Result of _prepare_source
+
+        Returns:
+            SourceValidationResult with all checks
+        """
+        checks = plan.checks
 
         # If no files found, skip other checks
-        if first_existing_path is None:
-            return SourceValidationResult(var_name, source_name, checks)
+        if plan.first_existing_path is None:
+            return SourceValidationResult(plan.var_name, plan.source_name, checks)
+
+        check_time = plan.data_type == "grid" and plan.data_groupby == "Single"
+        if not plan.varname and not check_time:
+            return SourceValidationResult(plan.var_name, plan.source_name, checks)
+
+        # Open/inspect the file once for all content checks
+        info = self._inspect(plan.first_existing_path)
 
         # Check variable name
-        if varname:
-            check = self._validator.check_variable(first_existing_path, varname)
-            checks.append(check)
+        if plan.varname:
+            checks.append(_check_variable_from_info(info, plan.varname))
 
         # Check time range (only for grid data with Single groupby)
         # For Year/Month/Day groupby, each file only contains partial data
-        if data_type == "grid" and data_groupby == "Single":
-            check = self._validator.check_time_range(
-                first_existing_path,
-                int(syear), int(eyear)
-            )
-            checks.append(check)
+        if check_time:
+            checks.append(_check_time_from_info(
+                info, int(plan.syear), int(plan.eyear), remote=self._is_remote
+            ))
 
-        return SourceValidationResult(var_name, source_name, checks)
+        return SourceValidationResult(plan.var_name, plan.source_name, checks)
 
     def validate_all(
         self,
@@ -668,25 +1612,73 @@ class DataValidator:
         Args:
             sources: Dict of {var_name: {source_name: source_config}}
             general_config: General settings
-            progress_callback: Optional callback(current, total, var_name, source_name)
+            progress_callback: Optional callback(current, total, var_name, source_name),
+                called from the calling thread after each source finishes,
+                where current is the number of sources finished including
+                the named one. Calls are coalesced to at most one per 1% of sources or
+                PROGRESS_INTERVAL seconds; the final (total, total, "", "")
+                call is always made.
 
         Returns:
             DataValidationReport with all results
         """
-        results = []
-        total = sum(len(s) for s in sources.values())
-        current = 0
-
-        for var_name, var_sources in sources.items():
-            for source_name, source_config in var_sources.items():
-                if progress_callback:
-                    progress_callback(current, total, var_name, source_name)
-
-                result = self.validate_source(
-                    var_name, source_name, source_config, general_config
-                )
-                results.append(result)
-                current += 1
+        jobs = [
+            (var_name, source_name, source_config)
+            for var_name, var_sources in sources.items()
+            for source_name, source_config in var_sources.items()
+        ]
+        total = len(jobs)
+        results: List[Any] = [None] * total
+
+        # Files may have changed since a previous run
+        self.clear_cache()
+
+        # Remote content checks are batched: resolve every source's files
+        # first, inspect all of them in one SSH call, then finish the checks
+        # from the inspection cache.
+        batch_inspect = isinstance(self._validator, RemoteNetCDFValidator)
+        stage = self._prepare_source if batch_inspect else self.validate_source
+
+        if jobs:
+            # Sources are independent and I/O bound (file opens or SSH round
+            # trips), so validate them concurrently. Progress is reported from
+            # this thread as sources finish; results keep the input order.
+            max_workers = self.REMOTE_MAX_WORKERS if self._is_remote else self.MAX_WORKERS
+            executor = ThreadPoolExecutor(max_workers=min(max_workers, total))
+            try:
+                futures = {
+                    executor.submit(
+                        stage,
+                        var_name, source_name, source_config, general_config
+                    ): index
+                    for index, (var_name, source_name, source_config) in enumerate(jobs)
+                }
+                step = max(1, total // 100)
+                last_count = 1 - step
+                last_time = 0.0
+                for current, future in enumerate(as_completed(futures), start=1):
+                    index = futures[future]
+                    results[index] = future.result()
+                    if progress_callback:
+                        now = time.monotonic()
+                        if current - last_count >= step or now - last_time >= self.PROGRESS_INTERVAL:
+                            last_count, last_time = current, now
+                            var_name, source_name, _ = jobs[index]
+                            progress_callback(current, total, var_name, source_name)
+            finally:
+                # Drop queued sources if the callback aborted the run
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        if batch_inspect:
+            paths = [plan.first_existing_path for plan in results if plan.first_existing_path]
+            if paths:
+                self._validator.inspect_batch(paths)
+            results = [self._finish_source(plan) for plan in results]
+
+        # Inspection results are only reused within a run, unless persisted
+        self.clear_cache()
+        if self._validation_cache is not None:
+            self._validation_cache.save()
 
         if progress_callback:
             progress_callback(total, total, "", "")
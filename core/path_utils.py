@@ -4,8 +4,53 @@ Cross-platform path utilities for converting and validating paths.
 """
 
 import os
+import shlex
+import stat
 import sys
-from typing import Optional, Tuple
+import time
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple, TypeVar
+
+# Directories this process has already created (or found) via ensure_dir()
+_ENSURED_DIRS: Set[str] = set()
+
+# Home subdirectories searched for an OpenBench checkout, in order
+# ("" is the home directory itself)
+_OB_SEARCH_SUBDIRS = ("Desktop", "Documents", "")
+
+# validate_path() stat results by path: (time.monotonic() of the stat,
+# st_mode or None if missing). Entries older than STAT_CACHE_TTL are redone.
+STAT_CACHE_TTL = 2.0
+_STAT_CACHE: Dict[str, Tuple[float, Optional[int]]] = {}
+_STAT_CACHE_MAX = 4096
+
+_IS_WINDOWS = sys.platform == 'win32'
+
+_T = TypeVar("_T")
+
+# Separator of the other platform family
+_FOREIGN_SEP = '\\' if os.sep == '/' else '/'
+
+# Lowercase markers locating the OpenBench part of a path from another
+# platform. "/openbench/" wins; the subdirectories are tried in this order
+# (not by position in the path)
+_OB_ROOT_MARKER = '/openbench/'
+_OB_SUBDIR_MARKERS = ('/nml/nml-yaml/', '/nml/nml-fortran/', '/output/', '/mod_variables_definition/')
+
+# Config keys holding paths, used when callers pass no path_keys
+_CONVERT_PATH_KEYS = frozenset([
+    "root_dir", "basedir", "fulllist", "model_namelist",
+    "reference_nml", "simulation_nml", "statistics_nml", "figure_nml",
+    "def_nml_path", "data_path", "file_path", "output_dir"
+])
+_VALIDATE_PATH_KEYS = frozenset([
+    "root_dir", "basedir", "fulllist", "model_namelist",
+    "reference_nml", "simulation_nml", "statistics_nml", "figure_nml"
+])
+# Keys whose child dict holds only paths
+_ALL_PATHS_KEYS = frozenset(["def_nml"])
+# Path keys that name directories rather than files
+_DIRECTORY_KEYS = frozenset(["root_dir", "basedir", "output_dir"])
 
 
 def is_cross_platform_path(path: str) -> bool:
@@ -24,24 +69,24 @@ def is_cross_platform_path(path: str) -> bool:
     if not path:
         return False
 
-    is_windows = sys.platform == 'win32'
+    if _is_foreign_absolute(path):
+        return True
 
-    # On Windows, check for Unix-style paths
-    if is_windows:
-        # Unix absolute path (starts with / but not UNC path //)
-        if path.startswith('/') and not path.startswith('//'):
-            return True
+    # On Unix/Mac, also treat relative Windows backslash paths as foreign;
+    # the O(1) first-character test runs before the full scan for '\\'
+    return not _IS_WINDOWS and path[0] != '/' and '\\' in path
 
-    # On Unix/Mac, check for Windows-style paths
-    else:
-        # Windows drive letter (e.g., C:\ or C:/)
-        if len(path) >= 2 and path[1] == ':':
-            return True
-        # Windows backslash paths
-        if '\\' in path and not path.startswith('/'):
-            return True
 
-    return False
+def _is_foreign_absolute(path: str) -> bool:
+    """
+    Check if a non-empty path is an absolute path of the other platform.
+
+    On Windows: a Unix absolute path (starts with / but not UNC path //)
+    On Unix/Mac: a Windows path with a drive letter (e.g., C:\\ or C:/)
+    """
+    if _IS_WINDOWS:
+        return path[0] == '/' and path[1:2] != '/'
+    return path[1:2] == ':'
 
 
 def to_posix_path(path: str) -> str:
@@ -101,10 +146,10 @@ def remote_dirname(path: str) -> str:
     """
     if not path:
         return ""
-    path = to_posix_path(path).rstrip('/')
-    if '/' not in path:
+    head, sep, _ = to_posix_path(path).rstrip('/').rpartition('/')
+    if not sep:
         return ""
-    return '/'.join(path.split('/')[:-1]) or '/'
+    return head or '/'
 
 
 def remote_basename(path: str) -> str:
@@ -121,20 +166,86 @@ def remote_basename(path: str) -> str:
     """
     if not path:
         return ""
-    path = to_posix_path(path).rstrip('/')
-    return path.split('/')[-1]
+    return to_posix_path(path).rstrip('/').rpartition('/')[2]
+
+
+def quote_remote_path(path: str) -> str:
+    """
+    Quote a remote path for the shell, keeping a leading "~/" expandable.
+
+    Args:
+        path: Remote path
+
+    Returns:
+        Path safe to interpolate into a remote shell command
+    """
+    if path.startswith("~/"):
+        return "~/" + shlex.quote(path[2:])
+    return shlex.quote(path)
+
+
+def ensure_dir(dir_path: str) -> None:
+    """
+    Create a local directory (and parents) once per process.
+
+    Repeated writes into the same directory skip the makedirs/stat round
+    trip after the first call succeeds.
+
+    Args:
+        dir_path: Directory to create; empty string is a no-op
+    """
+    if not dir_path or dir_path in _ENSURED_DIRS:
+        return
+    os.makedirs(dir_path, exist_ok=True)
+    _ENSURED_DIRS.add(dir_path)
+    clear_stat_cache()
+
 
+def write_in_dir(dir_path: str, write: Callable[[], _T]) -> _T:
+    """
+    Run a write into a directory, creating the directory first.
+
+    ensure_dir() remembers directories it has seen, so one deleted since
+    then makes the write fail; it is recreated and the write retried once.
+
+    Args:
+        dir_path: Directory the write goes into; empty string is the cwd
+        write: Callable performing the write
 
+    Returns:
+        The result of write()
+    """
+    ensure_dir(dir_path)
+    try:
+        try:
+            return write()
+        except FileNotFoundError:
+            if not dir_path:
+                raise
+            # The directory may have been removed since it was last seen
+            _ENSURED_DIRS.discard(dir_path)
+            ensure_dir(dir_path)
+            return write()
+    finally:
+        # validate_path() must not keep reporting the new file as missing
+        clear_stat_cache()
+
+
+@lru_cache(maxsize=1)
 def get_openbench_root() -> str:
     """
     Find the OpenBench root directory.
 
+    The result is cached for the process; call get_openbench_root.cache_clear()
+    after saving a new OpenBench path.
+
     Returns:
         Absolute path to OpenBench root directory
     """
+    home_dir = os.path.expanduser("~")
+
     # Try to load saved path first
     try:
-        home_dir = os.path.expanduser("~")
         config_file = os.path.join(home_dir, ".openbench_wizard", "config.txt")
         if os.path.exists(config_file):
             with open(config_file, 'r', encoding='utf-8') as f:
@@ -145,14 +256,9 @@ def get_openbench_root() -> str:
         print(f"Warning: Could not load saved OpenBench path: {e}")
 
     # Search common locations
-    possible_roots = [
-        os.path.join(os.path.expanduser("~"), "Desktop", "OpenBench"),
-        os.path.join(os.path.expanduser("~"), "Documents", "OpenBench"),
-        os.path.join(os.path.expanduser("~"), "OpenBench"),
-    ]
-
-    for root in possible_roots:
-        if root and os.path.exists(os.path.join(root, "openbench", "openbench.py")):
+    for subdir in _OB_SEARCH_SUBDIRS:
+        root = os.path.join(home_dir, subdir, "OpenBench")
+        if os.path.exists(os.path.join(root, "openbench", "openbench.py")):
             return os.path.normpath(root)
 
     # Fallback to current working directory
@@ -176,14 +282,24 @@ def to_absolute_path(path: str, base_dir: Optional[str] = None) -> str:
     # Get base directory first (needed for cross-platform conversion)
     if base_dir is None:
         base_dir = get_openbench_root()
-    else:
-        base_dir = os.path.normpath(base_dir)
+    return _to_absolute_path(path, base_dir)
+
+
+@lru_cache(maxsize=4096)
+def _to_absolute_path(path: str, base_dir: str) -> str:
+    """Cached body of to_absolute_path() once base_dir is known.
+
+    The result depends only on the two strings, so configs converted again
+    (validation, preview, save) reuse earlier results.
+    """
+    base_dir = os.path.normpath(base_dir)
 
     # Try cross-platform conversion first (Linux path on Windows, or vice versa)
-    converted_path = convert_cross_platform_path(path, base_dir)
-    if converted_path != path:
-        # Cross-platform conversion was applied
-        return os.path.normpath(converted_path)
+    if _is_foreign_absolute(path):
+        converted_path = convert_cross_platform_path(path, base_dir)
+        if converted_path != path:
+            # Cross-platform conversion was applied
+            return os.path.normpath(converted_path)
 
     # Normalize path separators for current platform
     path = normalize_path_separators(path)
@@ -213,11 +329,9 @@ def normalize_path_separators(path: str) -> str:
     if not path:
         return ""
 
-    # Replace both types of separators with the current platform's separator
-    if os.sep == '/':
-        return path.replace('\\', '/')
-    else:
-        return path.replace('/', '\\')
+    # Replace the other platform's separator; str.replace returns the
+    # string itself when there is nothing to replace
+    return path.replace(_FOREIGN_SEP, os.sep)
 
 
 def convert_cross_platform_path(path: str, openbench_root: Optional[str] = None) -> str:
@@ -242,20 +356,44 @@ def convert_cross_platform_path(path: str, openbench_root: Optional[str] = None)
     if not path:
         return ""
 
+    if not _is_foreign_absolute(path):
+        return path
+
     if openbench_root is None:
         openbench_root = get_openbench_root()
 
-    is_windows = sys.platform == 'win32'
-
-    # Detect Linux path on Windows (starts with / but no drive letter)
-    if is_windows and path.startswith('/') and not path.startswith('//'):
+    # Linux path on Windows, or Windows path (drive letter) on Linux/Mac
+    if _IS_WINDOWS:
         return _convert_linux_to_windows(path, openbench_root)
+    return _convert_windows_to_linux(path, openbench_root)
+
+
+def _openbench_relative(search_path: str) -> Optional[str]:
+    """
+    Find the part of a forward-slash path that lies inside OpenBench.
+
+    Everything after "/openbench/" when present; otherwise the path from the
+    first of _OB_SUBDIR_MARKERS found, tried in that order.
 
-    # Detect Windows path on Linux/Mac (has drive letter like C:\ or C:/)
-    if not is_windows and len(path) >= 2 and path[1] == ':':
-        return _convert_windows_to_linux(path, openbench_root)
+    Args:
+        search_path: Path using forward slashes
+
+    Returns:
+        Relative path, or None if no marker applies
+    """
+    # Markers are matched case-insensitively; lowercase the path once
+    lower_search = search_path.lower()
+    idx = lower_search.find(_OB_ROOT_MARKER)
+    if idx >= 0:
+        # A trailing "/openbench/" leaves nothing to rebuild
+        return search_path[idx + len(_OB_ROOT_MARKER):] or None
 
-    return path
+    for marker in _OB_SUBDIR_MARKERS:
+        idx = lower_search.find(marker)
+        if idx >= 0:
+            # Skip the leading /
+            return search_path[idx + 1:]
+    return None
 
 
 def _convert_linux_to_windows(linux_path: str, openbench_root: str) -> str:
@@ -263,40 +401,12 @@ def _convert_linux_to_windows(linux_path: str, openbench_root: str) -> str:
     # Normalize separators in the linux path for searching
     search_path = linux_path.replace('\\', '/')
 
-    # Common markers that indicate OpenBench structure
-    markers = [
-        '/OpenBench/',
-        '/openbench/',
-        '/nml/nml-yaml/',
-        '/nml/nml-Fortran/',
-        '/output/',
-        '/Mod_variables_definition/',
-    ]
-
-    for marker in markers:
-        lower_search = search_path.lower()
-        lower_marker = marker.lower()
-        if lower_marker in lower_search:
-            # Extract the relative path after the marker's parent
-            if lower_marker == '/openbench/':
-                # Get everything after OpenBench/
-                idx = lower_search.find('/openbench/')
-                relative = search_path[idx + len('/openbench/'):]
-            else:
-                # For other markers, find OpenBench root first
-                idx = lower_search.find('/openbench/')
-                if idx >= 0:
-                    relative = search_path[idx + len('/openbench/'):]
-                else:
-                    # Just use the marker position
-                    idx = lower_search.find(lower_marker)
-                    relative = search_path[idx + 1:]  # Skip leading /
-
-            # Build Windows path - normalize all separators to backslash
-            if relative:
-                relative = relative.replace('/', '\\')
-                result = os.path.join(openbench_root, relative)
-                return result.replace('/', '\\')
+    relative = _openbench_relative(search_path)
+    if relative:
+        # Build Windows path - normalize all separators to backslash
+        relative = relative.replace('/', '\\')
+        result = os.path.join(openbench_root, relative)
+        return result.replace('/', '\\')
 
     # If no marker found, just normalize separators
     return linux_path.replace('/', '\\')
@@ -307,42 +417,59 @@ def _convert_windows_to_linux(windows_path: str, openbench_root: str) -> str:
     # Normalize separators
     search_path = windows_path.replace('\\', '/')
 
-    # Common markers
-    markers = [
-        '/OpenBench/',
-        '/openbench/',
-        '/nml/nml-yaml/',
-        '/nml/nml-Fortran/',
-        '/output/',
-        '/Mod_variables_definition/',
-    ]
-
-    for marker in markers:
-        lower_search = search_path.lower()
-        lower_marker = marker.lower()
-        if lower_marker in lower_search:
-            if lower_marker == '/openbench/':
-                idx = lower_search.find('/openbench/')
-                relative = search_path[idx + len('/openbench/'):]
-            else:
-                idx = lower_search.find('/openbench/')
-                if idx >= 0:
-                    relative = search_path[idx + len('/openbench/'):]
-                else:
-                    idx = lower_search.find(lower_marker)
-                    relative = search_path[idx + 1:]
-
-            # Build Linux path - normalize all separators to forward slash
-            if relative:
-                relative = relative.replace('\\', '/')
-                result = os.path.join(openbench_root, relative)
-                return result.replace('\\', '/')
+    relative = _openbench_relative(search_path)
+    if relative:
+        # Build Linux path - normalize all separators to forward slash
+        result = os.path.join(openbench_root, relative)
+        return result.replace('\\', '/')
 
     # If no marker found, just normalize separators
     return windows_path.replace('\\', '/')
 
 
-def validate_path(path: str, path_type: str = "file", must_exist: bool = True) -> Tuple[bool, str]:
+def _cached_mode(path: str) -> Optional[int]:
+    """
+    Get the st_mode of a path, reusing stats younger than STAT_CACHE_TTL.
+
+    Paths repeated within a validation pass are then stat'ed once. Each
+    pass (validate_paths_in_dict(), the data source editor) and each write
+    through ensure_dir()/write_in_dir() clears the cache, so files created
+    in between are seen at once; other changes are seen after the TTL.
+
+    Args:
+        path: Path to stat
+
+    Returns:
+        st_mode, or None if the path does not exist
+    """
+    now = time.monotonic()
+    cached = _STAT_CACHE.get(path)
+    if cached is not None and now - cached[0] < STAT_CACHE_TTL:
+        return cached[1]
+
+    try:
+        mode = os.stat(path).st_mode
+    except (OSError, ValueError):
+        mode = None
+
+    if len(_STAT_CACHE) >= _STAT_CACHE_MAX:
+        _STAT_CACHE.clear()
+    _STAT_CACHE[path] = (now, mode)
+    return mode
+
+
+def clear_stat_cache() -> None:
+    """Forget cached validate_path() stats, e.g. after creating files."""
+    _STAT_CACHE.clear()
+
+
+def _as_frozenset(keys: Iterable[str]) -> frozenset:
+    """Return keys as a frozenset for O(1) membership tests."""
+    return keys if isinstance(keys, frozenset) else frozenset(keys)
+
+
+def validate_path(path: str, path_type: str = "file", must_exist: bool = True,
+                  normalize: bool = True) -> Tuple[bool, str]:
     """
     Validate a path exists and is the correct type.
 
@@ -350,6 +477,8 @@ def validate_path(path: str, path_type: str = "file", must_exist: bool = True) -
         path: Path to validate
         path_type: "file" or "directory"
         must_exist: If True, path must exist; if False, parent directory must exist
+        normalize: If False, use path as given (e.g. already converted by
+                   convert_paths_in_dict) instead of applying os.path.normpath
 
     Returns:
         Tuple of (is_valid, error_message)
@@ -358,16 +487,19 @@ def validate_path(path: str, path_type: str = "file", must_exist: bool = True) -
         return True, ""  # Empty paths are OK (optional fields)
 
     # Normalize path
-    path = os.path.normpath(path)
+    if normalize:
+        path = os.path.normpath(path)
 
     if must_exist:
-        if not os.path.exists(path):
+        # One (cached) stat answers both existence and type
+        mode = _cached_mode(path)
+        if mode is None:
             return False, f"Path does not exist: {path}"
 
-        if path_type == "file" and not os.path.isfile(path):
+        if path_type == "file" and not stat.S_ISREG(mode):
             return False, f"Path is not a file: {path}"
 
-        if path_type == "directory" and not os.path.isdir(path):
+        if path_type == "directory" and not stat.S_ISDIR(mode):
             return False, f"Path is not a directory: {path}"
     else:
         # Check parent directory exists
@@ -379,9 +511,10 @@ def validate_path(path: str, path_type: str = "file", must_exist: bool = True) -
 
 
 def convert_paths_in_dict(data: dict, base_dir: Optional[str] = None, path_keys: Optional[list] = None,
-                          all_values_are_paths_keys: Optional[list] = None) -> dict:
+                          all_values_are_paths_keys: Optional[list] = None,
+                          inplace: bool = False) -> dict:
     """
-    Recursively convert all path values in a dictionary to absolute paths.
+    Convert all path values in a (nested) dictionary to absolute paths.
 
     Args:
         data: Dictionary containing paths
@@ -389,51 +522,128 @@ def convert_paths_in_dict(data: dict, base_dir: Optional[str] = None, path_keys:
         path_keys: List of keys that contain paths (if None, uses default list)
         all_values_are_paths_keys: List of keys whose child dict has ALL values as paths
                                    (e.g., 'def_nml' where all values are path strings)
+        inplace: If True, rewrite the path strings inside data itself instead
+                 of building a copy (for dicts the caller owns, e.g. fresh
+                 from yaml.safe_load)
 
     Returns:
-        Dictionary with converted paths
+        Dictionary with converted paths (data itself when inplace)
     """
-    if path_keys is None:
-        path_keys = [
-            "root_dir", "basedir", "fulllist", "model_namelist",
-            "reference_nml", "simulation_nml", "statistics_nml", "figure_nml",
-            "def_nml_path", "data_path", "file_path", "output_dir"
-        ]
-
-    if all_values_are_paths_keys is None:
-        all_values_are_paths_keys = ["def_nml"]
+    # Freeze caller lists once for O(1) membership tests
+    path_keys = _CONVERT_PATH_KEYS if path_keys is None else _as_frozenset(path_keys)
+    all_values_are_paths_keys = (
+        _ALL_PATHS_KEYS if all_values_are_paths_keys is None
+        else _as_frozenset(all_values_are_paths_keys)
+    )
 
     if not isinstance(data, dict):
         return data
 
+    # Resolve the default once instead of in every to_absolute_path() call
+    if base_dir is None:
+        base_dir = get_openbench_root()
+
+    if inplace:
+        _convert_paths_inplace(data, base_dir, path_keys, all_values_are_paths_keys)
+        return data
+
+    # Walk nested dicts with an explicit stack of (source, copy) pairs rather
+    # than recursion; each copy is inserted into its parent before it is
+    # filled, so key order matches the input
+    # Most keys are neither kind of path key; one lookup in the union sends
+    # them straight to the container checks below
+    special_keys = path_keys | all_values_are_paths_keys
+
     result = {}
-    for key, value in data.items():
-        # Special handling for sections where ALL values are paths (like def_nml)
-        if key in all_values_are_paths_keys and isinstance(value, dict):
-            result[key] = {
-                k: to_absolute_path(v, base_dir) if isinstance(v, str) and v else v
-                for k, v in value.items()
-            }
-        elif isinstance(value, dict):
-            result[key] = convert_paths_in_dict(value, base_dir, path_keys, all_values_are_paths_keys)
-        elif isinstance(value, list):
-            result[key] = [
-                convert_paths_in_dict(item, base_dir, path_keys, all_values_are_paths_keys) if isinstance(item, dict) else item
-                for item in value
-            ]
-        elif isinstance(value, str) and key in path_keys and value:
-            result[key] = to_absolute_path(value, base_dir)
-        else:
-            result[key] = value
+    stack = [(data, result)]
+    while stack:
+        source, target = stack.pop()
+        for key, value in source.items():
+            if key in special_keys:
+                # Special handling for sections where ALL values are paths (like def_nml)
+                if key in all_values_are_paths_keys and isinstance(value, dict):
+                    target[key] = {
+                        k: to_absolute_path(v, base_dir) if isinstance(v, str) and v else v
+                        for k, v in value.items()
+                    }
+                    continue
+                if isinstance(value, str) and key in path_keys:
+                    target[key] = to_absolute_path(value, base_dir) if value else value
+                    continue
+
+            if isinstance(value, dict):
+                target[key] = child = {}
+                stack.append((value, child))
+            elif isinstance(value, list):
+                items = target[key] = []
+                for item in value:
+                    if isinstance(item, dict):
+                        child = {}
+                        stack.append((item, child))
+                        item = child
+                    items.append(item)
+            else:
+                target[key] = value
 
     return result
 
 
+def _convert_paths_inplace(data: dict, base_dir: str, path_keys: frozenset,
+                           all_values_are_paths_keys: frozenset) -> None:
+    """
+    In-place variant of convert_paths_in_dict().
+
+    Containers are reused, except that one reached a second time (shared
+    through a YAML anchor) is replaced by a shallow copy. As with the
+    copying walk, every container then has a single parent: editing one
+    section never changes another, and yaml.dump writes no aliases.
+    """
+    special_keys = path_keys | all_values_are_paths_keys
+    seen = set()
+
+    def own(container):
+        """Return container, or a shallow copy if it was reached before."""
+        if id(container) in seen:
+            container = container.copy()
+        seen.add(id(container))
+        return container
+
+    stack = [own(data)]
+    while stack:
+        node = stack.pop()
+        for key, value in node.items():
+            if key in special_keys:
+                if key in all_values_are_paths_keys and isinstance(value, dict):
+                    node[key] = value = own(value)
+                    for k, v in value.items():
+                        if isinstance(v, str) and v:
+                            value[k] = to_absolute_path(v, base_dir)
+                    continue
+                if isinstance(value, str) and key in path_keys:
+                    if value:
+                        node[key] = to_absolute_path(value, base_dir)
+                    continue
+
+            if isinstance(value, dict):
+                node[key] = value = own(value)
+                stack.append(value)
+            elif isinstance(value, list):
+                node[key] = value = own(value)
+                for index, item in enumerate(value):
+                    if isinstance(item, dict):
+                        value[index] = item = own(item)
+                        stack.append(item)
+
+
 def validate_paths_in_dict(data: dict, path_keys: Optional[list] = None,
                           all_values_are_paths_keys: Optional[list] = None) -> list:
     """
     Validate all paths in a dictionary.
 
+    Absolute paths (e.g. from convert_paths_in_dict, which already
+    normalizes them) are checked as given; only relative ones go through
+    os.path.normpath.
+
     Args:
         data: Dictionary containing paths
         path_keys: List of keys that contain paths
@@ -443,22 +653,26 @@ def validate_paths_in_dict(data: dict, path_keys: Optional[list] = None,
     Returns:
         List of (key, path, error_message) tuples for invalid paths
     """
-    if path_keys is None:
-        path_keys = [
-            "root_dir", "basedir", "fulllist", "model_namelist",
-            "reference_nml", "simulation_nml", "statistics_nml", "figure_nml"
-        ]
-
-    if all_values_are_paths_keys is None:
-        all_values_are_paths_keys = ["def_nml"]
+    path_keys = _VALIDATE_PATH_KEYS if path_keys is None else _as_frozenset(path_keys)
+    all_values_are_paths_keys = (
+        _ALL_PATHS_KEYS if all_values_are_paths_keys is None
+        else _as_frozenset(all_values_are_paths_keys)
+    )
 
     errors = []
-
-    def _validate_recursive(d, prefix=""):
-        if not isinstance(d, dict):
-            return
-
-        for key, value in d.items():
+    if not isinstance(data, dict):
+        return errors
+
+    # A new pass: files created since the last one must be seen
+    clear_stat_cache()
+
+    # Depth-first walk with a stack of (key prefix, items iterator) instead of
+    # recursion; a parent's iterator resumes after its child dict is done, so
+    # errors come out in document order
+    stack = [("", iter(data.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
             full_key = f"{prefix}.{key}" if prefix else key
 
             # Special handling for sections where ALL values are paths (like def_nml)
@@ -466,17 +680,21 @@ def validate_paths_in_dict(data: dict, path_keys: Optional[list] = None,
                 for sub_key, sub_value in value.items():
                     if isinstance(sub_value, str) and sub_value:
                         sub_full_key = f"{full_key}.{sub_key}"
-                        is_valid, error = validate_path(sub_value, "file")
+                        is_valid, error = validate_path(
+                            sub_value, "file", normalize=not os.path.isabs(sub_value))
                         if not is_valid:
                             errors.append((sub_full_key, sub_value, error))
             elif isinstance(value, dict):
-                _validate_recursive(value, full_key)
+                stack.append((full_key, iter(value.items())))
+                break
             elif isinstance(value, str) and key in path_keys and value:
                 # Determine path type
-                path_type = "directory" if key in ["root_dir", "basedir", "output_dir"] else "file"
-                is_valid, error = validate_path(value, path_type)
+                path_type = "directory" if key in _DIRECTORY_KEYS else "file"
+                is_valid, error = validate_path(
+                    value, path_type, normalize=not os.path.isabs(value))
                 if not is_valid:
                     errors.append((full_key, value, error))
+        else:
+            stack.pop()
 
-    _validate_recursive(data)
     return errors
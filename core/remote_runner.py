@@ -8,18 +8,27 @@ remotely using SSHManager for file transfer and command execution.
 
 import os
 import re
+import secrets
 import shlex
 import tempfile
 import threading
-import time
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 
 from PySide6.QtCore import QThread, Signal
 
+from core.path_utils import quote_remote_path
 from core.ssh_manager import SSHManager, SSHConnectionError
 from core.runner import RunnerStatus, RunnerProgress
 
+# Log parsing tables for RemoteRunner._parse_progress(), which runs on every
+# line of remote output
+_VARIABLE_KEYWORDS = ("Processing", "Evaluating", "processing", "evaluating")
+_GROUPBY_TYPES = ("igbp", "pft", "climate", "landcover")
+_REF_RE = re.compile(r'[-\s]ref:\s*(\S+)')
+_SIM_RE = re.compile(r'[-\s]sim:\s*(\S+)')
+_DONE_COMPARISON_RE = re.compile(r'done running\s+(\w+)\s+comparison')
+
 
 class RemoteRunner(QThread):
     """Thread for running OpenBench evaluation on a remote server.
@@ -42,6 +51,7 @@ class RemoteRunner(QThread):
     # Signals - same interface as EvaluationRunner
     progress_updated = Signal(object)  # RunnerProgress
     log_message = Signal(str)
+    log_batch = Signal(list)  # Remote output lines received together
     finished_signal = Signal(bool, str)  # success, message
 
     def __init__(
@@ -243,14 +253,14 @@ class RemoteRunner(QThread):
             True if successful, False otherwise
         """
         try:
-            # Create temp directory under /tmp with unique name
-            timestamp = int(time.time())
-            temp_name = f"openbench_wizard_{timestamp}"
-            self._remote_temp_dir = f"/tmp/{temp_name}"
+            # Create temp directory under /tmp with a random name; without -p
+            # mkdir fails instead of sharing a directory with another run
+            temp_name = f"openbench_wizard_{secrets.token_hex(8)}"
+            temp_dir = f"/tmp/{temp_name}"
 
-            quoted_dir = shlex.quote(self._remote_temp_dir)
+            quoted_dir = shlex.quote(temp_dir)
             stdout, stderr, exit_code = self._ssh_manager.execute(
-                f"mkdir -p {quoted_dir}",
+                f"mkdir {quoted_dir}",
                 timeout=30
             )
 
@@ -260,6 +270,9 @@ class RemoteRunner(QThread):
                 self.finished_signal.emit(False, error_msg)
                 return False
 
+            # Only set once created, so cleanup never removes a directory
+            # this run does not own
+            self._remote_temp_dir = temp_dir
             self.log_message.emit(f"Created remote directory: {self._remote_temp_dir}")
             return True
 
@@ -304,20 +317,31 @@ class RemoteRunner(QThread):
         Args:
             config_dir: Local directory containing config files
         """
+        files = []
         try:
             # Upload any additional .yaml/.yml/.json files in the config directory
-            for filename in os.listdir(config_dir):
-                if filename.endswith(('.yaml', '.yml', '.json')):
-                    local_path = os.path.join(config_dir, filename)
-                    if os.path.isfile(local_path) and local_path != self.config_path:
-                        remote_path = f"{self._remote_temp_dir}/{filename}"
-                        try:
-                            self._ssh_manager.upload_file(local_path, remote_path)
-                            self.log_message.emit(f"Uploaded: {filename}")
-                        except Exception as e:
-                            self.log_message.emit(f"Warning: Could not upload {filename}: {e}")
+            # DirEntry.is_file() reuses the type from the directory listing
+            with os.scandir(config_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(('.yaml', '.yml', '.json')):
+                        if entry.is_file() and entry.path != self.config_path:
+                            files.append((entry.path, f"{self._remote_temp_dir}/{entry.name}"))
         except Exception as e:
             self.log_message.emit(f"Warning: Could not scan config directory: {e}")
+            return
+
+        # Transfers overlap so each file doesn't cost a full round-trip.
+        # Only the main config is size-checked after upload; these are
+        # supporting files and skip the extra stat
+        try:
+            for local_path, _, error in self._ssh_manager.upload_files(files, confirm=False):
+                filename = os.path.basename(local_path)
+                if error is None:
+                    self.log_message.emit(f"Uploaded: {filename}")
+                else:
+                    self.log_message.emit(f"Warning: Could not upload {filename}: {error}")
+        except Exception as e:
+            self.log_message.emit(f"Warning: Could not upload related files: {e}")
 
     def _execute_remote_openbench(self) -> tuple:
         """Execute OpenBench on the remote server.
@@ -334,67 +358,70 @@ class RemoteRunner(QThread):
 
         # Build the command with unbuffered output for real-time logging
         # PYTHONUNBUFFERED=1 ensures output is not buffered
+        run = (
+            f"cd {quote_remote_path(openbench_path)} && PYTHONUNBUFFERED=1 "
+            f"{quote_remote_path(python_path)} -u {quote_remote_path(openbench_script)} "
+            f"{quote_remote_path(self._remote_config_path)}"
+        )
         if conda_env:
+            activate = f"conda activate {shlex.quote(conda_env)}"
             # Derive conda base from python path (e.g., /path/to/miniconda3/bin/python -> /path/to/miniconda3)
             # This works for paths like: .../miniconda3/bin/python or .../miniconda3/envs/myenv/bin/python
             conda_base_match = re.search(r'(.*?/(?:miniconda|miniforge|anaconda|mambaforge)[^/]*)', python_path)
             if conda_base_match:
-                conda_base = conda_base_match.group(1)
-                cmd = f"source {conda_base}/etc/profile.d/conda.sh && conda activate {conda_env} && cd {openbench_path} && PYTHONUNBUFFERED=1 {python_path} -u {openbench_script} {self._remote_config_path}"
+                conda_sh = f"{conda_base_match.group(1)}/etc/profile.d/conda.sh"
+                cmd = f"source {quote_remote_path(conda_sh)} && {activate} && {run}"
             else:
                 # Fallback: try using bash login shell to get conda in PATH
-                cmd = f"bash -l -c 'conda activate {conda_env} && cd {openbench_path} && PYTHONUNBUFFERED=1 {python_path} -u {openbench_script} {self._remote_config_path}'"
+                cmd = f"bash -l -c {shlex.quote(f'{activate} && {run}')}"
         else:
-            cmd = f"cd {openbench_path} && PYTHONUNBUFFERED=1 {python_path} -u {openbench_script} {self._remote_config_path}"
+            cmd = run
 
         self.log_message.emit(f"Executing: {cmd}")
 
         # Execute and stream output
         try:
             progress = self.PROGRESS_INIT
-            exit_code = 0
 
-            # Use execute_stream to get real-time output
-            for line in self._ssh_manager.execute_stream(cmd):
+            # Stream output a received chunk at a time so a burst of lines
+            # costs one log and one progress signal instead of two per line
+            stream = self._ssh_manager.execute_stream_batches(cmd)
+            while True:
+                try:
+                    chunk = next(stream)
+                except StopIteration as finished:
+                    # The stream returns the exit status of the remote command
+                    exit_code = finished.value
+                    break
+
                 # Check for stop request
                 if self._is_stop_requested():
                     # Try to kill remote process
                     self._kill_remote_process()
                     return (False, "Stopped by user")
 
-                line = line.rstrip('\n\r')
-                if line:
-                    self.log_message.emit(line)
-
-                    # Parse progress from log
-                    progress, var, stage = self._parse_progress(line, progress)
-                    self._emit_progress(
-                        RunnerStatus.RUNNING,
-                        progress,
-                        f"{var} - {stage}" if var else "Processing",
-                        var,
-                        stage,
-                        line
-                    )
-
-            # Get exit code from the generator (returned by execute_stream)
-            # Note: The generator's return value is the exit code
-            # We need to check if process completed successfully
-            # Since execute_stream is a generator, we can check if there was an error
-            # by examining the last line or checking for error patterns
-
-            # Verify completion by checking for error patterns in the logs
-            # A more robust check: try to get the exit status
-            stdout, stderr, exit_code = self._ssh_manager.execute(
-                "echo $?",  # Get last exit code
-                timeout=10
-            )
-
-            # This won't work reliably since we're in a new shell context
-            # Instead, we'll re-run with exit status capture
-            # For now, assume success if no exception occurred
-            # and we received output
+                lines = []
+                for line in chunk:
+                    line = line.rstrip('\n\r')
+                    if line:
+                        lines.append(line)
+                        # Parse progress from log
+                        progress, var, stage = self._parse_progress(line, progress)
+                if not lines:
+                    continue
+
+                self.log_batch.emit(lines)
+                self._emit_progress(
+                    RunnerStatus.RUNNING,
+                    progress,
+                    f"{var} - {stage}" if var else "Processing",
+                    var,
+                    stage,
+                    lines[-1]
+                )
 
+            if exit_code != 0:
+                return (False, f"OpenBench exited with code {exit_code}")
             return (True, "Completed")
 
         except SSHConnectionError as e:
@@ -447,9 +474,9 @@ class RemoteRunner(QThread):
 
         # Detect variable being processed
         if "processing" in line_lower or "evaluating" in line_lower:
-            for keyword in ["Processing", "Evaluating", "processing", "evaluating"]:
+            for keyword in _VARIABLE_KEYWORDS:
                 if keyword in line:
-                    parts = line.split(keyword)
+                    parts = line.split(keyword, 2)
                     if len(parts) > 1:
                         remaining = parts[1].strip()
                         if remaining:
@@ -462,7 +489,7 @@ class RemoteRunner(QThread):
         # Detect reference/simulation source being processed
         if "ref_source" in line_lower or "reference" in line_lower or " ref:" in line_lower:
             if " ref:" in line:
-                match = re.search(r'[-\s]ref:\s*(\S+)', line)
+                match = _REF_RE.search(line)
                 if match:
                     self._current_ref = match.group(1).strip(',:')
             else:
@@ -472,7 +499,7 @@ class RemoteRunner(QThread):
 
         if "sim_source" in line_lower or "simulation" in line_lower or " sim:" in line_lower:
             if " sim:" in line:
-                match = re.search(r'[-\s]sim:\s*(\S+)', line)
+                match = _SIM_RE.search(line)
                 if match:
                     self._current_sim = match.group(1).strip(',:')
             else:
@@ -486,7 +513,7 @@ class RemoteRunner(QThread):
         elif "comparison" in line_lower or "groupby" in line_lower:
             stage = "Comparison"
             if "done running" in line_lower and "comparison" in line_lower:
-                match = re.search(r'done running\s+(\w+)\s+comparison', line_lower)
+                match = _DONE_COMPARISON_RE.search(line_lower)
                 if match:
                     comp_name = match.group(1)
                     if comp_name not in self._completed_comparison_tasks:
@@ -496,22 +523,25 @@ class RemoteRunner(QThread):
 
         # Detect task completions
         task_completed = False
+        finished = "completed" in line_lower or "finished" in line_lower
+        done = finished or "done" in line_lower
 
-        if stage == "Evaluation" and ("completed" in line_lower or "finished" in line_lower or "done" in line_lower):
+        if stage == "Evaluation" and done:
             task_key = (self._current_variable, self._current_ref, self._current_sim)
             if task_key not in self._completed_eval_tasks and self._current_variable:
                 self._completed_eval_tasks.add(task_key)
                 task_completed = True
 
         # Groupby task completion
-        for groupby_type in ["igbp", "pft", "climate", "landcover"]:
-            if groupby_type in line_lower and ("completed" in line_lower or "finished" in line_lower or "done" in line_lower):
-                task_key = (self._current_variable, groupby_type)
-                if task_key not in self._completed_groupby_tasks:
-                    self._completed_groupby_tasks.add(task_key)
-                    task_completed = True
-
-        if stage == "Statistics" and ("completed" in line_lower or "finished" in line_lower):
+        if done:
+            for groupby_type in _GROUPBY_TYPES:
+                if groupby_type in line_lower:
+                    task_key = (self._current_variable, groupby_type)
+                    if task_key not in self._completed_groupby_tasks:
+                        self._completed_groupby_tasks.add(task_key)
+                        task_completed = True
+
+        if stage == "Statistics" and finished:
             comp_name = self._current_variable or "comparison"
             if comp_name not in self._completed_comparison_tasks:
                 self._completed_comparison_tasks.add(comp_name)
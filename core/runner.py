@@ -14,6 +14,8 @@ from enum import Enum
 
 from PySide6.QtCore import QObject, Signal, QThread
 
+from core.path_utils import get_openbench_root
+
 
 class RunnerStatus(Enum):
     """Runner status enum."""
@@ -409,6 +411,7 @@ class EvaluationRunner(QThread):
             config_file = self._get_config_file_path()
             with open(config_file, 'w', encoding='utf-8') as f:
                 f.write(path)
+            get_openbench_root.cache_clear()
         except Exception as e:
             self.log_message.emit(f"Warning: Could not save OpenBench path: {e}")
 
@@ -9,8 +9,10 @@ import os
 import re
 import shlex
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Tuple, List, Callable, Generator
+from typing import Optional, Tuple, List, Set, Callable, Generator, Iterable
 
 import paramiko
 from paramiko import SSHClient, RSAKey, SSHException
@@ -181,6 +183,10 @@ class InteractiveHostKeyPolicy(paramiko.MissingHostKeyPolicy):
 class SSHManager:
     """Manage SSH connections, file transfer, and remote command execution."""
 
+    # Concurrent SFTP sessions used by upload_files(); each one is a channel
+    # on the connection, so stay well below sshd's default MaxSessions of 10
+    MAX_UPLOAD_WORKERS = 4
+
     def __init__(
         self,
         timeout: int = 30,
@@ -201,6 +207,8 @@ class SSHManager:
         """
         self._client: Optional[SSHClient] = None
         self._sftp: Optional[paramiko.SFTPClient] = None
+        # Remote directories known to exist, so uploads skip the stat round-trips
+        self._remote_dirs: Set[str] = set()
         self._timeout = timeout
         self._host = ""
         self._user = ""
@@ -317,6 +325,7 @@ class SSHManager:
             except Exception:
                 pass
             self._sftp = None
+        self._remote_dirs.clear()
 
         if self._client:
             try:
@@ -462,7 +471,12 @@ class SSHManager:
             return self._jump_client
         return self._client
 
-    def execute(self, command: str, timeout: Optional[int] = None) -> Tuple[str, str, int]:
+    def execute(
+        self,
+        command: str,
+        timeout: Optional[int] = None,
+        stdin_data: Optional[str] = None
+    ) -> Tuple[str, str, int]:
         """Execute command on remote server.
 
         Uses the active client (jump client if connected, otherwise main client).
@@ -470,6 +484,8 @@ class SSHManager:
         Args:
             command: Command to execute
             timeout: Command timeout in seconds
+            stdin_data: Optional text written to the command's stdin, which is
+                then closed (e.g. a script for ``python3 -``)
 
         Returns:
             Tuple of (stdout, stderr, exit_code)
@@ -486,6 +502,10 @@ class SSHManager:
                 command,
                 timeout=timeout or self._timeout
             )
+            if stdin_data is not None:
+                stdin.write(stdin_data)
+                stdin.flush()
+                stdin.channel.shutdown_write()
             exit_code = stdout.channel.recv_exit_status()
             return (
                 stdout.read().decode('utf-8', errors='replace'),
@@ -511,6 +531,33 @@ class SSHManager:
         Yields:
             Lines of output (from both stdout and stderr)
 
+        Returns:
+            Exit code
+        """
+        batches = self.execute_stream_batches(command)
+        while True:
+            try:
+                lines = next(batches)
+            except StopIteration as stop:
+                return stop.value
+            for line in lines:
+                if callback:
+                    callback(line)
+                yield line
+
+    def execute_stream_batches(self, command: str) -> Generator[List[str], None, int]:
+        """Execute command and stream output a received chunk at a time.
+
+        Like execute_stream(), but yields all lines of each chunk read from
+        the channel together, so consumers can handle a burst of output at
+        once without holding back lines that arrive alone.
+
+        Args:
+            command: Command to execute
+
+        Yields:
+            Lists of output lines (from both stdout and stderr)
+
         Returns:
             Exit code
         """
@@ -534,32 +581,20 @@ class SSHManager:
 
             if channel.recv_ready():
                 data = channel.recv(4096).decode('utf-8', errors='replace')
-                for line in data.splitlines(keepends=True):
-                    if callback:
-                        callback(line)
-                    yield line
+                yield data.splitlines(keepends=True)
 
             if channel.recv_stderr_ready():
                 data = channel.recv_stderr(4096).decode('utf-8', errors='replace')
-                for line in data.splitlines(keepends=True):
-                    if callback:
-                        callback(line)
-                    yield line
+                yield data.splitlines(keepends=True)
 
         # Read any remaining data after exit
         while channel.recv_ready():
             data = channel.recv(4096).decode('utf-8', errors='replace')
-            for line in data.splitlines(keepends=True):
-                if callback:
-                    callback(line)
-                yield line
+            yield data.splitlines(keepends=True)
 
         while channel.recv_stderr_ready():
             data = channel.recv_stderr(4096).decode('utf-8', errors='replace')
-            for line in data.splitlines(keepends=True):
-                if callback:
-                    callback(line)
-                yield line
+            yield data.splitlines(keepends=True)
 
         return channel.recv_exit_status()
 
@@ -579,19 +614,96 @@ class SSHManager:
             self._sftp = self._client.open_sftp()
         return self._sftp
 
-    def upload_file(self, local_path: str, remote_path: str) -> None:
+    def upload_file(self, local_path: str, remote_path: str, confirm: bool = True) -> None:
         """Upload a file to remote server.
 
         Args:
             local_path: Local file path
             remote_path: Remote destination path
+            confirm: Stat the uploaded file to check its size, at the cost
+                     of one more round-trip
         """
         sftp = self._get_sftp()
         # Ensure remote directory exists
         remote_dir = os.path.dirname(remote_path)
         if remote_dir:
             self._ensure_remote_dir(remote_dir)
-        sftp.put(local_path, remote_path)
+        try:
+            sftp.put(local_path, remote_path, confirm=confirm)
+        except FileNotFoundError:
+            if not remote_dir:
+                raise
+            # The directory may have been removed since it was last seen
+            self._remote_dirs.clear()
+            self._ensure_remote_dir(remote_dir)
+            sftp.put(local_path, remote_path, confirm=confirm)
+
+    def upload_files(
+        self,
+        files: Iterable[Tuple[str, str]],
+        max_workers: int = MAX_UPLOAD_WORKERS,
+        confirm: bool = True
+    ) -> Generator[Tuple[str, str, Optional[Exception]], None, None]:
+        """Upload several files, overlapping the transfers.
+
+        Each worker thread opens its own SFTP session, since one session
+        handles a single request at a time. Fewer than two files are
+        uploaded serially with upload_file().
+
+        Args:
+            files: (local_path, remote_path) pairs
+            max_workers: Maximum concurrent uploads, capped at MAX_UPLOAD_WORKERS
+            confirm: Stat each uploaded file to check its size, see upload_file()
+
+        Yields:
+            (local_path, remote_path, error) as each upload finishes,
+            with error None on success
+        """
+        files = list(files)
+        workers = min(max_workers, self.MAX_UPLOAD_WORKERS, len(files))
+        if workers < 2:
+            for local_path, remote_path in files:
+                try:
+                    self.upload_file(local_path, remote_path, confirm=confirm)
+                except Exception as e:
+                    yield local_path, remote_path, e
+                else:
+                    yield local_path, remote_path, None
+            return
+
+        # Create destination directories up front so workers don't race on them
+        for remote_dir in {os.path.dirname(remote_path) for _, remote_path in files}:
+            if remote_dir:
+                self._ensure_remote_dir(remote_dir)
+
+        client = self._client
+        worker_state = threading.local()
+        sessions: List[paramiko.SFTPClient] = []
+        sessions_lock = threading.Lock()
+
+        def put(local_path: str, remote_path: str) -> None:
+            sftp = getattr(worker_state, "sftp", None)
+            if sftp is None:
+                sftp = worker_state.sftp = client.open_sftp()
+                with sessions_lock:
+                    sessions.append(sftp)
+            sftp.put(local_path, remote_path, confirm=confirm)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(put, local_path, remote_path): (local_path, remote_path)
+                    for local_path, remote_path in files
+                }
+                for future in as_completed(futures):
+                    local_path, remote_path = futures[future]
+                    yield local_path, remote_path, future.exception()
+        finally:
+            for sftp in sessions:
+                try:
+                    sftp.close()
+                except Exception:
+                    pass
 
     def download_file(self, remote_path: str, local_path: str) -> None:
         """Download a file from remote server.
@@ -633,6 +745,8 @@ class SSHManager:
     def _ensure_remote_dir(self, remote_dir: str) -> None:
         """Ensure remote directory exists.
 
+        Directories already seen on this connection are not checked again.
+
         Args:
             remote_dir: Remote directory path
         """
@@ -643,10 +757,13 @@ class SSHManager:
             if not d:
                 continue
             path = f"{path}/{d}"
+            if path in self._remote_dirs:
+                continue
             try:
                 sftp.stat(path)
             except FileNotFoundError:
                 sftp.mkdir(path)
+            self._remote_dirs.add(path)
 
     def _get_home_dir(self) -> str:
         """Get remote home directory.
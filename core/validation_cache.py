@@ -0,0 +1,162 @@
+# core/validation_cache.py
+# -*- coding: utf-8 -*-
+"""
+Persistent cache of data file inspections.
+
+Saves inspection results to ~/.openbench_wizard/validation_cache.json so that
+re-validating an unchanged configuration does not open every file again.
+
+Usage:
+    Entries are keyed by absolute path and stamped with the file's
+    modification time and size; an entry is only used while both still
+    match. DataValidator looks files up here before inspecting them and
+    saves the cache at the end of validate_all().
+
+    Example:
+        cache = ValidationCache()
+        stamp = cache.stamp(path)
+        info = cache.get(path, stamp)
+        if info is None:
+            info = inspect(path)
+            cache.put(path, stamp, info)
+        cache.save()
+"""
+
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from core.path_utils import write_in_dir
+
+
+def _to_json(value: Any) -> Any:
+    """Convert numpy scalars left in inspection results to plain Python."""
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ValidationCache:
+    """Inspection results of local data files, kept across runs."""
+
+    DEFAULT_PATH = os.path.expanduser("~/.openbench_wizard/validation_cache.json")
+
+    # Bump when the shape of inspection results changes
+    VERSION = 2
+
+    # Oldest entries are dropped beyond this many files
+    MAX_ENTRIES = 10000
+
+    def __init__(self, cache_path: Optional[str] = None):
+        """
+        Initialize and load the cache.
+
+        Args:
+            cache_path: Path to the cache file.
+                        Defaults to ~/.openbench_wizard/validation_cache.json
+        """
+        self._cache_path = cache_path or self.DEFAULT_PATH
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        """Load entries from file, starting empty if it is missing or invalid."""
+        try:
+            with open(self._cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == self.VERSION:
+            entries = data.get("entries")
+            if isinstance(entries, dict):
+                self._entries = entries
+
+    def save(self):
+        """Write the cache if it changed, replacing the file atomically.
+
+        The cache is only an optimization, so write errors are ignored.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"version": self.VERSION, "entries": dict(self._entries)}
+            self._dirty = False
+
+        try:
+            cache_dir = os.path.dirname(self._cache_path)
+            fd, tmp_path = write_in_dir(
+                cache_dir, lambda: tempfile.mkstemp(dir=cache_dir or ".", suffix=".tmp"))
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, default=_to_json)
+                os.replace(tmp_path, self._cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            pass
+
+    @staticmethod
+    def stamp(path: str) -> Optional[Tuple[int, int]]:
+        """
+        Get the (mtime_ns, size) stamp of a file.
+
+        Args:
+            path: File path
+
+        Returns:
+            Stamp tuple, or None if the file cannot be stat'ed
+        """
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def get(self, path: str, stamp: Optional[Tuple[int, int]]) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached inspection of a file.
+
+        Args:
+            path: File path
+            stamp: Current stamp of the file, see stamp()
+
+        Returns:
+            Inspection result, or None if missing or the file has changed
+        """
+        if stamp is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(os.path.abspath(path))
+        if entry is None or tuple(entry.get("stamp", ())) != tuple(stamp):
+            return None
+        return entry.get("info")
+
+    def put(self, path: str, stamp: Optional[Tuple[int, int]], info: Dict[str, Any]):
+        """
+        Store the inspection of a file.
+
+        Args:
+            path: File path
+            stamp: Stamp of the file taken before it was inspected
+            info: Inspection result
+        """
+        if stamp is None:
+            return
+        key = os.path.abspath(path)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = {"stamp": list(stamp), "info": info}
+            while len(self._entries) > self.MAX_ENTRIES:
+                del self._entries[next(iter(self._entries))]
+            self._dirty = True
+
+    def clear(self):
+        """Forget all entries."""
+        with self._lock:
+            self._dirty = self._dirty or bool(self._entries)
+            self._entries.clear()
@@ -62,6 +62,13 @@ class TestValidationDataClasses:
         assert report.passed_count == 1
         assert report.failed_count == 1
 
+    def test_results_use_slots(self):
+        """Test result objects carry no per-instance __dict__."""
+        check = ValidationCheck("file", True, "OK")
+        result = SourceValidationResult("ET", "GLEAM", [check])
+        for obj in (check, result, DataValidationReport([result])):
+            assert not hasattr(obj, "__dict__")
+
 
 from unittest.mock import patch
 from core.data_validator import FilePathGenerator
@@ -70,6 +77,10 @@ from core.data_validator import FilePathGenerator
 class TestFilePathGenerator:
     """Test file path generation based on data_groupby."""
 
+    def setup_method(self):
+        """Drop directory listings cached by earlier tests."""
+        FilePathGenerator.clear_cache()
+
     def test_single_groupby(self):
         """Test Single groupby - one file."""
         gen = FilePathGenerator(
@@ -169,6 +180,25 @@ class TestFilePathGenerator:
         paths = gen.get_sample_paths()
         assert paths[0] == "/data/file_.nc"
 
+    def test_base_dir_resolved_once(self):
+        """Test the OpenBench root is looked up once per generator."""
+        with patch('core.data_validator.get_openbench_root', return_value="/ob") as mock_root:
+            gen = FilePathGenerator(
+                root_dir="./data",
+                sub_dir="ET",
+                prefix="et_",
+                suffix="",
+                data_groupby="Year",
+                syear=2000,
+                eyear=2020
+            )
+            with patch('glob.glob', return_value=[]) as mock_glob:
+                gen.get_sample_paths()
+                gen.get_sample_paths()
+        assert mock_root.call_count == 1
+        assert gen._get_base_dir() == os.path.join("/ob", "data", "ET")
+        mock_glob.assert_called_with(os.path.join("/ob", "data", "ET", "et_*.nc"))
+
     def test_glob_no_matches(self):
         """Test that empty list returned when no files match glob."""
         gen = FilePathGenerator(
@@ -184,6 +214,40 @@ class TestFilePathGenerator:
             paths = gen.get_sample_paths()
         assert len(paths) == 0
 
+    def test_glob_results_cached(self):
+        """Test generators with the same directory and pattern share one glob."""
+        mock_files = ["/data/et_2000.nc", "/data/et_2001.nc"]
+        with patch('glob.glob', return_value=mock_files) as mock_glob:
+            for _ in range(2):
+                gen = FilePathGenerator(
+                    root_dir="/data", sub_dir="", prefix="et_", suffix="",
+                    data_groupby="Year", syear=2000, eyear=2001
+                )
+                assert gen.get_sample_paths() == mock_files
+            FilePathGenerator.clear_cache()
+            gen.get_sample_paths()
+        assert mock_glob.call_count == 2
+
+    def test_scandir_listing_matches_glob(self, tmp_path):
+        """Test the scandir listing finds the same files glob would."""
+        import glob
+        for name in ("et_2001.nc", "et_2000.nc", "et_.nc", "et.nc", ".et_hidden.nc",
+                     "et_2000.nc.tmp", "le_2000.nc"):
+            (tmp_path / name).write_bytes(b"")
+        (tmp_path / "et_dir.nc").mkdir()
+        gen = FilePathGenerator(
+            root_dir=str(tmp_path), sub_dir="", prefix="et_", suffix="",
+            data_groupby="Year", syear=2000, eyear=2001
+        )
+        expected = sorted(glob.glob(os.path.join(str(tmp_path), "et_*.nc")))
+        expected.remove(os.path.join(str(tmp_path), "et_dir.nc"))
+
+        with patch('glob.glob', side_effect=AssertionError("glob used")):
+            paths = gen.get_sample_paths()
+
+        assert paths == [os.path.join(str(tmp_path), n) for n in ("et_.nc", "et_2000.nc", "et_2001.nc")]
+        assert paths == expected
+
     def test_glob_single_match(self):
         """Test glob returns single file."""
         gen = FilePathGenerator(
@@ -206,7 +270,7 @@ import tempfile
 import os
 from unittest.mock import Mock, patch, MagicMock
 import numpy as np
-from core.data_validator import LocalNetCDFValidator
+from core.data_validator import LocalNetCDFValidator, open_raw
 
 
 class TestLocalNetCDFValidator:
@@ -230,6 +294,19 @@ class TestLocalNetCDFValidator:
         assert check.passed is False
         assert "not found" in check.message.lower() or "File not found" in check.message
 
+    def test_check_files_exist_local(self, tmp_path):
+        """Test batched local existence check, with and without a directory scan."""
+        (tmp_path / "a.nc").write_bytes(b"")
+        (tmp_path / "sub.nc").mkdir()
+        paths = [str(tmp_path / name) for name in ("a.nc", "b.nc", "sub.nc")]
+
+        validator = LocalNetCDFValidator()
+        assert [c.passed for c in validator.check_files_exist(paths)] == [True, False, True]
+
+        validator.SCAN_THRESHOLD = 1
+        with patch('core.data_validator._path_exists', side_effect=AssertionError("stat used")):
+            assert [c.passed for c in validator.check_files_exist(paths)] == [True, False, True]
+
     def test_check_variable_exists(self):
         """Test variable check with mocked xarray."""
         validator = LocalNetCDFValidator()
@@ -268,7 +345,7 @@ class TestLocalNetCDFValidator:
 
         # Create mock time values that span 2000-2020
         import pandas as pd
-        time_values = pd.date_range('2000-01-01', '2020-12-31', freq='M').values
+        time_values = pd.date_range('2000-01-01', '2020-12-31', freq='MS').values
         mock_ds.__getitem__ = Mock(return_value=Mock(values=time_values))
         mock_ds.close = Mock()
 
@@ -287,7 +364,7 @@ class TestLocalNetCDFValidator:
 
         # Create mock time values that only span 2010-2015
         import pandas as pd
-        time_values = pd.date_range('2010-01-01', '2015-12-31', freq='M').values
+        time_values = pd.date_range('2010-01-01', '2015-12-31', freq='MS').values
         mock_ds.__getitem__ = Mock(return_value=Mock(values=time_values))
         mock_ds.close = Mock()
 
@@ -375,6 +452,201 @@ class TestLocalNetCDFValidator:
             assert check.passed is False
             assert "Lat/lon dimensions not found" in check.message or "not found" in check.message.lower()
 
+    def test_netcdf4_file_checks(self, tmp_path):
+        """Test all checks against a real NetCDF file read via netCDF4."""
+        netCDF4 = pytest.importorskip("netCDF4")
+        path = str(tmp_path / "sample.nc")
+        with netCDF4.Dataset(path, "w") as ds:
+            ds.createDimension("time", 3)
+            ds.createDimension("lat", 4)
+            ds.createDimension("lon", 5)
+            time = ds.createVariable("time", "f8", ("time",))
+            time.units = "days since 2000-01-01"
+            time[:] = [0, 3650, 7670]
+            ds.createVariable("lat", "f4", ("lat",))[:] = np.linspace(-60, 60, 4)
+            ds.createVariable("lon", "f4", ("lon",))[:] = np.linspace(-120, 120, 5)
+            ds.createVariable("ET", "f4", ("time", "lat", "lon"))
+
+        validator = LocalNetCDFValidator()
+
+        assert validator.check_variable(path, "ET").passed is True
+        check = validator.check_variable(path, "LE")
+        assert check.passed is False
+        assert "['ET']" in check.message
+
+        check = validator.check_time_range(path, 2000, 2020)
+        assert check.passed is True
+        assert "data 2000-2020" in check.message
+        assert validator.check_time_range(path, 1990, 2020).passed is False
+
+        assert validator.check_spatial_range(path, -45, 45, -90, 90).passed is True
+        assert validator.check_spatial_range(path, -90, 90, -90, 90).passed is False
+
+    def test_undecodable_time_fails(self, tmp_path):
+        """Test missing or undecodable units fail; only odd calendars are skipped."""
+        netCDF4 = pytest.importorskip("netCDF4")
+        validator = LocalNetCDFValidator()
+        cases = [
+            (None, "standard", False, "no units"),
+            ("months since 2000-01-01", "standard", False, "months since"),
+            ("months since 2000-01-01", "noleap", True, "non-standard calendar"),
+        ]
+        for fmt in ("NETCDF4", "NETCDF3_CLASSIC"):
+            for i, (units, calendar, passed, message) in enumerate(cases):
+                path = str(tmp_path / f"{fmt}_{i}.nc")
+                with netCDF4.Dataset(path, "w", format=fmt) as ds:
+                    ds.createDimension("time", 2)
+                    time = ds.createVariable("time", "f8", ("time",))
+                    time[:] = [0, 1]
+                    if units:
+                        time.units = units
+                    time.calendar = calendar
+
+                check = validator.check_time_range(path, 2000, 2020)
+                assert check.passed is passed
+                assert message in check.message
+                assert check.message.startswith("Time check skipped" if passed else "Time check failed")
+
+    def test_data_variable_not_taken_for_axis(self, tmp_path):
+        """Test a data variable named like an axis (e.g. "t") is not used as one."""
+        netCDF4 = pytest.importorskip("netCDF4")
+        validator = LocalNetCDFValidator()
+        for fmt in ("NETCDF4", "NETCDF3_CLASSIC"):
+            path = str(tmp_path / f"{fmt}.nc")
+            with netCDF4.Dataset(path, "w", format=fmt) as ds:
+                ds.createDimension("lat", 2)
+                ds.createDimension("lon", 2)
+                ds.createVariable("lat", "f4", ("lat",))[:] = [-10, 10]
+                ds.createVariable("lon", "f4", ("lon",))[:] = [-20, 20]
+                ds.createVariable("t", "f4", ("lat", "lon"))[:] = [[280, 290], [300, 310]]
+
+            check = validator.check_time_range(path, 2000, 2020)
+            assert check.passed is False
+            assert "Time dimension not found" in check.message
+            assert validator.inspect(path)["lat_range"] == [-10.0, 10.0]
+
+    def test_open_dataset_picks_reader_by_format(self, tmp_path):
+        """Test HDF5-based files open with h5py and classic files with netCDF4."""
+        netCDF4 = pytest.importorskip("netCDF4")
+        h5py = pytest.importorskip("h5py")
+        validator = LocalNetCDFValidator()
+        for fmt, expected in (("NETCDF4", h5py.File), ("NETCDF3_CLASSIC", netCDF4.Dataset)):
+            path = str(tmp_path / f"{fmt}.nc")
+            with netCDF4.Dataset(path, "w", format=fmt) as ds:
+                ds.createDimension("time", 6)
+                ds.createDimension("lat", 2)
+                time = ds.createVariable("time", "f8", ("time",))
+                time.units = "days since 2001-01-01"
+                time[:] = np.arange(6) * 400
+                ds.createVariable("lat", "f4", ("lat",))[:] = [-10, 10]
+                ds.createVariable("ET", "f4", ("time", "lat"))
+
+            ds = validator._open_dataset(path)
+            try:
+                assert isinstance(ds, expected)
+            finally:
+                ds.close()
+            info = validator.inspect(path)
+            assert info["variables"] == ["ET"]
+            assert info["time_range"] == [2001, 2006]
+            assert "lat_range" not in info
+
+    def test_xarray_fallback_decodes_raw_time(self, tmp_path):
+        """Test the undecoded xarray fallback still reports the time range."""
+        netCDF4 = pytest.importorskip("netCDF4")
+        path = str(tmp_path / "fallback.nc")
+        with netCDF4.Dataset(path, "w") as ds:
+            ds.createDimension("time", 3)
+            time = ds.createVariable("time", "f8", ("time",))
+            time.units = "days since 2000-01-01"
+            time.calendar = "noleap"
+            time[:] = [0, 365, 3650]
+
+        validator = LocalNetCDFValidator()
+        with patch.object(validator, "_open_dataset", side_effect=open_raw):
+            check = validator.check_time_range(path, 2000, 2010)
+        assert check.passed is True
+        assert "data 2000-2010" in check.message
+
+    def test_xarray_fallback_reads_coordinate_ends(self, tmp_path):
+        """Test the xarray fallback gets lat/lon bounds from lazy coordinates."""
+        netCDF4 = pytest.importorskip("netCDF4")
+        path = str(tmp_path / "fallback_grid.nc")
+        with netCDF4.Dataset(path, "w") as ds:
+            ds.createDimension("lat", 90)
+            ds.createDimension("lon", 180)
+            ds.createVariable("lat", "f4", ("lat",))[:] = np.linspace(89, -89, 90)
+            ds.createVariable("lon", "f4", ("lon",))[:] = np.linspace(-179, 179, 180)
+
+        validator = LocalNetCDFValidator()
+        ds = open_raw(path)
+        try:
+            lat = validator._coord_values(ds, "lat")
+            assert not lat._in_memory
+        finally:
+            ds.close()
+
+        with patch.object(validator, "_open_dataset", side_effect=open_raw):
+            info = validator.inspect(path)
+        assert info["lat_range"] == [-89.0, 89.0]
+        assert info["lon_range"] == [-179.0, 179.0]
+
+    def test_xarray_fallback_curvilinear_coordinates(self, tmp_path):
+        """Test the xarray fallback reads 2-D lat/lon named by "coordinates"."""
+        netCDF4 = pytest.importorskip("netCDF4")
+        path = str(tmp_path / "fallback_curvilinear.nc")
+        with netCDF4.Dataset(path, "w") as ds:
+            ds.createDimension("y", 3)
+            ds.createDimension("x", 2)
+            ds.createVariable("lat", "f4", ("y", "x"))[:] = [[-60, -60], [0, 0], [60, 60]]
+            ds.createVariable("lon", "f4", ("y", "x"))[:] = [[10, 20]] * 3
+            ds.createVariable("ET", "f4", ("y", "x")).coordinates = "lat lon"
+
+        validator = LocalNetCDFValidator()
+        with patch.object(validator, "_open_dataset", side_effect=open_raw):
+            info = validator.inspect(path)
+        assert info["variables"] == ["ET"]
+        assert info["lat_range"] == [-60.0, 60.0]
+        assert info["lon_range"] == [10.0, 20.0]
+
+    def test_fill_and_packing_applied_to_raw_coordinates(self, tmp_path):
+        """Test h5py and undecoded xarray reads mask _FillValue and unpack values."""
+        netCDF4 = pytest.importorskip("netCDF4")
+        path = str(tmp_path / "curvilinear.nc")
+        with netCDF4.Dataset(path, "w") as ds:
+            ds.createDimension("y", 2)
+            ds.createDimension("x", 3)
+            lat = ds.createVariable("lat", "f4", ("y", "x"), fill_value=-9999.0)
+            lat[:] = np.ma.masked_values([[-9999.0, 10.0, 20.0], [50.0, 70.0, -9999.0]], -9999.0)
+            lon = ds.createVariable("lon", "i2", ("y", "x"), fill_value=-32767)
+            lon.scale_factor = 0.01
+            lon.add_offset = 100.0
+            lon.set_auto_maskandscale(False)
+            lon[:] = [[-32767, -1000, 0], [1000, 2000, -32767]]
+            ds.createVariable("ET", "f4", ("y", "x")).coordinates = "lat lon"
+
+        validator = LocalNetCDFValidator()
+        info = validator.inspect(path)
+        assert info["lat_range"] == [10.0, 70.0]
+        assert info["lon_range"] == pytest.approx([90.0, 120.0])
+
+        # 1-D coordinates through the undecoded xarray fallback
+        path = str(tmp_path / "filled_axis.nc")
+        with netCDF4.Dataset(path, "w") as ds:
+            ds.createDimension("lat", 4)
+            ds.createDimension("lon", 3)
+            lat = ds.createVariable("lat", "f4", ("lat",), fill_value=-9999.0)
+            lat[:] = np.ma.masked_values([-9999.0, 10.0, 40.0, 70.0], -9999.0)
+            lon = ds.createVariable("lon", "i2", ("lon",))
+            lon.scale_factor = 0.5
+            lon.set_auto_maskandscale(False)
+            lon[:] = [-10, 0, 10]
+
+        with patch.object(validator, "_open_dataset", side_effect=open_raw):
+            info = validator.inspect(path)
+        assert info["lat_range"] == [10.0, 70.0]
+        assert info["lon_range"] == [-5.0, 5.0]
+
     def test_time_dims_list_exists(self):
         """Test that TIME_DIMS list is defined."""
         assert hasattr(LocalNetCDFValidator, 'TIME_DIMS')
@@ -394,10 +666,109 @@ class TestLocalNetCDFValidator:
         assert 'longitude' in LocalNetCDFValidator.LON_DIMS
 
 
+from core.data_validator import (
+    _coord_bounds, _decode_years, _gregorian_years, _time_bounds, _years_of
+)
+
+
+class TestCoordBounds:
+    """Test coordinate min/max helper."""
+
+    def test_monotonic_increasing_reads_ends(self):
+        """Test increasing axis returns its endpoints."""
+        assert _coord_bounds(np.arange(10)) == (0, 9)
+
+    def test_monotonic_decreasing_reads_ends(self):
+        """Test decreasing axis (e.g. lat 90 -> -90) returns ordered bounds."""
+        assert _coord_bounds(np.linspace(90, -90, 181)) == (-90, 90)
+
+    def test_non_monotonic_falls_back_to_full_scan(self):
+        """Test axis that is not monotonic at the ends uses a full min/max."""
+        values = np.array([1, 2, 100, -5, 4, 3])
+        assert _coord_bounds(values) == (-5, 100)
+
+    def test_monotonic_ends_alone_not_trusted(self):
+        """Test axes monotonic only at both ends still use a full min/max."""
+        wrapped_lon = np.concatenate([np.arange(0, 180), np.arange(-180, 0)])
+        assert _coord_bounds(wrapped_lon) == (-180, 179)
+        assert _coord_bounds(np.array([10, 20, 30, 25, 15, 5, 0, 1])) == (0, 30)
+
+    def test_time_bounds_read_ends(self):
+        """Test a long time axis is bounded by its end values."""
+        assert _time_bounds(np.arange(100.0)) == (0.0, 99.0)
+        assert _time_bounds(np.array([5.0, np.nan, 1.0])) == (1.0, 5.0)
+
+    def test_short_and_2d_arrays(self):
+        """Test short and 2-D arrays use a full min/max."""
+        assert _coord_bounds(np.array([3, 1, 2])) == (1, 3)
+        assert _coord_bounds(np.array([[1, 9], [4, -2]])) == (-2, 9)
+
+    def test_curvilinear_nan_fill_ignored(self):
+        """Test 2-D coordinates with NaN fill use a NaN-aware min/max."""
+        lat = np.array([[np.nan, -10.0, -5.0], [5.0, 10.0, np.nan]])
+        assert _coord_bounds(lat) == (-10.0, 10.0)
+        masked = np.ma.masked_invalid(lat)
+        assert _coord_bounds(masked) == (-10.0, 10.0)
+
+    def test_years_of_datetime64_and_cftime(self):
+        """Test years are read from datetime64 and cftime end values."""
+        ends = np.array(["1999-12-31", "2020-01-01"], dtype="datetime64[ns]")
+        assert _years_of(ends) == (1999, 2020)
+        cftime = pytest.importorskip("cftime")
+        ends = np.array([cftime.DatetimeNoLeap(1850, 1, 1), cftime.DatetimeNoLeap(2014, 12, 31)])
+        assert _years_of(ends) == (1850, 2014)
+        assert _years_of(np.array([0.0, 365.0])) is None
+
+    def test_gregorian_years_without_xarray(self):
+        """Test common CF units are decoded with datetime and match xarray."""
+        cases = [
+            ([0.0, 7670.0], "days since 2000-01-01", "standard", (2000, 2020)),
+            ([0.0, 87600.0], "hours since 1900-01-01 00:00:00", "gregorian", (1900, 1909)),
+            ([0.0, 3e9], "seconds since 1970-01-01T00:00:00Z", "proleptic_gregorian", (1970, 2065)),
+        ]
+        for values, units, calendar, expected in cases:
+            with patch("core.data_validator.xr.decode_cf") as mock_decode:
+                assert _decode_years(np.array(values), units, calendar) == expected
+            mock_decode.assert_not_called()
+
+    def test_gregorian_years_defers_to_cf_decoder(self):
+        """Test other calendars, units and pre-reform dates are left to xarray."""
+        ends = np.array([0.0, 7300.0])
+        assert _gregorian_years(ends, "days since 2000-01-01", "noleap") is None
+        assert _gregorian_years(ends, "months since 2000-01-01", "standard") is None
+        assert _gregorian_years(ends, "days since 1500-01-01", "standard") is None
+        assert _gregorian_years(np.array([np.nan, 1.0]), "days since 2000-01-01", "standard") is None
+        assert _decode_years(ends, "days since 2000-01-01", "noleap") == (2000, 2020)
+
+
 import json
+import subprocess
+import sys
 from core.data_validator import RemoteNetCDFValidator
 
 
+def test_inspect_script_bounds_wrapped_longitude(tmp_path):
+    """Test the remote script reads the full range of a wrapped longitude."""
+    netCDF4 = pytest.importorskip("netCDF4")
+    pytest.importorskip("xarray")
+    path = str(tmp_path / "wrapped.nc")
+    with netCDF4.Dataset(path, "w") as ds:
+        ds.createDimension("lat", 8)
+        ds.createDimension("lon", 360)
+        ds.createVariable("lat", "f4", ("lat",))[:] = [10, 20, 30, 25, 15, 5, 0, 1]
+        ds.createVariable("lon", "f4", ("lon",))[:] = np.concatenate(
+            [np.arange(0, 180), np.arange(-180, 0)]
+        )
+
+    proc = subprocess.run(
+        [sys.executable, "-c", RemoteNetCDFValidator.INSPECT_SCRIPT, path],
+        capture_output=True, text=True, check=True
+    )
+    result = json.loads(proc.stdout)
+    assert result["lat_range"] == [0.0, 30.0]
+    assert result["lon_range"] == [-180.0, 179.0]
+
+
 class TestRemoteNetCDFValidator:
     """Test remote NetCDF validation via SSH."""
 
@@ -433,10 +804,36 @@ class TestRemoteNetCDFValidator:
         assert check.passed is False
         assert "Remote check failed" in check.message
 
+    def test_check_files_exist_remote_single_call(self):
+        """Test several remote paths are checked with one SSH call."""
+        mock_ssh = Mock()
+        mock_ssh.execute.return_value = ("0\n2\n", "", 0)
+
+        validator = RemoteNetCDFValidator(mock_ssh)
+        checks = validator.check_files_exist(["~/a.nc", "/remote/b.nc", "/remote/c.nc"])
+
+        assert [c.passed for c in checks] == [True, False, True]
+        assert "File not found: /remote/b.nc" in checks[1].message
+        mock_ssh.execute.assert_called_once()
+        # "~/" stays expandable, as in check_file_exists
+        assert " ~/a.nc /remote/b.nc " in mock_ssh.execute.call_args[0][0]
+
+    def test_check_files_exist_remote_ssh_error(self):
+        """Test batched remote existence check reports SSH failures."""
+        mock_ssh = Mock()
+        mock_ssh.execute.side_effect = Exception("SSH connection failed")
+
+        validator = RemoteNetCDFValidator(mock_ssh)
+        checks = validator.check_files_exist(["/remote/a.nc", "/remote/b.nc"])
+
+        assert [c.passed for c in checks] == [False, False]
+        assert "Remote check failed" in checks[0].message
+
     def test_check_variable_remote(self):
         """Test remote variable check."""
         mock_ssh = Mock()
         result_json = json.dumps({
+            "path": "/remote/file.nc",
             "success": True,
             "variables": ["ET", "precipitation", "temperature"]
         })
@@ -451,6 +848,7 @@ class TestRemoteNetCDFValidator:
         """Test remote variable check when variable not found."""
         mock_ssh = Mock()
         result_json = json.dumps({
+            "path": "/remote/file.nc",
             "success": True,
             "variables": ["precipitation", "temperature"]
         })
@@ -467,6 +865,7 @@ class TestRemoteNetCDFValidator:
         """Test remote variable check when script fails."""
         mock_ssh = Mock()
         result_json = json.dumps({
+            "path": "/remote/file.nc",
             "success": False,
             "error": "xarray not installed"
         })
@@ -482,6 +881,7 @@ class TestRemoteNetCDFValidator:
         """Test remote time range check."""
         mock_ssh = Mock()
         result_json = json.dumps({
+            "path": "/remote/file.nc",
             "success": True,
             "time_range": [2000, 2020]
         })
@@ -496,6 +896,7 @@ class TestRemoteNetCDFValidator:
         """Test remote time range check when data doesn't cover required period."""
         mock_ssh = Mock()
         result_json = json.dumps({
+            "path": "/remote/file.nc",
             "success": True,
             "time_range": [2010, 2015]
         })
@@ -511,6 +912,7 @@ class TestRemoteNetCDFValidator:
         """Test remote time range check when no time dimension found."""
         mock_ssh = Mock()
         result_json = json.dumps({
+            "path": "/remote/file.nc",
             "success": True,
             "variables": ["ET"]
             # No time_range key
@@ -520,13 +922,14 @@ class TestRemoteNetCDFValidator:
         validator = RemoteNetCDFValidator(mock_ssh)
         check = validator.check_time_range("/remote/file.nc", 2000, 2020)
 
-        assert check.passed is False
-        assert "Time dimension not found" in check.message or "not found" in check.message.lower()
+        assert check.passed is True
+        assert check.message == "Time check skipped (no time dimension)"
 
     def test_check_spatial_range_remote(self):
         """Test remote spatial range check."""
         mock_ssh = Mock()
         result_json = json.dumps({
+            "path": "/remote/file.nc",
             "success": True,
             "lat_range": [-90.0, 90.0],
             "lon_range": [-180.0, 180.0]
@@ -542,6 +945,7 @@ class TestRemoteNetCDFValidator:
         """Test remote spatial range check when data doesn't cover required area."""
         mock_ssh = Mock()
         result_json = json.dumps({
+            "path": "/remote/file.nc",
             "success": True,
             "lat_range": [0.0, 90.0],  # Only northern hemisphere
             "lon_range": [0.0, 180.0]  # Only eastern hemisphere
@@ -558,6 +962,7 @@ class TestRemoteNetCDFValidator:
         """Test remote spatial range check when no lat/lon dimensions found."""
         mock_ssh = Mock()
         result_json = json.dumps({
+            "path": "/remote/file.nc",
             "success": True,
             "variables": ["ET"]
             # No lat_range or lon_range keys
@@ -582,6 +987,7 @@ class TestRemoteNetCDFValidator:
         """Test _run_inspect_script helper method returns dict or None."""
         mock_ssh = Mock()
         result_json = json.dumps({
+            "path": "/remote/file.nc",
             "success": True,
             "variables": ["ET"]
         })
@@ -613,6 +1019,169 @@ class TestRemoteNetCDFValidator:
 
         assert result is None
 
+    def test_inspect_result_shared_between_checks(self):
+        """Test one remote inspection serves all checks on the same path."""
+        mock_ssh = Mock()
+        result_json = json.dumps({
+            "path": "/remote/file.nc",
+            "success": True,
+            "variables": ["ET"],
+            "time_range": [2000, 2020],
+            "lat_range": [-90.0, 90.0],
+            "lon_range": [-180.0, 180.0]
+        })
+        mock_ssh.execute.return_value = (result_json, "", 0)
+
+        validator = RemoteNetCDFValidator(mock_ssh)
+        assert validator.check_variable("/remote/file.nc", "ET").passed is True
+        assert validator.check_time_range("/remote/file.nc", 2005, 2015).passed is True
+        assert validator.check_spatial_range("/remote/file.nc", -45, 45, -90, 90).passed is True
+        assert mock_ssh.execute.call_count == 1
+
+        validator.clear_cache()
+        validator.check_variable("/remote/file.nc", "ET")
+        assert mock_ssh.execute.call_count == 2
+
+    def test_failed_inspection_not_cached(self):
+        """Test a failed SSH inspection is retried on the next check."""
+        mock_ssh = Mock()
+        mock_ssh.execute.return_value = ("", "error", 1)
+
+        validator = RemoteNetCDFValidator(mock_ssh)
+        validator.check_variable("/remote/file.nc", "ET")
+        validator.check_variable("/remote/file.nc", "ET")
+        assert mock_ssh.execute.call_count == 2
+
+    def test_inspect_batch_single_call(self):
+        """Test inspect_batch inspects several paths in one SSH call."""
+        mock_ssh = Mock()
+        stdout = "\n".join([
+            "conda: environment activated",
+            json.dumps({"success": True, "variables": ["ET"], "path": "/r/a.nc"}),
+            json.dumps({"success": False, "error": "bad file", "path": "/r/it's.nc"}),
+        ])
+        mock_ssh.execute.return_value = (stdout, "", 0)
+
+        validator = RemoteNetCDFValidator(mock_ssh)
+        results = validator.inspect_batch(["/r/a.nc", "/r/it's.nc", "/r/a.nc"])
+
+        assert mock_ssh.execute.call_count == 1
+        cmd = mock_ssh.execute.call_args[0][0]
+        assert f"python3 {validator.SCRIPT_PATH} " in cmd
+        assert "'/r/it'\"'\"'s.nc'" in cmd
+        assert mock_ssh.execute.call_args[1]["stdin_data"] == validator.INSPECT_SCRIPT
+        assert results["/r/a.nc"]["variables"] == ["ET"]
+        assert results["/r/it's.nc"]["success"] is False
+
+        # Cached results serve the checks without another round trip
+        assert validator.check_variable("/r/a.nc", "ET").passed is True
+        assert mock_ssh.execute.call_count == 1
+
+    def test_parse_json_accepts_nan(self):
+        """Test result lines from Python's json module (NaN literals) parse."""
+        import math
+        from core.data_validator import _parse_json
+        assert _parse_json('{"lat_range": [-90.0, 90.0]}') == {"lat_range": [-90.0, 90.0]}
+        assert math.isnan(_parse_json('{"lat_range": [NaN, 90.0]}')["lat_range"][0])
+        with pytest.raises(ValueError):
+            _parse_json("{not json")
+
+    def test_script_uploaded_once(self):
+        """Test the script is sent with the first call and reused afterwards."""
+        mock_ssh = Mock()
+        mock_ssh.execute.return_value = (json.dumps({"success": True, "variables": []}), "", 0)
+
+        validator = RemoteNetCDFValidator(mock_ssh)
+        validator.inspect_batch(["/r/a.nc"])
+        validator.inspect_batch(["/r/b.nc"])
+
+        first, second = mock_ssh.execute.call_args_list
+        assert f"cat > {validator.SCRIPT_PATH}" in first[0][0]
+        assert first[1]["stdin_data"] == validator.INSPECT_SCRIPT
+        assert second[0][0] == f"python3 {validator.SCRIPT_PATH} /r/b.nc"
+        assert second[1]["stdin_data"] is None
+
+    def test_missing_script_uploaded_again(self):
+        """Test a removed remote script is re-sent and the batch retried."""
+        mock_ssh = Mock()
+        ok_a = (json.dumps({"success": True, "variables": [], "path": "/r/a.nc"}), "", 0)
+        ok_b = (json.dumps({"success": True, "variables": [], "path": "/r/b.nc"}), "", 0)
+        missing = ("", "python3: can't open file '/home/u/.openbench_wizard/inspect.py'", 2)
+        mock_ssh.execute.side_effect = [ok_a, missing, ok_b]
+
+        validator = RemoteNetCDFValidator(mock_ssh)
+        validator.inspect_batch(["/r/a.nc"])
+        results = validator.inspect_batch(["/r/b.nc"])
+
+        assert results["/r/b.nc"]["success"] is True
+        assert mock_ssh.execute.call_args[1]["stdin_data"] == validator.INSPECT_SCRIPT
+
+    def test_batch_results_matched_by_path(self):
+        """Test shell noise starting with "{" cannot shift batch results."""
+        mock_ssh = Mock()
+        stdout = "\n".join([
+            "{stray output from a login script",
+            json.dumps({"success": True, "variables": ["b"], "path": "/r/b.nc"}),
+            json.dumps({"success": True, "variables": ["x"], "path": "/r/other.nc"}),
+            json.dumps({"success": True, "variables": ["a"], "path": "/r/a.nc"}),
+        ])
+        mock_ssh.execute.return_value = (stdout, "", 0)
+
+        validator = RemoteNetCDFValidator(mock_ssh)
+        results = validator.inspect_batch(["/r/a.nc", "/r/b.nc", "/r/c.nc"])
+
+        assert results["/r/a.nc"]["variables"] == ["a"]
+        assert results["/r/b.nc"]["variables"] == ["b"]
+        assert set(results) == {"/r/a.nc", "/r/b.nc"}
+        assert validator.inspect("/r/c.nc")["success"] is False
+
+    def test_null_bounds_reported_unknown(self):
+        """Test NaN bounds serialized as null fail the spatial check cleanly."""
+        mock_ssh = Mock()
+        result_json = json.dumps({
+            "path": "/remote/file.nc",
+            "success": True,
+            "lat_range": [None, None],
+            "lon_range": [-180.0, 180.0]
+        })
+        mock_ssh.execute.return_value = (result_json, "", 0)
+
+        validator = RemoteNetCDFValidator(mock_ssh)
+        check = validator.check_spatial_range("/remote/file.nc", -45, 45, -90, 90)
+
+        assert check.passed is False
+        assert "unknown" in check.message
+
+    def test_shell_quoting(self):
+        """Test paths and settings are quoted before reaching the remote shell."""
+        mock_ssh = Mock()
+        mock_ssh.execute.return_value = ("", "", 0)
+
+        validator = RemoteNetCDFValidator(
+            mock_ssh, python_path="~/envs/my env/bin/python", conda_env="x; rm -rf ~"
+        )
+        validator.check_file_exists("/r/it's $HOME.nc")
+        assert mock_ssh.execute.call_args[0][0] == "test -f '/r/it'\"'\"'s $HOME.nc'"
+
+        validator.inspect_batch(["/r/a.nc"])
+        cmd = mock_ssh.execute.call_args[0][0]
+        assert "conda activate 'x; rm -rf ~'" in cmd
+        assert f"~/'envs/my env/bin/python' {validator.SCRIPT_PATH} /r/a.nc" in cmd
+
+    def test_remote_glob_quoted(self):
+        """Test the remote find command keeps the pattern away from the shell."""
+        mock_ssh = Mock()
+        mock_ssh.execute.return_value = ("/d d/a_2000.nc\n", "", 0)
+
+        gen = FilePathGenerator(
+            root_dir="/d d", sub_dir="", prefix="a_", suffix="",
+            data_groupby="Year", syear=2000, eyear=2000,
+            is_remote=True, ssh_manager=mock_ssh,
+        )
+        assert gen._remote_glob("/d d", "a_*.nc") == ["/d d/a_2000.nc"]
+        cmd = mock_ssh.execute.call_args[0][0]
+        assert cmd.startswith("find '/d d' -maxdepth 1 -name 'a_*.nc' -type f")
+
 
 from core.data_validator import DataValidator
 
@@ -933,8 +1502,8 @@ class TestDataValidator:
 
         # Should have progress calls for each source plus final call
         assert len(progress_calls) >= 2
-        # First call should be (0, 2, var_name, source_name)
-        assert progress_calls[0][0] == 0
+        # First call should be (1, 2, var_name, source_name)
+        assert progress_calls[0][0] == 1
         assert progress_calls[0][1] == 2
         # Final call should indicate completion (total, total, "", "")
         assert progress_calls[-1][0] == progress_calls[-1][1]
@@ -960,3 +1529,308 @@ class TestDataValidator:
         assert report.total_count == 1
         # SSH execute should have been called for file existence check
         assert mock_ssh.execute.called
+
+    def test_validate_all_preserves_source_order(self):
+        """Test validate_all returns results in config order when run concurrently."""
+        validator = DataValidator(is_remote=False)
+
+        sources = {
+            f"Var{i}": {
+                f"Source{i}": {
+                    "general": {"root_dir": f"/data{i}", "data_groupby": "Single", "data_type": "grid"},
+                    "prefix": f"file{i}", "suffix": "", "varname": "E"
+                }
+            }
+            for i in range(20)
+        }
+
+        report = validator.validate_all(sources, {"syear": 2000, "eyear": 2020})
+
+        assert [r.var_name for r in report.results] == [f"Var{i}" for i in range(20)]
+        assert [r.source_name for r in report.results] == [f"Source{i}" for i in range(20)]
+
+    def test_progress_reported_after_source_finishes(self):
+        """Test each progress call names a finished source and counts it."""
+        validator = DataValidator(is_remote=False)
+        sources = {
+            "ET": {
+                f"Source{i}": {
+                    "general": {"root_dir": "/d", "data_groupby": "Single", "data_type": "grid"},
+                    "prefix": f"f{i}", "suffix": ""
+                }
+                for i in range(10)
+            }
+        }
+        finished = []
+        calls = []
+
+        def validate_source(var_name, source_name, source_config, general_config):
+            finished.append(source_name)
+            return SourceValidationResult(var_name, source_name)
+
+        def progress_callback(current, total, var_name, source_name):
+            calls.append((current, source_name))
+            if source_name:
+                assert source_name in finished
+                assert current <= len(finished)
+
+        with patch.object(validator, "validate_source", side_effect=validate_source):
+            validator.validate_all(sources, {}, progress_callback)
+
+        assert [c[0] for c in calls] == list(range(1, 11)) + [10]
+
+    def test_validate_all_callback_can_cancel(self):
+        """Test an exception from the progress callback aborts validate_all."""
+        validator = DataValidator(is_remote=False)
+
+        sources = {
+            "ET": {
+                f"Source{i}": {
+                    "general": {"root_dir": "/d", "data_groupby": "Single", "data_type": "grid"},
+                    "prefix": f"f{i}", "suffix": "", "varname": "E"
+                }
+                for i in range(5)
+            }
+        }
+
+        def progress_callback(current, total, var_name, source_name):
+            raise InterruptedError("Cancelled")
+
+        with pytest.raises(InterruptedError):
+            validator.validate_all(sources, {"syear": 2000, "eyear": 2020}, progress_callback)
+
+    def test_progress_callbacks_coalesced(self):
+        """Test progress is reported once per 1% of sources plus the final call."""
+        validator = DataValidator(is_remote=False)
+        validator.PROGRESS_INTERVAL = float("inf")
+        sources = {
+            "ET": {
+                f"Source{i}": {
+                    "general": {"root_dir": "/d", "data_groupby": "Single", "data_type": "grid"},
+                    "prefix": f"f{i}", "suffix": ""
+                }
+                for i in range(300)
+            }
+        }
+        calls = []
+
+        validator.validate_all(sources, {}, lambda *args: calls.append(args[:2]))
+
+        assert [c[0] for c in calls[:-1]] == list(range(1, 300, 3))
+        assert calls[-1] == (300, 300)
+
+    def test_validate_all_pool_size(self):
+        """Test remote runs use the smaller worker pool."""
+        from concurrent.futures import ThreadPoolExecutor
+        sources = {
+            "ET": {
+                f"Source{i}": {
+                    "general": {"root_dir": "/d", "data_groupby": "Single", "data_type": "grid"},
+                    "prefix": f"f{i}", "suffix": ""
+                }
+                for i in range(50)
+            }
+        }
+        mock_ssh = Mock()
+        mock_ssh.execute.return_value = ("", "", 0)
+
+        for validator, expected in (
+            (DataValidator(is_remote=False), DataValidator.MAX_WORKERS),
+            (DataValidator(is_remote=True, ssh_manager=mock_ssh), DataValidator.REMOTE_MAX_WORKERS),
+        ):
+            with patch("core.data_validator.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as mock_pool:
+                validator.validate_all(sources, {})
+            assert mock_pool.call_args.kwargs["max_workers"] == expected
+
+    def test_validate_all_remote_batches_inspection(self):
+        """Test remote validate_all inspects all sources in one script run."""
+        mock_ssh = Mock()
+
+        def execute(cmd, timeout=None, stdin_data=None):
+            if "for p in" in cmd:
+                return ("0\n1\n", "", 0)
+            return ("\n".join(
+                json.dumps({"success": True, "variables": ["E"], "time_range": [1990, 2030],
+                            "path": f"/remote/data/{name}.nc"})
+                for name in ("GLEAM", "FLUXCOM")
+            ), "", 0)
+
+        mock_ssh.execute.side_effect = execute
+
+        validator = DataValidator(is_remote=True, ssh_manager=mock_ssh)
+        sources = {
+            "ET": {
+                name: {
+                    "general": {"root_dir": "/remote/data", "data_groupby": "Single", "data_type": "grid"},
+                    "prefix": name, "suffix": "", "varname": "E"
+                }
+                for name in ("GLEAM", "FLUXCOM")
+            }
+        }
+
+        report = validator.validate_all(sources, {"syear": 2000, "eyear": 2020})
+
+        assert report.passed_count == 2
+        inspect_calls = [c for c in mock_ssh.execute.call_args_list if "for p in" not in c[0][0]]
+        assert len(inspect_calls) == 1
+
+    def test_validate_source_opens_file_once(self, tmp_path):
+        """Test variable and time checks of a source share one dataset open."""
+        netCDF4 = pytest.importorskip("netCDF4")
+        path = tmp_path / "modis_gpp.nc"
+        with netCDF4.Dataset(str(path), "w") as ds:
+            ds.createDimension("time", 2)
+            time = ds.createVariable("time", "f8", ("time",))
+            time.units = "days since 1999-01-01"
+            time[:] = [0, 9000]
+            ds.createVariable("GPP", "f4", ("time",))
+
+        validator = DataValidator(is_remote=False)
+        source_config = {
+            "general": {"root_dir": str(tmp_path), "data_groupby": "Single", "data_type": "grid"},
+            "prefix": "modis_gpp", "suffix": "", "varname": "GPP"
+        }
+
+        with patch.object(
+            LocalNetCDFValidator, "_open_dataset",
+            autospec=True, side_effect=LocalNetCDFValidator._open_dataset
+        ) as mock_open:
+            result = validator.validate_source("GPP", "MODIS", source_config, {"syear": 2000, "eyear": 2020})
+
+        assert mock_open.call_count == 1
+        assert [c.name for c in result.checks] == ["file_exists", "variable_exists", "time_range"]
+        assert result.is_valid is True
+
+    def test_validate_all_inspects_shared_file_once(self, tmp_path):
+        """Test sources sharing a sample file reuse one inspection."""
+        netCDF4 = pytest.importorskip("netCDF4")
+        with netCDF4.Dataset(str(tmp_path / "era5.nc"), "w") as ds:
+            ds.createDimension("time", 1)
+            ds.createVariable("time", "f8", ("time",))
+            for name in ("t2m", "tp", "sp"):
+                ds.createVariable(name, "f4", ("time",))
+
+        validator = DataValidator(is_remote=False)
+        sources = {
+            var: {"ERA5": {
+                "general": {"root_dir": str(tmp_path), "data_groupby": "Year", "data_type": "grid"},
+                "prefix": "era5", "suffix": "", "varname": var
+            }}
+            for var in ("t2m", "tp", "sp")
+        }
+
+        with patch('glob.glob', return_value=[str(tmp_path / "era5.nc")]), \
+                patch.object(LocalNetCDFValidator, "inspect", autospec=True,
+                             side_effect=LocalNetCDFValidator.inspect) as mock_inspect:
+            report = validator.validate_all(sources, {"syear": 2000, "eyear": 2020})
+
+        assert report.passed_count == 3
+        assert mock_inspect.call_count == 1
+        assert validator._inspect_cache == {}
+
+    def test_validation_cache_persists_inspections(self, tmp_path):
+        """Test an unchanged file is not reopened by a later validator."""
+        netCDF4 = pytest.importorskip("netCDF4")
+        data_path = tmp_path / "gleam.nc"
+        with netCDF4.Dataset(str(data_path), "w") as ds:
+            ds.createDimension("time", 2)
+            time = ds.createVariable("time", "f8", ("time",))
+            time.units = "days since 2000-01-01"
+            time[:] = [0, 7670]
+            ds.createVariable("E", "f4", ("time",))
+
+        cache_path = str(tmp_path / "cache" / "validation.json")
+        sources = {"ET": {"GLEAM": {
+            "general": {"root_dir": str(tmp_path), "data_groupby": "Single", "data_type": "grid"},
+            "prefix": "gleam", "suffix": "", "varname": "E"
+        }}}
+        general = {"syear": 2000, "eyear": 2020}
+
+        with patch.object(LocalNetCDFValidator, "inspect", autospec=True,
+                          side_effect=LocalNetCDFValidator.inspect) as mock_inspect:
+            first = DataValidator(cache_path=cache_path).validate_all(sources, general)
+            second = DataValidator(cache_path=cache_path).validate_all(sources, general)
+            assert mock_inspect.call_count == 1
+            assert [c.message for c in second.results[0].checks] == \
+                [c.message for c in first.results[0].checks]
+            assert second.passed_count == 1
+
+            # A modified file is inspected again
+            os.utime(data_path, ns=(0, 0))
+            DataValidator(cache_path=cache_path).validate_all(sources, general)
+            assert mock_inspect.call_count == 2
+
+    def test_identical_layouts_probed_once(self):
+        """Test sources with the same file layout share the file checks."""
+        validator = DataValidator(is_remote=False)
+        layout = {
+            "general": {"root_dir": "/data", "data_groupby": "Single", "data_type": "grid"},
+            "prefix": "era5", "suffix": ""
+        }
+        sources = {"T2M": {"ERA5": dict(layout)}, "Precip": {"ERA5": dict(layout)}}
+
+        with patch.object(LocalNetCDFValidator, "check_file_exists", autospec=True,
+                          side_effect=LocalNetCDFValidator.check_file_exists) as mock_exists:
+            report = validator.validate_all(sources, {})
+
+        assert mock_exists.call_count == 1
+        assert [(r.var_name, r.source_name) for r in report.results] == [("T2M", "ERA5"), ("Precip", "ERA5")]
+        assert report.results[0].checks == report.results[1].checks
+        assert report.results[0].checks is not report.results[1].checks
+
+
+import core.data_validator as data_validator_module
+
+
+class TestOptionalImports:
+    """Test module-level handling of the optional scientific stack."""
+
+    def test_missing_xarray_reported(self):
+        """Test inspection reports a missing xarray instead of raising."""
+        with patch.object(data_validator_module, "_HAS_XARRAY", False), \
+                patch.object(data_validator_module, "_HAS_NETCDF4", False):
+            info = LocalNetCDFValidator().inspect("/data/file.nc")
+        assert info["success"] is False
+        assert "xarray required" in info["error"]
+
+    def test_warm_up_backends_runs_once(self):
+        """Test backend discovery thread is only started once."""
+        with patch.object(data_validator_module, "_backends_warmed", False), \
+                patch("threading.Thread") as mock_thread:
+            data_validator_module.warm_up_backends()
+            data_validator_module.warm_up_backends()
+        assert mock_thread.call_count == 1
+        mock_thread.return_value.start.assert_called_once()
+
+
+class TestFileProbing:
+    """Test how many sample files DataValidator checks per source."""
+
+    SOURCE = {
+        "general": {"root_dir": "/data", "data_groupby": "Year", "data_type": "grid"},
+        "prefix": "et_", "suffix": ""
+    }
+    SAMPLES = ["/data/et_2000.nc", "/data/et_2010.nc", "/data/et_2020.nc"]
+
+    def setup_method(self):
+        """Drop directory listings cached by earlier tests."""
+        FilePathGenerator.clear_cache()
+
+    def test_stops_at_first_existing_file(self):
+        """Test existence checks stop once a sample file is found."""
+        validator = DataValidator(is_remote=False)
+        with patch('core.data_validator.get_openbench_root', return_value="/ob"), \
+                patch('glob.glob', return_value=self.SAMPLES), \
+                patch('core.data_validator._path_exists', side_effect=[False, True, True]) as mock_exists:
+            result = validator.validate_source("ET", "GLEAM", self.SOURCE, {})
+        assert mock_exists.call_count == 2
+        assert [c.passed for c in result.checks] == [False, True]
+
+    def test_probe_all_checks_every_file(self):
+        """Test probe_all reports every sample file."""
+        validator = DataValidator(is_remote=False, probe_all=True)
+        with patch('core.data_validator.get_openbench_root', return_value="/ob"), \
+                patch('glob.glob', return_value=self.SAMPLES), \
+                patch('core.data_validator._path_exists', side_effect=[False, True, True]):
+            result = validator.validate_source("ET", "GLEAM", self.SOURCE, {})
+        assert [c.passed for c in result.checks] == [False, True, True]
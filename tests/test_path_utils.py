@@ -0,0 +1,325 @@
+# tests/test_path_utils.py
+import os
+import shutil
+from unittest.mock import patch
+
+from core.path_utils import (
+    _convert_linux_to_windows, _convert_windows_to_linux, clear_stat_cache,
+    convert_paths_in_dict, ensure_dir, get_openbench_root, is_cross_platform_path,
+    normalize_path_separators, quote_remote_path, remote_basename, remote_dirname,
+    to_absolute_path, validate_path, validate_paths_in_dict, write_in_dir
+)
+
+
+class TestGetOpenbenchRoot:
+    """Test OpenBench root lookup."""
+
+    def setup_method(self):
+        get_openbench_root.cache_clear()
+
+    def teardown_method(self):
+        get_openbench_root.cache_clear()
+
+    def test_saved_path_used(self, tmp_path):
+        """Test the path saved in ~/.openbench_wizard/config.txt wins."""
+        root = tmp_path / "OpenBench"
+        root.mkdir()
+        (tmp_path / ".openbench_wizard").mkdir()
+        (tmp_path / ".openbench_wizard" / "config.txt").write_text(str(root))
+
+        with patch.dict(os.environ, {"HOME": str(tmp_path)}):
+            assert get_openbench_root() == str(root)
+
+    def test_result_cached_until_cleared(self, tmp_path):
+        """Test the filesystem is searched once until cache_clear()."""
+        with patch.dict(os.environ, {"HOME": str(tmp_path)}), \
+                patch("os.path.exists", return_value=False) as mock_exists:
+            first = get_openbench_root()
+            calls = mock_exists.call_count
+            assert get_openbench_root() == first
+            assert mock_exists.call_count == calls
+
+            get_openbench_root.cache_clear()
+            get_openbench_root()
+            assert mock_exists.call_count == 2 * calls
+
+
+class TestConvertPathsInDict:
+    """Test converting config paths to absolute paths."""
+
+    def test_root_resolved_once(self):
+        """Test the default base directory is looked up once per conversion."""
+        config = {
+            "general": {"basedir": "output", "fulllist": "./list.txt"},
+            "sources": [{"root_dir": "data/a"}, {"root_dir": "data/b"}],
+            "def_nml": {"a": "nml/a.yaml", "b": "nml/b.yaml"},
+            "name": "run",
+        }
+        with patch("core.path_utils.get_openbench_root", return_value="/ob") as mock_root:
+            result = convert_paths_in_dict(config)
+
+        assert mock_root.call_count == 1
+        assert result["general"] == {
+            "basedir": os.path.normpath("/ob/output"),
+            "fulllist": os.path.normpath("/ob/list.txt"),
+        }
+        assert result["sources"][1]["root_dir"] == os.path.normpath("/ob/data/b")
+        assert result["def_nml"]["a"] == os.path.normpath("/ob/nml/a.yaml")
+        assert result["name"] == "run"
+
+    def test_custom_keys(self):
+        """Test caller-supplied key lists are honoured at every level."""
+        config = {"a": {"model_dir": "m", "root_dir": "r"}, "paths": {"x": "p/x"}}
+        result = convert_paths_in_dict(
+            config, base_dir="/ob", path_keys=["model_dir"], all_values_are_paths_keys=["paths"]
+        )
+        assert result == {
+            "a": {"model_dir": os.path.normpath("/ob/m"), "root_dir": "r"},
+            "paths": {"x": os.path.normpath("/ob/p/x")},
+        }
+
+    def test_inplace(self):
+        """Test inplace conversion reuses containers but unshares repeated ones."""
+        shared = {"root_dir": "data/shared"}
+        sources = [shared, {"fulllist": "list.txt"}]
+        config = {"a": shared, "sources": sources, "def_nml": {"x": "nml/x.yaml"}, "name": "run"}
+        expected = convert_paths_in_dict(config, base_dir="/ob")
+
+        result = convert_paths_in_dict(config, base_dir="/ob", inplace=True)
+        assert result is config
+        assert result == expected
+        assert config["sources"] is sources and config["a"] is shared
+        assert sources[0] is not shared
+
+    def test_inplace_expands_yaml_anchors(self):
+        """Test sections shared through a YAML anchor are written out separately."""
+        import yaml
+        text = (
+            "base: &src\n  root_dir: data\n  varname: E\n"
+            "other: *src\n"
+            "defs: &defs\n  x: nml/x.yaml\n"
+            "def_nml: *defs\n"
+        )
+        config = convert_paths_in_dict(yaml.safe_load(text), base_dir="/ob", inplace=True)
+
+        assert config["base"] is not config["other"]
+        assert config["defs"] is not config["def_nml"]
+        assert "&" not in yaml.dump(config) and "*" not in yaml.dump(config)
+        config["other"]["varname"] = "LE"
+        assert config["base"]["varname"] == "E"
+        assert config["base"]["root_dir"] == os.path.normpath("/ob/data")
+
+    def test_deep_nesting(self):
+        """Test nesting deeper than the recursion limit is converted."""
+        config = node = {}
+        for _ in range(3000):
+            node["child"] = {}
+            node = node["child"]
+        node["root_dir"] = "data"
+
+        result = convert_paths_in_dict(config, base_dir="/ob")
+        for _ in range(3000):
+            result = result["child"]
+        assert result == {"root_dir": os.path.normpath("/ob/data")}
+
+
+class TestValidatePath:
+    """Test single path validation."""
+
+    def setup_method(self):
+        clear_stat_cache()
+
+    def test_type_checks(self, tmp_path):
+        """Test existence and file/directory type are reported."""
+        data_file = tmp_path / "list.txt"
+        data_file.write_text("")
+        missing = str(tmp_path / "missing")
+
+        assert validate_path(str(data_file), "file") == (True, "")
+        assert validate_path(str(tmp_path), "directory") == (True, "")
+        assert validate_path(str(tmp_path), "file")[1].startswith("Path is not a file")
+        assert validate_path(str(data_file), "directory")[1].startswith("Path is not a directory")
+        assert validate_path(missing, "file")[1].startswith("Path does not exist")
+        assert validate_path(missing, "file", must_exist=False) == (True, "")
+        assert validate_path("", "file") == (True, "")
+
+    def test_normalize_optional(self, tmp_path):
+        """Test normpath is skipped for paths the caller already normalized."""
+        missing = str(tmp_path) + "/sub//missing.txt"
+        assert validate_path(missing)[1] == f"Path does not exist: {os.path.normpath(missing)}"
+        assert validate_path(missing, normalize=False)[1] == f"Path does not exist: {missing}"
+        with patch("os.path.normpath") as mock_normpath:
+            assert validate_path(str(tmp_path), "directory", normalize=False) == (True, "")
+            errors = validate_paths_in_dict({"root_dir": missing, "def_nml": {"x": missing}})
+        mock_normpath.assert_not_called()
+        assert errors[0][2] == errors[1][2] == f"Path does not exist: {missing}"
+        errors = validate_paths_in_dict({"root_dir": "sub//missing"})
+        assert errors[0][2] == f"Path does not exist: {os.path.normpath('sub//missing')}"
+
+    def test_single_stat(self, tmp_path):
+        """Test an existing path is checked with one stat call."""
+        with patch("os.stat", side_effect=os.stat) as mock_stat:
+            assert validate_path(str(tmp_path), "directory") == (True, "")
+        assert mock_stat.call_count == 1
+
+
+    def test_stat_reused_within_ttl(self, tmp_path):
+        """Test repeated validation reuses the stat until the TTL or a clear."""
+        missing = tmp_path / "later.txt"
+        with patch("os.stat", side_effect=os.stat) as mock_stat:
+            assert validate_path(str(missing))[0] is False
+            missing.write_text("")
+            assert validate_path(str(missing))[0] is False
+            assert mock_stat.call_count == 1
+
+            clear_stat_cache()
+            assert validate_path(str(missing)) == (True, "")
+            with patch("core.path_utils.STAT_CACHE_TTL", 0):
+                assert validate_path(str(missing)) == (True, "")
+            assert mock_stat.call_count == 3
+
+
+class TestValidatePathsInDict:
+    """Test validating config paths."""
+
+    def test_new_files_seen_by_next_pass(self, tmp_path):
+        """Test files created after a pass, directly or via write_in_dir, are found."""
+        made = tmp_path / "made.txt"
+        written = tmp_path / "sub" / "written.txt"
+        config = {"fulllist": str(made), "figure_nml": str(written)}
+        assert len(validate_paths_in_dict(config)) == 2
+
+        made.write_text("")
+        assert validate_path(str(made))[0] is False  # cached within the TTL
+        assert validate_paths_in_dict(config) == [
+            ("figure_nml", str(written), f"Path does not exist: {written}")
+        ]
+
+        assert validate_path(str(written))[0] is False
+        write_in_dir(str(written.parent), lambda: written.write_text(""))
+        assert validate_path(str(written)) == (True, "")
+
+    def test_errors_in_document_order(self, tmp_path):
+        """Test nested errors are reported in the order they appear."""
+        missing = str(tmp_path / "missing")
+        config = {
+            "a": {"root_dir": missing, "b": {"fulllist": missing}},
+            "def_nml": {"x": missing},
+            "basedir": str(tmp_path),
+            "c": {"figure_nml": missing},
+        }
+        errors = validate_paths_in_dict(config)
+        assert [key for key, _, _ in errors] == [
+            "a.root_dir", "a.b.fulllist", "def_nml.x", "c.figure_nml"
+        ]
+
+
+class TestToAbsolutePath:
+    """Test converting single paths to absolute paths."""
+
+    def test_relative_and_absolute(self):
+        """Test relative paths join the base and absolute ones are kept."""
+        assert to_absolute_path("./data/ET", "/ob") == os.path.normpath("/ob/data/ET")
+        assert to_absolute_path("/srv/data", "/ob") == os.path.normpath("/srv/data")
+        assert to_absolute_path("", "/ob") == ""
+
+    def test_native_path_skips_conversion(self):
+        """Test only paths from the other platform go through conversion."""
+        foreign = "/home/u/OpenBench/nml/a.yaml" if os.sep == "\\" else "C:\\OpenBench\\nml\\a.yaml"
+        with patch("core.path_utils.convert_cross_platform_path",
+                   side_effect=lambda path, root: path) as mock_convert:
+            to_absolute_path("nml/native-skip.yaml", "/ob")
+            mock_convert.assert_not_called()
+            to_absolute_path(foreign, "/ob-foreign")
+            mock_convert.assert_called_once()
+        assert is_cross_platform_path(foreign) is True
+        assert is_cross_platform_path("") is False
+
+    def test_results_cached(self):
+        """Test converting the same path again reuses the earlier result."""
+        with patch("core.path_utils.normalize_path_separators",
+                   side_effect=normalize_path_separators) as mock_normalize:
+            first = to_absolute_path("nml/cached.yaml", "/ob-cache")
+            assert to_absolute_path("nml/cached.yaml", "/ob-cache") == first
+        assert mock_normalize.call_count == 1
+
+
+class TestWriteInDir:
+    """Test writing into directories remembered by ensure_dir()."""
+
+    def test_deleted_dir_recreated(self, tmp_path):
+        """Test a directory removed after ensure_dir() is made again on write."""
+        out_dir = str(tmp_path / "a" / "b")
+        out_file = os.path.join(out_dir, "f.txt")
+
+        def write():
+            with open(out_file, "w") as f:
+                f.write("x")
+            return "done"
+
+        ensure_dir(out_dir)
+        shutil.rmtree(tmp_path / "a")
+        assert write_in_dir(out_dir, write) == "done"
+        with open(out_file) as f:
+            assert f.read() == "x"
+
+
+class TestCrossPlatformConversion:
+    """Test rebuilding paths from another platform under the local root."""
+
+    def test_openbench_marker(self):
+        """Test the part after /OpenBench/ is kept, in any letter case."""
+        assert _convert_windows_to_linux("C:\\Users\\u\\OPENBENCH\\nml\\main.yaml", "/srv/ob") \
+            == "/srv/ob/nml/main.yaml"
+        assert _convert_linux_to_windows("/home/u/OpenBench/data/ET", "D:\\ob") == "D:\\ob\\data\\ET"
+
+    def test_marker_priority(self):
+        """Test subdirectory markers are tried in order, not by position."""
+        assert _convert_windows_to_linux("D:\\data\\output\\nml\\nml-yaml\\ref.yaml", "/srv/ob") \
+            == "/srv/ob/nml/nml-yaml/ref.yaml"
+
+    def test_no_marker(self):
+        """Test paths without a marker only get their separators converted."""
+        assert _convert_windows_to_linux("D:\\era5\\t2m.nc", "/srv/ob") == "D:/era5/t2m.nc"
+        assert _convert_linux_to_windows("/home/u/OpenBench/", "D:\\ob") == "\\home\\u\\OpenBench\\"
+
+
+class TestNormalizePathSeparators:
+    """Test separator normalization for the current platform."""
+
+    def test_mixed_separators(self):
+        """Test both separator kinds become os.sep."""
+        expected = os.sep.join(["data", "ET", "gleam.nc"])
+        assert normalize_path_separators("data\\ET/gleam.nc") == expected
+
+    def test_native_path_unchanged(self):
+        """Test a path already using os.sep is returned as is."""
+        path = os.path.join("data", "ET", "gleam.nc")
+        assert normalize_path_separators(path) is path
+        assert normalize_path_separators("") == ""
+
+
+class TestRemotePaths:
+    """Test forward-slash path helpers for remote servers."""
+
+    def test_remote_dirname(self):
+        """Test the parent of a remote path."""
+        assert remote_dirname("/home/u/run/config.yaml") == "/home/u/run"
+        assert remote_dirname("run\\nml\\") == "run"
+        assert remote_dirname("/config.yaml") == "/"
+        assert remote_dirname("config.yaml") == ""
+        assert remote_dirname("") == ""
+
+    def test_remote_basename(self):
+        """Test the last component of a remote path."""
+        assert remote_basename("/home/u/run/config.yaml") == "config.yaml"
+        assert remote_basename("run\\nml\\") == "nml"
+        assert remote_basename("config.yaml") == "config.yaml"
+        assert remote_basename("") == ""
+
+    def test_quote_remote_path(self):
+        """Test remote paths are shell-quoted with "~/" left expandable."""
+        assert quote_remote_path("/data/run 1/x.nc") == "'/data/run 1/x.nc'"
+        assert quote_remote_path("~/OpenBench") == "~/OpenBench"
+        assert quote_remote_path("~/my data") == "~/'my data'"
+        assert quote_remote_path("~user/x") == "'~user/x'"
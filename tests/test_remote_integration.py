@@ -7,6 +7,7 @@ ensuring all components work together correctly.
 """
 
 import os
+import shlex
 import pytest
 import tempfile
 import yaml
@@ -668,6 +669,119 @@ class TestProgressTrackingIntegration:
             )
             assert "Comparison" in stage or progress > 5.0
 
+    def test_upload_related_files_selects_config_files(self):
+        """Test only sibling YAML/JSON files other than the config are uploaded."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = os.path.join(tmpdir, "main.yaml")
+            for name in ("main.yaml", "ref.yml", "sim.json", "notes.txt"):
+                with open(os.path.join(tmpdir, name), 'w') as f:
+                    f.write("x")
+            os.mkdir(os.path.join(tmpdir, "nested.yaml"))
+
+            ssh_manager = MagicMock()
+            ssh_manager.upload_files.side_effect = lambda files: (
+                (local, remote, None) for local, remote in files
+            )
+            runner = RemoteRunner(config_path, ssh_manager, {})
+            runner._remote_temp_dir = "/tmp/run"
+            runner._upload_related_files(tmpdir)
+
+            files = sorted(ssh_manager.upload_files.call_args.args[0])
+            assert files == [
+                (os.path.join(tmpdir, "ref.yml"), "/tmp/run/ref.yml"),
+                (os.path.join(tmpdir, "sim.json"), "/tmp/run/sim.json"),
+            ]
+
+    def test_remote_temp_dirs_are_unique(self):
+        """Test each run creates its own remote directory and fails on a clash."""
+        ssh_manager = MagicMock()
+        ssh_manager.execute.return_value = ("", "", 0)
+        first = RemoteRunner("/local/config.yaml", ssh_manager, {})
+        second = RemoteRunner("/local/config.yaml", ssh_manager, {})
+
+        assert first._create_remote_temp_dir()
+        assert second._create_remote_temp_dir()
+        assert first._remote_temp_dir != second._remote_temp_dir
+        command = ssh_manager.execute.call_args.args[0]
+        assert command == f"mkdir {second._remote_temp_dir}"
+
+        ssh_manager.execute.return_value = ("", "File exists", 1)
+        clashing = RemoteRunner("/local/config.yaml", ssh_manager, {})
+        assert not clashing._create_remote_temp_dir()
+        assert clashing._remote_temp_dir == ""
+
+    def test_output_chunks_emit_one_batch_each(self):
+        """Test each received chunk of output is logged with one signal."""
+        def stream(cmd):
+            yield ["Processing GPP variable...\n", "\n", "Evaluation started for GPP\n"]
+            yield ["\r\n"]
+            yield ["Done running comparison task\n"]
+            return 0
+
+        ssh_manager = MagicMock()
+        ssh_manager.execute_stream_batches.side_effect = stream
+        remote_config = {
+            "python_path": "/usr/bin/python3",
+            "conda_env": "",
+            "openbench_path": "/home/user/OpenBench",
+        }
+        runner = RemoteRunner("/remote/config.yaml", ssh_manager, remote_config,
+                              config_already_remote=True)
+
+        batches = []
+        progress_updates = []
+        runner.log_batch.connect(batches.append)
+        runner.progress_updated.connect(progress_updates.append)
+
+        assert runner._execute_remote_openbench() == (True, "Completed")
+        assert batches == [
+            ["Processing GPP variable...", "Evaluation started for GPP"],
+            ["Done running comparison task"],
+        ]
+        assert len(progress_updates) == 2
+        assert progress_updates[0].message == "Evaluation started for GPP"
+
+    def test_remote_command_quotes_paths(self):
+        """Test configured paths with spaces reach the remote shell quoted."""
+        ssh_manager = MagicMock()
+        ssh_manager.execute_stream_batches.side_effect = lambda cmd: iter(())
+        remote_config = {
+            "python_path": "/opt/my tools/bin/python3",
+            "conda_env": "ob env",
+            "openbench_path": "~/Open Bench",
+        }
+        runner = RemoteRunner("/remote/my config.yaml", ssh_manager, remote_config,
+                              config_already_remote=True)
+        runner._execute_remote_openbench()
+
+        cmd = ssh_manager.execute_stream_batches.call_args.args[0]
+        assert cmd.startswith("bash -l -c ")
+        inner = shlex.split(cmd)[3]
+        assert shlex.split(inner) == [
+            "conda", "activate", "ob env", "&&",
+            "cd", "~/Open Bench", "&&", "PYTHONUNBUFFERED=1",
+            "/opt/my tools/bin/python3", "-u", "~/Open Bench/openbench/openbench.py",
+            "/remote/my config.yaml",
+        ]
+        assert "cd ~/'Open Bench'" in inner
+
+    def test_remote_exit_status_decides_success(self):
+        """Test a non-zero exit of the remote command fails the run."""
+        def stream(cmd):
+            yield ["Traceback (most recent call last):\n"]
+            return 2
+
+        ssh_manager = MagicMock()
+        ssh_manager.execute_stream_batches.side_effect = stream
+        runner = RemoteRunner("/remote/config.yaml", ssh_manager, {},
+                              config_already_remote=True)
+
+        success, message = runner._execute_remote_openbench()
+
+        assert success is False
+        assert "code 2" in message
+        ssh_manager.execute.assert_not_called()
+
 
 class TestConfigurationValidation:
     """Test configuration validation across components."""
@@ -100,6 +100,29 @@ class TestSSHManagerExecution:
         assert stderr == ""
         assert exit_code == 0
 
+    @patch('core.ssh_manager.paramiko.SSHClient')
+    def test_execute_with_stdin_data(self, mock_ssh_class):
+        """Test stdin_data is written to the command and stdin is closed."""
+        mock_client = MagicMock()
+        mock_ssh_class.return_value = mock_client
+
+        mock_stdin = MagicMock()
+        mock_stdout = MagicMock()
+        mock_stderr = MagicMock()
+        mock_stdout.read.return_value = b"ok\n"
+        mock_stderr.read.return_value = b""
+        mock_stdout.channel.recv_exit_status.return_value = 0
+        mock_client.exec_command.return_value = (mock_stdin, mock_stdout, mock_stderr)
+
+        manager = SSHManager()
+        manager.connect("user@host", password="secret")
+        stdout, _, exit_code = manager.execute("python3 -", stdin_data="print('ok')")
+
+        mock_stdin.write.assert_called_once_with("print('ok')")
+        mock_stdin.channel.shutdown_write.assert_called_once()
+        assert stdout == "ok\n"
+        assert exit_code == 0
+
     @patch('select.select')
     @patch('core.ssh_manager.paramiko.SSHClient')
     def test_execute_stream(self, mock_ssh_class, mock_select):
@@ -167,7 +190,41 @@ class TestSSHManagerFileTransfer:
         manager.connect("user@host", password="secret")
         manager.upload_file("/local/file.txt", "/remote/file.txt")
 
-        mock_sftp.put.assert_called_once_with("/local/file.txt", "/remote/file.txt")
+        mock_sftp.put.assert_called_once_with("/local/file.txt", "/remote/file.txt", confirm=True)
+
+    @patch('core.ssh_manager.paramiko.SSHClient')
+    def test_upload_file_checks_directory_once(self, mock_ssh_class):
+        """Test repeated uploads into one directory don't stat it again."""
+        mock_client = MagicMock()
+        mock_sftp = MagicMock()
+        mock_client.open_sftp.return_value = mock_sftp
+        mock_ssh_class.return_value = mock_client
+
+        manager = SSHManager()
+        manager.connect("user@host", password="secret")
+        manager.upload_file("/local/a.yaml", "/tmp/run/a.yaml")
+        manager.upload_file("/local/b.yaml", "/tmp/run/b.yaml")
+
+        assert [c.args[0] for c in mock_sftp.stat.call_args_list] == ["/tmp", "/tmp/run"]
+        assert mock_sftp.put.call_count == 2
+
+    @patch('core.ssh_manager.paramiko.SSHClient')
+    def test_upload_file_recreates_removed_directory(self, mock_ssh_class):
+        """Test an upload into a directory removed since it was seen recreates it."""
+        mock_client = MagicMock()
+        mock_sftp = MagicMock()
+        mock_sftp.put.side_effect = [None, FileNotFoundError(), None]
+        mock_client.open_sftp.return_value = mock_sftp
+        mock_ssh_class.return_value = mock_client
+
+        manager = SSHManager()
+        manager.connect("user@host", password="secret")
+        manager.upload_file("/local/a.yaml", "/tmp/run/a.yaml")
+        mock_sftp.stat.side_effect = [None, FileNotFoundError()]
+        manager.upload_file("/local/b.yaml", "/tmp/run/b.yaml")
+
+        mock_sftp.mkdir.assert_called_once_with("/tmp/run")
+        assert mock_sftp.put.call_count == 3
 
     @patch('core.ssh_manager.os.makedirs')
     @patch('core.ssh_manager.paramiko.SSHClient')
@@ -185,6 +242,71 @@ class TestSSHManagerFileTransfer:
         mock_sftp.get.assert_called_once_with("/remote/file.txt", "/local/file.txt")
         mock_makedirs.assert_called_once_with("/local", exist_ok=True)
 
+    @patch('core.ssh_manager.paramiko.SSHClient')
+    def test_upload_files_uses_a_session_per_worker(self, mock_ssh_class):
+        """Test concurrent uploads each get their own SFTP session."""
+        mock_client = MagicMock()
+        sessions = []
+
+        def open_sftp():
+            sessions.append(MagicMock())
+            return sessions[-1]
+
+        mock_client.open_sftp.side_effect = open_sftp
+        mock_ssh_class.return_value = mock_client
+
+        manager = SSHManager()
+        manager.connect("user@host", password="secret")
+        files = [(f"/local/{i}.yaml", f"/remote/{i}.yaml") for i in range(8)]
+        results = list(manager.upload_files(files, max_workers=16, confirm=False))
+
+        assert sorted((local, remote) for local, remote, _ in results) == sorted(files)
+        assert all(error is None for _, _, error in results)
+        # The main session creates the directory, workers do the transfers
+        puts = [c.args for sftp in sessions[1:] for c in sftp.put.call_args_list]
+        assert sorted(puts) == sorted(files)
+        assert all(c.kwargs == {"confirm": False}
+                   for sftp in sessions[1:] for c in sftp.put.call_args_list)
+        assert 1 < len(sessions) <= 1 + SSHManager.MAX_UPLOAD_WORKERS
+        assert all(sftp.close.called for sftp in sessions[1:])
+
+    @patch('core.ssh_manager.paramiko.SSHClient')
+    def test_upload_files_reports_failures(self, mock_ssh_class):
+        """Test a failed upload is reported without stopping the others."""
+        def put(local, remote, confirm):
+            if local == "/local/bad":
+                raise IOError("denied")
+
+        mock_client = MagicMock()
+        mock_sftp = MagicMock()
+        mock_sftp.put.side_effect = put
+        mock_client.open_sftp.return_value = mock_sftp
+        mock_ssh_class.return_value = mock_client
+
+        manager = SSHManager()
+        manager.connect("user@host", password="secret")
+        files = [("/local/good", "/remote/good"), ("/local/bad", "/remote/bad")]
+        errors = {local: error for local, _, error in manager.upload_files(files)}
+
+        assert errors["/local/good"] is None
+        assert isinstance(errors["/local/bad"], IOError)
+
+    @patch('core.ssh_manager.paramiko.SSHClient')
+    def test_upload_files_single_file_is_serial(self, mock_ssh_class):
+        """Test a single file goes through the shared SFTP session."""
+        mock_client = MagicMock()
+        mock_sftp = MagicMock()
+        mock_client.open_sftp.return_value = mock_sftp
+        mock_ssh_class.return_value = mock_client
+
+        manager = SSHManager()
+        manager.connect("user@host", password="secret")
+        results = list(manager.upload_files([("/local/a.yaml", "/remote/a.yaml")]))
+
+        assert results == [("/local/a.yaml", "/remote/a.yaml", None)]
+        mock_client.open_sftp.assert_called_once()
+        mock_sftp.put.assert_called_once_with("/local/a.yaml", "/remote/a.yaml", confirm=True)
+
 
 class TestSSHManagerEnvironment:
     """Test environment detection."""
@@ -0,0 +1,73 @@
+# tests/test_validation_cache.py
+import json
+
+import numpy as np
+
+from core.validation_cache import ValidationCache
+
+
+def test_put_get_roundtrip(tmp_path):
+    """Test a saved entry is returned by a new cache for the same stamp."""
+    data_file = tmp_path / "et.nc"
+    data_file.write_bytes(b"data")
+    cache_path = str(tmp_path / "cache.json")
+
+    cache = ValidationCache(cache_path)
+    stamp = cache.stamp(str(data_file))
+    info = {"success": True, "variables": ["ET"], "time_range": [np.int64(2000), np.int64(2020)]}
+    cache.put(str(data_file), stamp, info)
+    cache.save()
+
+    reloaded = ValidationCache(cache_path)
+    assert reloaded.get(str(data_file), stamp) == {
+        "success": True, "variables": ["ET"], "time_range": [2000, 2020]
+    }
+
+
+def test_changed_file_is_stale(tmp_path):
+    """Test an entry is ignored once the file's size or mtime changes."""
+    data_file = tmp_path / "et.nc"
+    data_file.write_bytes(b"data")
+    cache = ValidationCache(str(tmp_path / "cache.json"))
+    cache.put(str(data_file), cache.stamp(str(data_file)), {"success": True})
+
+    data_file.write_bytes(b"more data")
+    assert cache.get(str(data_file), cache.stamp(str(data_file))) is None
+
+
+def test_missing_file_not_cached(tmp_path):
+    """Test files that cannot be stat'ed are neither stored nor found."""
+    missing = str(tmp_path / "missing.nc")
+    cache = ValidationCache(str(tmp_path / "cache.json"))
+    stamp = cache.stamp(missing)
+    assert stamp is None
+    cache.put(missing, stamp, {"success": True})
+    assert cache.get(missing, stamp) is None
+
+
+def test_invalid_or_outdated_file_ignored(tmp_path):
+    """Test a corrupt or old-version cache file loads as empty."""
+    cache_path = tmp_path / "cache.json"
+    cache_path.write_text("{not json")
+    assert ValidationCache(str(cache_path))._entries == {}
+
+    cache_path.write_text(json.dumps({"version": 0, "entries": {"/a.nc": {}}}))
+    assert ValidationCache(str(cache_path))._entries == {}
+
+
+def test_save_only_when_changed(tmp_path):
+    """Test save() does not create a file for an unchanged cache."""
+    cache_path = tmp_path / "sub" / "cache.json"
+    ValidationCache(str(cache_path)).save()
+    assert not cache_path.exists()
+
+
+def test_oldest_entries_dropped(tmp_path, monkeypatch):
+    """Test the cache keeps at most MAX_ENTRIES files."""
+    monkeypatch.setattr(ValidationCache, "MAX_ENTRIES", 2)
+    cache = ValidationCache(str(tmp_path / "cache.json"))
+    for name in ("a.nc", "b.nc", "c.nc"):
+        cache.put(str(tmp_path / name), (1, 1), {"success": True})
+
+    assert cache.get(str(tmp_path / "a.nc"), (1, 1)) is None
+    assert cache.get(str(tmp_path / "c.nc"), (1, 1)) == {"success": True}
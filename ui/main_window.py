@@ -616,7 +616,7 @@ class MainWindow(QMainWindow):
                         with open(ref_full_path, 'r', encoding='utf-8') as f:
                             ref_config = yaml.safe_load(f) or {}
                         # Convert all paths in ref_config to absolute
-                        ref_config = convert_paths_in_dict(ref_config, project_root)
+                        ref_config = convert_paths_in_dict(ref_config, project_root, inplace=True)
                         new_config["ref_data"] = ref_config
                     except Exception as e:
                         print(f"Warning: Failed to load reference NML: {e}")
@@ -637,7 +637,7 @@ class MainWindow(QMainWindow):
                         with open(sim_full_path, 'r', encoding='utf-8') as f:
                             sim_config = yaml.safe_load(f) or {}
                         # Convert all paths in sim_config to absolute
-                        sim_config = convert_paths_in_dict(sim_config, project_root)
+                        sim_config = convert_paths_in_dict(sim_config, project_root, inplace=True)
                         new_config["sim_data"] = sim_config
                     except Exception as e:
                         print(f"Warning: Failed to load simulation NML: {e}")
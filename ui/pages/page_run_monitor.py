@@ -18,6 +18,7 @@ from ui.pages.base_page import BasePage
 from ui.widgets import ProgressDashboard, TaskStatus
 from core.runner import EvaluationRunner, RunnerStatus
 from core.remote_runner import RemoteRunner
+from core.path_utils import get_openbench_root
 
 logger = logging.getLogger(__name__)
 
@@ -158,6 +159,8 @@ class PageRunMonitor(BasePage):
         # Connect signals - same interface for both runners
         self._runner.progress_updated.connect(self._on_progress)
         self._runner.log_message.connect(self._on_log)
+        if isinstance(self._runner, RemoteRunner):
+            self._runner.log_batch.connect(self._on_log_batch)
         self._runner.finished_signal.connect(self._on_finished)
         self._runner.start()
 
@@ -275,6 +278,10 @@ class PageRunMonitor(BasePage):
         """Handle log message."""
         self.dashboard.append_log(message)
 
+    def _on_log_batch(self, messages: list):
+        """Handle a batch of log messages."""
+        self.dashboard.append_logs(messages)
+
     def _on_finished(self, success: bool, message: str):
         """Handle run completion."""
         self.dashboard.stop_monitoring()
@@ -335,6 +342,7 @@ class PageRunMonitor(BasePage):
             config_file = os.path.join(config_dir, "config.txt")
             with open(config_file, 'w', encoding='utf-8') as f:
                 f.write(path)
+            get_openbench_root.cache_clear()
         except Exception as e:
             print(f"Warning: Could not save OpenBench path: {e}")
 
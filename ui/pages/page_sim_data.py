@@ -635,6 +635,7 @@ class PageSimData(BasePage):
     def _validate_data(self):
         """Validate all configured data sources."""
         from core.data_validator import DataValidator
+        from core.validation_cache import ValidationCache
         from ui.widgets.validation_dialog import (
             ValidationProgressDialog, ValidationResultsDialog
         )
@@ -676,7 +677,8 @@ class PageSimData(BasePage):
             ssh_manager=ssh_manager,
             remote_openbench_root=remote_openbench_root,
             python_path=python_path,
-            conda_env=conda_env
+            conda_env=conda_env,
+            cache_path=ValidationCache.DEFAULT_PATH
         )
 
         # Show progress dialog
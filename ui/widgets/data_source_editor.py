@@ -20,7 +20,7 @@ from PySide6.QtCore import Qt
 
 from ui.widgets.path_selector import PathSelector
 from ui.widgets.remote_config import RemoteFileBrowser
-from core.path_utils import to_absolute_path, validate_path, get_openbench_root
+from core.path_utils import clear_stat_cache, to_absolute_path, validate_path, get_openbench_root
 from core.validation import ValidationError
 
 logger = logging.getLogger(__name__)
@@ -1166,6 +1166,7 @@ class DataSourceEditor(QDialog):
 
         # Path validation (skip in remote mode)
         if not self._is_remote_mode():
+            clear_stat_cache()
             if root_dir:
                 root_dir = to_absolute_path(root_dir, get_openbench_root())
                 is_valid, error_msg = validate_path(root_dir, "directory")
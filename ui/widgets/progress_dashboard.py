@@ -183,6 +183,14 @@ class ProgressDashboard(QWidget):
         timestamp = datetime.now().strftime("%H:%M:%S")
         self.log_output.appendPlainText(f"[{timestamp}] {message}")
 
+    def append_logs(self, messages: list):
+        """Append several messages to log output at once."""
+        from datetime import datetime
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self.log_output.appendPlainText(
+            "\n".join(f"[{timestamp}] {message}" for message in messages)
+        )
+
     def _update_overall_progress(self):
         """Update overall progress based on task statuses."""
         if not self._tasks:
@@ -129,7 +129,7 @@ class ValidationProgressDialog(QDialog):
             self.progress_label.setText(f"{current}/{total}")
 
         if var_name and source_name:
-            self.current_label.setText(f"Current: {var_name} / {source_name}")
+            self.current_label.setText(f"Finished: {var_name} / {source_name}")
 
     def _on_finished(self, report: DataValidationReport):
         """Handle validation finished."""